@@ -1,79 +1,1318 @@
 #!/usr/bin/env python3
+import argparse
+import array
+import ast
+import asyncio
+import base64
+import bisect
+import csv
+import functools
+import hashlib
+import hmac
+import http.client
 import json
+import math
 import os
-from typing import Any, Dict
+import pickle
+import random
+import re
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
 
+import aiohttp
 from dotenv import load_dotenv
-from gql import Client, gql
+from gql import Client, GraphQLRequest, gql
 from gql.transport.aiohttp import AIOHTTPTransport
+from gql.transport.exceptions import TransportError
 from typing_extensions import Final
 
+try:
+    import numpy as np
+    import numpy.typing as npt
 
-def main() -> None:
-    # Change to the directory where the script is located,
-    # so that the script can be run from any location.
-    os.chdir(os.path.dirname(os.path.realpath(__file__)))
+    HAS_NUMPY = True
+except ImportError:
+    # NumPy is optional, as it's only required by `--engine numpy`.
+    HAS_NUMPY = False
 
-    load_dotenv()
+# Path to a statistic in the `statistics` dictionary, such as `("cpu", "intel", "skylake")`.
+StatisticPath = Tuple[str, ...]
 
-    transport: Final = AIOHTTPTransport(
-        url="https://api.github.com/graphql",
-        headers={"Authorization": f"Bearer {os.getenv('GODOT_ISSUES_STATS_GITHUB_TOKEN')}"},
-        ssl=True,
+
+class Os(NamedTuple):
+    # Substrings searched for in the trimmed system information (any of them may match).
+    patterns: Tuple[str, ...]
+    # Key of the operating system version (or web browser) within its platform.
+    key: str
+
+    def statistic_paths(self, prefix: StatisticPath) -> Tuple[StatisticPath, ...]:
+        return (prefix + (self.key,),)
+
+    def numeric_attributes(self) -> Tuple[Tuple[StatisticPath, int], ...]:
+        return ()
+
+
+class Cpu(NamedTuple):
+    patterns: Tuple[str, ...]
+    microarchitecture: str
+    # Unset for entries that only detect the CPU vendor.
+    core_count: Optional[int] = None
+    x86_features: Optional[str] = None
+    passmark_multi_thread: Optional[int] = None
+    passmark_single_thread: Optional[int] = None
+
+    def statistic_paths(self, prefix: StatisticPath) -> Tuple[StatisticPath, ...]:
+        paths: List[StatisticPath] = [prefix + (self.microarchitecture,)]
+        if self.x86_features is not None:
+            paths.append(("cpu_x86_features", self.x86_features))
+        return tuple(paths)
+
+    def numeric_attributes(self) -> Tuple[Tuple[StatisticPath, int], ...]:
+        return tuple(
+            (path, value)
+            for path, value in (
+                (("cpu_core_count",), self.core_count),
+                (("cpu_passmark_score", "multi_thread"), self.passmark_multi_thread),
+                (("cpu_passmark_score", "single_thread"), self.passmark_single_thread),
+            )
+            if value is not None
+        )
+
+
+class Gpu(NamedTuple):
+    patterns: Tuple[str, ...]
+    # Prefixed with `dedicated_` or `integrated_`, which also determines
+    # where feature support is counted.
+    architecture: str
+    # Unset for entries that only detect the GPU vendor, or integrated GPUs (which have no dedicated VRAM).
+    vram_gb: Optional[int] = None
+    raytracing: Optional[bool] = None
+    vrs: Optional[bool] = None
+    mesh_shaders: Optional[bool] = None
+    passmark_score: Optional[int] = None
+
+    def statistic_paths(self, prefix: StatisticPath) -> Tuple[StatisticPath, ...]:
+        paths: List[StatisticPath] = [prefix + (self.architecture,)]
+        gpu_type = self.architecture.split("_")[0]
+        for statistic, supported in (
+            ("gpu_raytracing", self.raytracing),
+            ("gpu_vrs", self.vrs),
+            ("gpu_mesh_shaders", self.mesh_shaders),
+        ):
+            if supported is not None:
+                paths.append((statistic, gpu_type, "yes" if supported else "no"))
+        return tuple(paths)
+
+    def numeric_attributes(self) -> Tuple[Tuple[StatisticPath, int], ...]:
+        return tuple(
+            (path, value)
+            for path, value in ((("gpu_vram",), self.vram_gb), (("gpu_passmark_score",), self.passmark_score))
+            if value is not None
+        )
+
+
+class NumericBins(NamedTuple):
+    # Lower bound of each bin in ascending order. Values below the first bound are counted in the first bin.
+    bounds: Tuple[int, ...]
+    # Suffix of the key of each bin, which is named after its lower bound (such as "8_gb").
+    # Without a suffix, bins are named after their range of values (such as "5,000-10,000").
+    suffix: Optional[str] = None
+    # Whether the values in the detection tables are measured, rather than the middle of a range of values.
+    # Percentiles are only published for measured values, as they would otherwise repeat the middles of the ranges.
+    measured: bool = True
+
+    def keys(self) -> List[str]:
+        # Returns the key of each bin, in the same order as `bounds`.
+        if self.suffix is not None:
+            return [f"{bound}{self.suffix}" for bound in self.bounds]
+        middle = self.bounds[1:]
+        return (
+            [f"<{middle[0]:,}"]
+            + [f"{low:,}-{high:,}" for low, high in zip(middle, middle[1:])]
+            + [f">{self.bounds[-1]:,}"]
+        )
+
+    def key(self, value: int) -> str:
+        return self.keys()[max(bisect.bisect_right(self.bounds, value) - 1, 0)]
+
+    def bin_values(self, values: "npt.NDArray[np.int64]") -> "npt.NDArray[np.int64]":
+        # Vectorized equivalent of `key()`, returning the index of the bin of each value.
+        return np.maximum(np.searchsorted(self.bounds, values, side="right") - 1, 0)
+
+
+# Statistics counting users by a numeric attribute of their hardware. Only the values are stored
+# in the detection tables, so bins can be changed here without editing any table entry.
+NUMERIC_STATISTICS: Final = {
+    # Number of physical CPU cores.
+    # On CPUs with hybrid topologies (such as 12th generation Intel and newer),
+    # this is the sum of P-cores and E-cores.
+    ("cpu_core_count",): NumericBins((2, 4, 6, 8, 10, 12, 14, 16, 20, 24, 32, 64), "_cores"),
+    # Scores from <https://www.cpubenchmark.net/>.
+    # Most scores in the detection tables are the middle of their bin. Set `measured` once they've all been
+    # replaced by measured scores with `build.py import`.
+    ("cpu_passmark_score", "multi_thread"): NumericBins(
+        (0, 5_000, 10_000, 20_000, 30_000, 40_000, 50_000, 60_000, 70_000), measured=False
+    ),
+    ("cpu_passmark_score", "single_thread"): NumericBins(
+        (0, 1_500, 2_000, 2_500, 3_000, 3_500, 4_000, 4_500), measured=False
+    ),
+    # Only dedicated GPUs increment this statistic.
+    ("gpu_vram",): NumericBins((1, 2, 3, 4, 6, 8, 10, 11, 12, 16, 20, 24, 32), "_gb"),
+    # Scores from <https://www.videocardbenchmark.net/>, which are also the middle of their bin.
+    ("gpu_passmark_score",): NumericBins((0, 2_500, 5_000, 10_000, 15_000, 20_000, 25_000, 30_000), measured=False),
+}
+
+
+def numeric_statistic(path: StatisticPath) -> Dict[str, Set[str]]:
+    # Returns the sets of users of each bin of a numeric statistic, from the highest bin to the lowest.
+    return {key: set() for key in reversed(NUMERIC_STATISTICS[path].keys())}
+
+
+# Detection tables. Each table behaves like an `if`/`elif` chain on the trimmed system information:
+# the first entry with any of its patterns found wins, and every statistic it describes is incremented.
+# This means order matters, as more specific patterns must come first (e.g. "windows8.1" before "windows8").
+# GPU tables count every GPU mentioned instead (such as both GPUs of a laptop), see `DetectionBlock.multiple`.
+#
+# CPU columns: patterns, microarchitecture, physical core count, x86 features,
+# multi-thread and single-thread PassMark scores.
+# GPU columns: patterns, architecture, VRAM in GB, raytracing, variable-rate shading,
+# mesh shaders, PassMark score.
+#
+# Numeric columns (core count, VRAM and PassMark scores) are counted in the bins of `NUMERIC_STATISTICS`.
+# PassMark scores were originally entered as score ranges, so most of them are the middle of their range
+# (or its lower bound for the highest range).
+
+WINDOWS_VERSIONS: Final = (
+    Os(("windows11",), "windows_11"),
+    Os(("windows10",), "windows_10"),
+    Os(("windows8.1",), "windows_8.1"),
+    Os(("windows8",), "windows_8"),
+    Os(("windows7",), "windows_7"),
+    Os(("windows",), "unknown"),
+)
+
+LINUX_DISTRIBUTIONS: Final = (
+    Os(("ubuntu",), "ubuntu"),
+    Os(("fedora",), "fedora"),
+    Os(("debian",), "debian"),
+    Os(("mint",), "mint"),
+    Os(("arch", "archlinux", "manjaro", "endeavor", "endeavour"), "arch"),
+    Os(("linux",), "unknown"),
+)
+
+MACOS_VERSIONS: Final = (
+    Os(("macos26", "macostahoe"), "macos_26"),
+    Os(("macos15", "macossequoia"), "macos_15"),
+    Os(("macos14", "macossonoma"), "macos_14"),
+    Os(("macos13", "macosventura"), "macos_13"),
+    Os(("macos12", "macosmonterey"), "macos_12"),
+    Os(("macos11", "macosbigsur"), "macos_11"),
+    Os(("macos10.15", "macoscatalina"), "macos_10.15"),
+    Os(("macos10.14", "macosmojave"), "macos_10.14"),
+    Os(("macos",), "unknown"),
+)
+
+ANDROID_VERSIONS: Final = (
+    Os(("android16",), "android_16"),
+    Os(("android15",), "android_15"),
+    Os(("android14",), "android_14"),
+    Os(("android13",), "android_13"),
+    Os(("android12",), "android_12"),
+    Os(("android11",), "android_11"),
+    Os(("android10",), "android_10"),
+    Os(("android9",), "android_9"),
+    Os(("android8",), "android_8"),
+    Os(("android7",), "android_7"),
+    Os(("android",), "unknown"),
+)
+
+IOS_VERSIONS: Final = (
+    Os(("ios26",), "ios_26"),
+    Os(("ios18",), "ios_18"),
+    Os(("ios17",), "ios_17"),
+    Os(("ios16",), "ios_16"),
+    Os(("ios15",), "ios_15"),
+    Os(("ios14",), "ios_14"),
+    Os(("ios13",), "ios_13"),
+    Os(("ios12",), "ios_12"),
+    Os(("ios",), "unknown"),
+)
+
+WEB_BROWSERS: Final = (
+    Os(("firefox",), "firefox"),
+    Os(("chrome",), "chrome"),
+    Os(("opera", "operagx"), "opera"),
+    Os(("edge",), "edge"),
+    Os(("safari",), "safari"),
+    Os(("web", "webgl"), "unknown"),
+)
+
+# TODO: Add more laptop and Celeron/Pentium Intel CPUs. U-series laptop CPUs mostly use Ice Lake or Tiger Lake,
+# which aren't counted yet.
+# The Intel CPU detection considers -KS and -KF CPUs identical to -K,
+# and -F identical to not having any suffix.
+# (The -S suffix denotes a slightly higher CPU clock,
+# while the -F suffix denotes a non-functional IGP.)
+INTEL_CPUS: Final = (
+    # Laptop CPUs come first, as their model number is also the model number of a desktop CPU.
+    # HX CPUs come before H CPUs, as "h" would also match "hx".
+    Cpu(("i713700hx", "core13700hx", "intel13700hx"), "raptor_lake", 16, "avx2", 35_000, 3_750),
+    Cpu(("i712700hx", "core12700hx", "intel12700hx"), "alder_lake", 16, "avx2", 35_000, 3_750),
+    Cpu(("i713700h", "core13700h", "intel13700h"), "raptor_lake", 14, "avx2", 25_000, 3_750),
+    Cpu(("i712700h", "core12700h", "intel12700h"), "alder_lake", 14, "avx2", 25_000, 3_750),
+    Cpu(("i512500h", "core12500h", "intel12500h"), "alder_lake", 12, "avx2", 25_000, 3_250),
+    Cpu(("i710750h", "core10750h", "intel10750h"), "comet_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i79750h", "core9750h", "intel9750h"), "coffee_lake_refresh", 6, "avx2", 15_000, 2_750),
+    Cpu(("ultra9285k", "ultra285k", "intel285k"), "arrow_lake", 24, "avx2", 65_000, 4_500),
+    Cpu(("ultra9285", "ultra285", "intel285"), "arrow_lake", 24, "avx2", 55_000, 4_500),
+    Cpu(("ultra7265k", "ultra265k", "intel265k"), "arrow_lake", 24, "avx2", 55_000, 4_500),
+    Cpu(("ultra7265", "ultra265", "intel265"), "arrow_lake", 24, "avx2", 45_000, 4_500),
+    Cpu(("ultra5245k", "ultra245k", "intel245k"), "arrow_lake", 24, "avx2", 45_000, 4_500),
+    Cpu(("ultra5245", "ultra245", "intel245"), "arrow_lake", 24, "avx2", 35_000, 4_250),
+    Cpu(("ultra5235", "ultra235", "intel235"), "arrow_lake", 24, "avx2", 35_000, 4_250),
+    Cpu(("ultra5225", "ultra225", "intel225"), "arrow_lake", 24, "avx2", 35_000, 4_250),
+    Cpu(("i914900k", "core14900k", "intel14900k"), "raptor_lake_refresh", 24, "avx2", 65_000, 4_500),
+    Cpu(("i914900", "core14900", "intel14900"), "raptor_lake_refresh", 24, "avx2", 45_000, 4_250),
+    Cpu(("i714700k", "core14700k", "intel14700k"), "raptor_lake_refresh", 20, "avx2", 55_000, 4_250),
+    Cpu(("i714700", "core14700", "intel14700"), "raptor_lake_refresh", 20, "avx2", 35_000, 4_250),
+    Cpu(("i514600k", "core14600k", "intel14600k"), "raptor_lake_refresh", 14, "avx2", 35_000, 4_250),
+    Cpu(("i514600", "core14600", "intel14600"), "raptor_lake_refresh", 14, "avx2", 35_000, 4_250),
+    Cpu(("i514500", "core14500", "intel14500"), "raptor_lake_refresh", 14, "avx2", 35_000, 3_750),
+    Cpu(("i514400", "core14400", "intel14400"), "raptor_lake_refresh", 10, "avx2", 25_000, 3_750),
+    Cpu(("i314100", "core14100", "intel14100"), "raptor_lake_refresh", 4, "avx2", 15_000, 3_750),
+    Cpu(("i913900k", "core13900k", "intel13900k"), "raptor_lake", 24, "avx2", 65_000, 4_500),
+    Cpu(("i913900", "core13900", "intel13900"), "raptor_lake", 24, "avx2", 45_000, 4_250),
+    Cpu(("i713700k", "core13700k", "intel13700k"), "raptor_lake", 16, "avx2", 45_000, 4_250),
+    Cpu(("i713700", "core13700", "intel13700"), "raptor_lake", 16, "avx2", 35_000, 4_250),
+    Cpu(("i513600k", "core13600k", "intel13600k"), "raptor_lake", 14, "avx2", 35_000, 4_250),
+    Cpu(("i513600", "core13600", "intel13600"), "raptor_lake", 14, "avx2", 35_000, 4_250),
+    Cpu(("i513500", "core13500", "intel13500"), "raptor_lake", 14, "avx2", 35_000, 3_750),
+    Cpu(("i513400", "core13400", "intel13400"), "raptor_lake", 10, "avx2", 25_000, 3_750),
+    Cpu(("i313100", "core13100", "intel13100"), "raptor_lake", 4, "avx2", 15_000, 3_750),
+    Cpu(("i912900k", "core12900k", "intel12900k"), "alder_lake", 16, "avx2", 45_000, 4_250),
+    Cpu(("i912900", "core12900", "intel12900"), "alder_lake", 16, "avx2", 35_000, 4_250),
+    Cpu(("i712700k", "core12700k", "intel12700k"), "alder_lake", 12, "avx2", 35_000, 4_250),
+    Cpu(("i712700", "core12700", "intel12700"), "alder_lake", 12, "avx2", 35_000, 3_750),
+    Cpu(("i512600k", "core12600k", "intel12600k"), "alder_lake", 10, "avx2", 25_000, 3_750),
+    Cpu(("i512600", "core12600", "intel12600"), "alder_lake", 6, "avx2", 25_000, 3_750),
+    Cpu(("i512500", "core12500", "intel12500"), "alder_lake", 6, "avx2", 15_000, 3_750),
+    Cpu(("i512400", "core12400", "intel12400"), "alder_lake", 6, "avx2", 15_000, 3_750),
+    Cpu(("i312300", "core12300", "intel12300"), "alder_lake", 4, "avx2", 15_000, 3_750),
+    Cpu(("i312100", "core12100", "intel12100"), "alder_lake", 4, "avx2", 15_000, 3_250),
+    Cpu(("i911900k", "core11900k", "intel11900k"), "rocket_lake", 8, "avx512", 25_000, 3_750),
+    Cpu(("i911900", "core11900", "intel11900"), "rocket_lake", 8, "avx512", 25_000, 3_250),
+    Cpu(("i711700k", "core11700k", "intel11700k"), "rocket_lake", 8, "avx512", 25_000, 3_250),
+    Cpu(("i711700", "core11700", "intel11700"), "rocket_lake", 8, "avx512", 15_000, 3_250),
+    Cpu(("i511600k", "core11600k", "intel11600k"), "rocket_lake", 6, "avx512", 15_000, 3_250),
+    Cpu(("i511600", "core11600", "intel11600"), "rocket_lake", 6, "avx512", 15_000, 3_250),
+    Cpu(("i511500", "core11500", "intel11500"), "rocket_lake", 6, "avx512", 15_000, 3_250),
+    Cpu(("i511400", "core11400", "intel11400"), "rocket_lake", 6, "avx512", 15_000, 3_250),
+    Cpu(("i910900k", "core10900k", "intel10900k"), "comet_lake", 10, "avx2", 25_000, 3_250),
+    Cpu(("i910900", "core10900", "intel10900"), "comet_lake", 10, "avx2", 25_000, 3_250),
+    Cpu(("i710700k", "core10700k", "intel10700k"), "comet_lake", 8, "avx2", 15_000, 2_750),
+    Cpu(("i710700", "core10700", "intel10700"), "comet_lake", 8, "avx2", 15_000, 2_750),
+    Cpu(("i510600k", "core10600k", "intel10600k"), "comet_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i510600", "core10600", "intel10600"), "comet_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i510500", "core10500", "intel10500"), "comet_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i510400", "core10400", "intel10400"), "comet_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i310300", "core10300", "intel10300"), "comet_lake", 4, "avx2", 7_500, 2_750),
+    Cpu(("i310100", "core10100", "intel10100"), "comet_lake", 4, "avx2", 7_500, 2_750),
+    Cpu(("i99900k", "core9900k", "intel9900k"), "coffee_lake_refresh", 8, "avx2", 15_000, 2_750),
+    Cpu(("i99900", "core9900", "intel9900"), "coffee_lake_refresh", 8, "avx2", 15_000, 2_750),
+    Cpu(("i79700k", "core9700k", "intel9700k"), "coffee_lake_refresh", 8, "avx2", 15_000, 2_750),
+    Cpu(("i79700", "core9700", "intel9700"), "coffee_lake_refresh", 8, "avx2", 15_000, 2_750),
+    Cpu(("i59600k", "core9600k", "intel9600k"), "coffee_lake_refresh", 6, "avx2", 15_000, 2_750),
+    Cpu(("i59600", "core9600", "intel9600"), "coffee_lake_refresh", 6, "avx2", 15_000, 2_750),
+    Cpu(("i59500", "core9500", "intel9500"), "coffee_lake_refresh", 6, "avx2", 7_500, 2_750),
+    Cpu(("i59400", "core9400", "intel9400"), "coffee_lake_refresh", 6, "avx2", 7_500, 2_250),
+    Cpu(("i39350k", "core9350k", "intel9350k"), "coffee_lake_refresh", 4, "avx2", 7_500, 2_250),
+    Cpu(("i39300", "core9300", "intel9300"), "coffee_lake_refresh", 4, "avx2", 7_500, 2_250),
+    Cpu(("i39100", "core9100", "intel9100"), "coffee_lake_refresh", 4, "avx2", 7_500, 2_250),
+    Cpu(("i78700k", "core8700k", "intel8700k"), "coffee_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i78700", "core8700", "intel8700"), "coffee_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i78086k", "core8086k", "intel8086k"), "coffee_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i58600k", "core8600k", "intel8600k"), "coffee_lake", 6, "avx2", 15_000, 2_750),
+    Cpu(("i58500", "core8500", "intel8500"), "coffee_lake", 6, "avx2", 7_500, 2_250),
+    Cpu(("i58400", "core8400", "intel8400"), "coffee_lake", 6, "avx2", 7_500, 2_250),
+    Cpu(("i38350k", "core8350k", "intel8350k"), "coffee_lake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i38100", "core8100", "intel8100"), "coffee_lake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i77700k", "core7700k", "intel7700k"), "skylake", 4, "avx2", 7_500, 2_750),
+    Cpu(("i77700", "core7700", "intel7700"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i57600k", "core7600k", "intel7600k"), "skylake", 4, "avx2", 7_500, 2_750),
+    Cpu(("i57600", "core7600", "intel7600"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i57500", "core7500", "intel7500"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i57400", "core7400", "intel7400"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i37350k", "core7350k", "intel7350k"), "skylake", 2, "avx2", 2_500, 2_750),
+    Cpu(("i37300", "core7300", "intel7300"), "skylake", 2, "avx2", 2_500, 2_250),
+    Cpu(("i37100", "core7100", "intel7100"), "skylake", 2, "avx2", 2_500, 2_250),
+    Cpu(("i76700k", "core6700k", "intel6700k"), "skylake", 4, "avx2", 7_500, 2_750),
+    Cpu(("i76700", "core6700", "intel6700"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i56600k", "core6600k", "intel6600k"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i56600", "core6600", "intel6600"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i56500", "core6500", "intel6500"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i56400", "core6400", "intel6400"), "skylake", 4, "avx2", 7_500, 2_250),
+    Cpu(("i36300", "core6300", "intel6300"), "skylake", 2, "avx2", 2_500, 2_250),
+    Cpu(("i36100", "core6100", "intel6100"), "skylake", 2, "avx2", 2_500, 2_250),
+    Cpu(("i74790k", "core4790k", "intel4790k"), "haswell", 4, "avx2", 7_500, 2_250),
+    Cpu(("i74790", "core4790", "intel4790"), "haswell", 4, "avx2", 7_500, 2_250),
+    Cpu(("i74770k", "core4770k", "intel4770k"), "haswell", 4, "avx2", 7_500, 2_250),
+    Cpu(("i74770", "core4770", "intel4770"), "haswell", 4, "avx2", 7_500, 2_250),
+    Cpu(("i54670k", "core4670k", "intel4670k"), "haswell", 4, "avx2", 7_500, 2_250),
+    Cpu(("i54670", "core4670", "intel4670"), "haswell", 4, "avx2", 7_500, 2_250),
+    Cpu(("i54590", "core4590", "intel4590"), "haswell", 4, "avx2", 7_500, 2_250),
+    Cpu(("i54570", "core4570", "intel4570"), "haswell", 4, "avx2", 7_500, 2_250),
+    Cpu(("i54460", "core4460", "intel4460"), "haswell", 4, "avx2", 2_500, 1_750),
+    Cpu(("i54440", "core4440", "intel4440"), "haswell", 4, "avx2", 2_500, 1_750),
+    Cpu(("i54430", "core4430", "intel4430"), "haswell", 4, "avx2", 2_500, 1_750),
+    Cpu(("i34370", "core4370", "intel4370"), "haswell", 2, "avx2", 2_500, 2_250),
+    Cpu(("i34360", "core4360", "intel4360"), "haswell", 2, "avx2", 2_500, 2_250),
+    Cpu(("i34350", "core4350", "intel4350"), "haswell", 2, "avx2", 2_500, 1_750),
+    Cpu(("i34340", "core4340", "intel4340"), "haswell", 2, "avx2", 2_500, 1_750),
+    Cpu(("i34330", "core4330", "intel4330"), "haswell", 2, "avx2", 2_500, 1_750),
+    Cpu(("i34170", "core4170", "intel4170"), "haswell", 2, "avx2", 2_500, 1_750),
+    Cpu(("i34160", "core4160", "intel4160"), "haswell", 2, "avx2", 2_500, 1_750),
+    Cpu(("i34150", "core4150", "intel4150"), "haswell", 2, "avx2", 2_500, 1_750),
+    Cpu(("i34130", "core4130", "intel4130"), "haswell", 2, "avx2", 2_500, 1_750),
+    Cpu(("i73770k", "core3770k", "intel3770k"), "ivy_bridge", 4, "avx", 7_500, 2_250),
+    Cpu(("i73770", "core3770", "intel3770"), "ivy_bridge", 4, "avx", 7_500, 2_250),
+    Cpu(("i53570k", "core3570k", "intel3570k"), "ivy_bridge", 4, "avx", 2_500, 2_250),
+    Cpu(("i53570", "core3570", "intel3570"), "ivy_bridge", 4, "avx", 2_500, 2_250),
+    Cpu(("i53550", "core3550", "intel3550"), "ivy_bridge", 4, "avx", 2_500, 1_750),
+    Cpu(("i53470", "core3470", "intel3470"), "ivy_bridge", 4, "avx", 2_500, 1_750),
+    Cpu(("i53450", "core3450", "intel3450"), "ivy_bridge", 4, "avx", 2_500, 1_750),
+    Cpu(("i53340", "core3340", "intel3340"), "ivy_bridge", 4, "avx", 2_500, 1_750),
+    Cpu(("i53330", "core3330", "intel3330"), "ivy_bridge", 4, "avx", 2_500, 1_750),
+    Cpu(("i33250", "core3250", "intel3250"), "ivy_bridge", 2, "avx", 2_500, 1_750),
+    Cpu(("i33240", "core3240", "intel3240"), "ivy_bridge", 2, "avx", 2_500, 1_750),
+    Cpu(("i33220", "core3220", "intel3220"), "ivy_bridge", 2, "avx", 2_500, 1_750),
+    Cpu(("i33210", "core3210", "intel3210"), "ivy_bridge", 2, "avx", 2_500, 1_750),
+    Cpu(("i72700k", "core2700k", "intel2700k"), "sandy_bridge", 4, "avx", 7_500, 1_750),
+    Cpu(("i72600k", "core2600k", "intel2600k"), "sandy_bridge", 4, "avx", 7_500, 1_750),
+    Cpu(("i72600", "core2600", "intel2600"), "sandy_bridge", 4, "avx", 7_500, 1_750),
+    Cpu(("i52500k", "core2500k", "intel2500k"), "sandy_bridge", 4, "avx", 2_500, 1_750),
+    Cpu(("i52500", "core2500", "intel2500"), "sandy_bridge", 4, "avx", 2_500, 1_750),
+    Cpu(("i52400", "core2400", "intel2400"), "sandy_bridge", 4, "avx", 2_500, 1_750),
+    Cpu(("i52300", "core2300", "intel2300"), "sandy_bridge", 4, "avx", 2_500, 750),
+    Cpu(("i32130", "core2130", "intel2130"), "sandy_bridge", 2, "avx", 2_500, 1_750),
+    Cpu(("i32120", "core2120", "intel2120"), "sandy_bridge", 2, "avx", 2_500, 1_750),
+    Cpu(("i32100", "core2100", "intel2100"), "sandy_bridge", 2, "avx", 2_500, 750),
+    Cpu(("pentiumgoldg5400", "pentiumg5400"), "coffee_lake", 2, "sse4.2", 2_500, 2_250),
+    Cpu(("pentiumg4560",), "kaby_lake", 2, "sse4.2", 2_500, 1_750),
+    Cpu(("intelcore", "inteli", "celeron", "pentium", "xeon"), "unknown"),
+)
+
+# TODO: Add more laptop AMD CPUs, Athlons and Threadrippers.
+# NOTE: Unlike Intel CPUs, detection does not allow "amd<number>" as this syntax is used for GPUs instead.
+#       There would be some ambiguities otherwise, such as Ryzen 5 7600 versus Radeon RX 7600.
+AMD_CPUS: Final = (
+    Cpu(("threadripper3990x",), "zen_2", 64, "avx2", 70_000, 2_750),
+    Cpu(("threadripper3970x",), "zen_2", 32, "avx2", 65_000, 2_750),
+    Cpu(("threadripper3960x",), "zen_2", 24, "avx2", 55_000, 2_750),
+    Cpu(("threadripper2990wx",), "zen+", 32, "avx2", 35_000, 2_250),
+    Cpu(("threadripper2950x",), "zen+", 16, "avx2", 35_000, 2_250),
+    # Laptop CPUs come first, as their model number is also the model number of a desktop CPU.
+    Cpu(("ryzen77840hs", "ryzen7840hs"), "zen_4", 8, "avx512", 25_000, 3_750),
+    Cpu(("ryzen76800h", "ryzen6800h"), "zen_3", 8, "avx2", 25_000, 3_250),
+    Cpu(("ryzen75800h", "ryzen5800h"), "zen_3", 8, "avx2", 25_000, 3_250),
+    Cpu(("ryzen55600h", "ryzen5600h"), "zen_3", 6, "avx2", 15_000, 3_250),
+    Cpu(("ryzen55500u", "ryzen5500u"), "zen_2", 6, "avx2", 15_000, 2_750),
+    Cpu(("ryzen74800h", "ryzen4800h"), "zen_2", 8, "avx2", 15_000, 2_750),
+    Cpu(("ryzen54600h", "ryzen4600h"), "zen_2", 6, "avx2", 15_000, 2_750),
+    Cpu(("ryzen99950x3d", "ryzen9950x3d"), "zen_5", 16, "avx512", 70_000, 4_500),
+    Cpu(("ryzen99950x", "ryzen9950x"), "zen_5", 16, "avx512", 65_000, 4_500),
+    Cpu(("ryzen99900x3d", "ryzen9900x3d"), "zen_5", 12, "avx512", 55_000, 4_500),
+    Cpu(("ryzen99900x", "ryzen9900x"), "zen_5", 12, "avx512", 55_000, 4_500),
+    Cpu(("ryzen79800x3d", "ryzen9800x3d"), "zen_5", 8, "avx512", 45_000, 3_750),
+    Cpu(("ryzen79700x", "ryzen9700x"), "zen_5", 8, "avx512", 35_000, 4_500),
+    Cpu(("ryzen59600x", "ryzen9600x"), "zen_5", 6, "avx512", 25_000, 4_250),
+    Cpu(("ryzen59600", "ryzen9600"), "zen_5", 6, "avx512", 25_000, 4_250),
+    Cpu(("ryzen97950x3d", "ryzen7950x3d"), "zen_4", 16, "avx512", 65_000, 4_250),
+    Cpu(("ryzen97950x", "ryzen7950x"), "zen_4", 16, "avx512", 65_000, 4_250),
+    Cpu(("ryzen97900x3d", "ryzen7900x3d"), "zen_4", 12, "avx512", 55_000, 4_250),
+    Cpu(("ryzen97900x", "ryzen7900x"), "zen_4", 12, "avx512", 55_000, 4_250),
+    Cpu(("ryzen97900", "ryzen7900"), "zen_4", 12, "avx512", 45_000, 4_250),
+    Cpu(("ryzen77800x3d", "ryzen7800x3d"), "zen_4", 8, "avx512", 35_000, 3_750),
+    Cpu(("ryzen77700x", "ryzen7700x"), "zen_4", 8, "avx512", 35_000, 4_250),
+    Cpu(("ryzen77700", "ryzen7700"), "zen_4", 8, "avx512", 35_000, 4_250),
+    Cpu(("ryzen57600x", "ryzen7600x"), "zen_4", 6, "avx512", 25_000, 4_250),
+    Cpu(("ryzen57600", "ryzen7600"), "zen_4", 6, "avx512", 25_000, 4_250),
+    Cpu(("ryzen95950x", "ryzen5950x"), "zen_3", 16, "avx2", 45_000, 3_250),
+    Cpu(("ryzen95900x", "ryzen5900x"), "zen_3", 12, "avx2", 35_000, 3_250),
+    Cpu(("ryzen95900", "ryzen5900"), "zen_3", 12, "avx2", 35_000, 3_250),
+    Cpu(("ryzen75800x3d", "ryzen5800x3d"), "zen_3", 8, "avx2", 25_000, 3_250),
+    Cpu(("ryzen75800x", "ryzen5800x"), "zen_3", 8, "avx2", 25_000, 3_250),
+    Cpu(("ryzen75800", "ryzen5800"), "zen_3", 8, "avx2", 25_000, 3_250),
+    Cpu(("ryzen75700x", "ryzen5700x"), "zen_3", 8, "avx2", 25_000, 3_250),
+    Cpu(("ryzen75700g", "ryzen5700g"), "zen_3", 8, "avx2", 25_000, 3_250),
+    Cpu(("ryzen75700", "ryzen5700"), "zen_3", 8, "avx2", 25_000, 3_250),
+    Cpu(("ryzen55600x", "ryzen5600x"), "zen_3", 6, "avx2", 25_000, 3_250),
+    Cpu(("ryzen55600g", "ryzen5600g"), "zen_3", 6, "avx2", 15_000, 3_250),
+    Cpu(("ryzen55600", "ryzen5600"), "zen_3", 6, "avx2", 25_000, 3_250),
+    Cpu(("ryzen55500", "ryzen5500"), "zen_2", 6, "avx2", 15_000, 3_250),
+    Cpu(("ryzen93950x", "ryzen3950x"), "zen_2", 16, "avx2", 35_000, 2_750),
+    Cpu(("ryzen93900x", "ryzen3900x"), "zen_2", 12, "avx2", 35_000, 2_750),
+    Cpu(("ryzen93900", "ryzen3900"), "zen_2", 12, "avx2", 35_000, 2_750),
+    Cpu(("ryzen73800x", "ryzen3800x"), "zen_2", 8, "avx2", 25_000, 2_750),
+    Cpu(("ryzen73700x", "ryzen3700x"), "zen_2", 8, "avx2", 25_000, 2_750),
+    Cpu(("ryzen53600x", "ryzen3600x"), "zen_2", 6, "avx2", 15_000, 2_750),
+    Cpu(("ryzen53600", "ryzen3600"), "zen_2", 6, "avx2", 15_000, 2_750),
+    Cpu(("ryzen33300x", "ryzen3300x"), "zen_2", 4, "avx2", 15_000, 2_750),
+    Cpu(("ryzen72700x", "ryzen2700x"), "zen+", 8, "avx2", 15_000, 2_250),
+    Cpu(("ryzen72700", "ryzen2700"), "zen+", 8, "avx2", 15_000, 2_250),
+    Cpu(("ryzen52600x", "ryzen2600x"), "zen+", 6, "avx2", 15_000, 2_250),
+    Cpu(("ryzen52600", "ryzen2600"), "zen+", 6, "avx2", 15_000, 2_250),
+    Cpu(("ryzen52500x", "ryzen2500x"), "zen+", 4, "avx2", 7_500, 2_250),
+    Cpu(("ryzen52400g", "ryzen2400g"), "zen+", 4, "avx2", 7_500, 2_250),
+    Cpu(("ryzen32300x", "ryzen2300x"), "zen+", 4, "avx2", 7_500, 2_250),
+    Cpu(("ryzen32200g", "ryzen2200g"), "zen+", 4, "avx2", 7_500, 2_250),
+    Cpu(("ryzen71800x", "ryzen1800x"), "zen+", 8, "avx2", 15_000, 2_250),
+    Cpu(("ryzen71700x", "ryzen1700x"), "zen+", 8, "avx2", 15_000, 2_250),
+    Cpu(("ryzen71700", "ryzen1700"), "zen+", 8, "avx2", 15_000, 2_250),
+    Cpu(("ryzen51600x", "ryzen1600x"), "zen+", 6, "avx2", 15_000, 2_250),
+    Cpu(("ryzen51600", "ryzen1600"), "zen+", 6, "avx2", 15_000, 2_250),
+    Cpu(("ryzen51500x", "ryzen1500x"), "zen+", 4, "avx2", 7_500, 2_250),
+    Cpu(("ryzen51400", "ryzen1400"), "zen+", 4, "avx2", 7_500, 1_750),
+    Cpu(("ryzen31300x", "ryzen1300x"), "zen+", 4, "avx2", 7_500, 2_250),
+    Cpu(("ryzen31200", "ryzen1200"), "zen+", 4, "avx2", 7_500, 1_750),
+    Cpu(("athlon3000g",), "zen_1", 2, "avx2", 2_500, 2_250),
+    Cpu(("athlon200ge",), "zen_1", 2, "avx2", 2_500, 1_750),
+    Cpu(("ryzen", "fx", "athlon", "phenom", "threadripper", "epyc"), "unknown"),
+)
+
+# RTX models only scan for "tx" to allow for misspellings (e.g. "GTX 2070").
+# NOTE: In this scanning, laptop GPUs are only separated from desktop GPUs since Ampere.
+#       This may not be reliable in all cases if the user has removed the "Mobile"
+#       or "Laptop" suffix from the model name.
+NVIDIA_GPUS: Final = (
+    Gpu(("tx5090", "geforce5090", "nvidia5090"), "dedicated_blackwell", 32, True, True, True, 30_000),
+    Gpu(("5090laptop", "5090mobile"), "dedicated_blackwell", 24, True, True, True, 30_000),
+    Gpu(("tx5080", "geforce5080", "nvidia5080"), "dedicated_blackwell", 16, True, True, True, 30_000),
+    Gpu(("5080laptop", "5080mobile"), "dedicated_blackwell", 16, True, True, True, 27_500),
+    Gpu(("tx5070ti", "geforce5070ti", "nvidia5070ti"), "dedicated_blackwell", 16, True, True, True, 30_000),
+    Gpu(("5070tilaptop", "5070timobile"), "dedicated_blackwell", 12, True, True, True, 22_500),
+    Gpu(("tx5070", "geforce5070", "nvidia5070"), "dedicated_blackwell", 12, True, True, True, 27_500),
+    Gpu(("5070laptop", "5070mobile"), "dedicated_blackwell", 8, True, True, True, 22_500),
+    # Assume 8 GB variant, which is much more widespread than the 16 GB one.
+    Gpu(("tx5060ti", "geforce5060ti", "nvidia5060ti"), "dedicated_blackwell", 8, True, True, True, 22_500),
+    Gpu(("tx5060", "geforce5060", "nvidia5060"), "dedicated_blackwell", 8, True, True, True, 17_500),
+    Gpu(("5060laptop", "5060mobile"), "dedicated_blackwell", 8, True, True, True, 17_500),
+    Gpu(("tx4090", "geforce4090", "nvidia4090"), "dedicated_ada_lovelace", 24, True, True, True, 30_000),
+    Gpu(("4090laptop", "4090mobile"), "dedicated_ada_lovelace", 16, True, True, True, 27_500),
+    Gpu(("tx4080", "geforce4080", "nvidia4080"), "dedicated_ada_lovelace", 16, True, True, True, 30_000),
+    Gpu(("4080laptop", "4080mobile"), "dedicated_ada_lovelace", 12, True, True, True, 27_500),
+    Gpu(("tx4070ti", "geforce4070ti", "nvidia4070ti"), "dedicated_ada_lovelace", 12, True, True, True, 30_000),
+    Gpu(("tx4070", "geforce4070", "nvidia4070"), "dedicated_ada_lovelace", 12, True, True, True, 27_500),
+    Gpu(("4070laptop", "4070mobile"), "dedicated_ada_lovelace", 8, True, True, True, 17_500),
+    # Assume 8 GB variant, which is much more widespread than the 16 GB one.
+    Gpu(("tx4060ti", "geforce4060ti", "nvidia4060ti"), "dedicated_ada_lovelace", 8, True, True, True, 22_500),
+    Gpu(("tx4060", "geforce4060", "nvidia4060"), "dedicated_ada_lovelace", 8, True, True, True, 17_500),
+    Gpu(("4060laptop", "4060mobile"), "dedicated_ada_lovelace", 8, True, True, True, 17_500),
+    Gpu(("4050laptop", "4050mobile"), "dedicated_ada_lovelace", 6, True, True, True, 17_500),
+    Gpu(("tx3090ti", "geforce3090ti", "nvidia3090ti"), "dedicated_ampere", 24, True, True, True, 27_500),
+    Gpu(("tx3090", "geforce3090", "nvidia3090"), "dedicated_ampere", 24, True, True, True, 27_500),
+    Gpu(("tx3080ti", "geforce3080ti", "nvidia3080ti"), "dedicated_ampere", 10, True, True, True, 27_500),
+    Gpu(("3080tilaptop", "3080timobile"), "dedicated_ampere", 16, True, True, True, 22_500),
+    # Assume 8 GB variant, which is much more widespread than the 16 GB one.
+    Gpu(("tx3080", "geforce3080", "nvidia3080"), "dedicated_ampere", 8, True, True, True, 27_500),
+    Gpu(("3080laptop", "3080mobile"), "dedicated_ampere", 6, True, True, True, 17_500),
+    Gpu(("tx3070ti", "geforce3070ti", "nvidia3070ti"), "dedicated_ampere", 8, True, True, True, 22_500),
+    Gpu(("3070tilaptop", "3070timobile"), "dedicated_ampere", 8, True, True, True, 17_500),
+    Gpu(("tx3070", "geforce3070", "nvidia3070"), "dedicated_ampere", 8, True, True, True, 22_500),
+    Gpu(("3070laptop", "3070mobile"), "dedicated_ampere", 8, True, True, True, 17_500),
+    Gpu(("tx3060ti", "geforce3060ti", "nvidia3060ti"), "dedicated_ampere", 8, True, True, True, 22_500),
+    # Assume 12 GB variant, which is much more widespread than the 8 GB one.
+    Gpu(("tx3060", "geforce3060", "nvidia3060"), "dedicated_ampere", 12, True, True, True, 17_500),
+    Gpu(("3060laptop", "3060mobile"), "dedicated_ampere", 6, True, True, True, 12_500),
+    Gpu(("3050tilaptop", "3050timobile"), "dedicated_ampere", 6, True, True, True, 12_500),
+    Gpu(("tx3050", "geforce3050", "nvidia3050"), "dedicated_ampere", 8, True, True, True, 12_500),
+    # Assume 4 GB variant, which is much more widespread than the 6 GB one.
+    Gpu(("3050laptop", "3050mobile"), "dedicated_ampere", 4, True, True, True, 7_500),
+    Gpu(("tx2080ti", "geforce2080ti", "nvidia2080ti"), "dedicated_turing", 11, True, True, True, 22_500),
+    Gpu(
+        ("tx2080super", "geforce2080super", "nvidia2080super"),
+        "dedicated_turing",
+        11,
+        True,
+        True,
+        True,
+        17_500,
+    ),
+    Gpu(("tx2080", "geforce2080", "nvidia2080"), "dedicated_turing", 8, True, True, True, 17_500),
+    Gpu(("tx2070super", "geforce2070super", "nvidia2070super"), "dedicated_turing", 8, True, True, True, 17_500),
+    Gpu(("tx2070", "geforce2070", "nvidia2070"), "dedicated_turing", 8, True, True, True, 17_500),
+    Gpu(("tx2060super", "geforce2060super", "nvidia2060super"), "dedicated_turing", 8, True, True, True, 17_500),
+    # Assume 6 GB variant, which is much more widespread than the 12 GB one.
+    # 6 GB variant is slower than the 12 GB one;
+    # the 12 GB one is in the 15,000-20,000 performance bracket.
+    Gpu(("tx2060", "geforce2060", "nvidia2060"), "dedicated_turing", 6, True, True, True, 12_500),
+    Gpu(("gtx1660ti", "geforce1660ti", "nvidia1660ti"), "dedicated_turing", 6, False, True, True, 12_500),
+    Gpu(
+        ("gtx1660super", "geforce1660super", "nvidia1660super"),
+        "dedicated_turing",
+        6,
+        False,
+        True,
+        True,
+        12_500,
+    ),
+    Gpu(("gtx1660", "geforce1660", "nvidia1660"), "dedicated_turing", 6, False, True, True, 12_500),
+    Gpu(
+        ("gtx1650super", "geforce1650super", "nvidia1650super"),
+        "dedicated_turing",
+        4,
+        False,
+        True,
+        True,
+        12_500,
+    ),
+    Gpu(("gtx1650", "geforce1650", "nvidia1650"), "dedicated_turing", 4, False, True, True, 7_500),
+    Gpu(("gtx1630", "geforce1630", "nvidia1630"), "dedicated_turing", 4, False, True, True, 3_750),
+    Gpu(("gtx1080ti", "geforce1080ti", "nvidia1080ti"), "dedicated_pascal", 12, False, False, False, 17_500),
+    Gpu(("gtx1080", "geforce1080", "nvidia1080"), "dedicated_pascal", 8, False, False, False, 17_500),
+    Gpu(("gtx1070ti", "geforce1070ti", "nvidia1070ti"), "dedicated_pascal", 8, False, False, False, 12_500),
+    Gpu(("gtx1070", "geforce1070", "nvidia1070"), "dedicated_pascal", 8, False, False, False, 12_500),
+    # Assume 6 GB variant, which is much more widespread than the 3 GB one.
+    # This also applies to the Passmark score, as its 6 GB variant is faster
+    # than the 3 GB thanks to additional CUDA cores.
+    Gpu(("gtx1060", "geforce1060", "nvidia1060"), "dedicated_pascal", 6, False, False, False, 12_500),
+    Gpu(("gtx1050ti", "geforce1050ti", "nvidia1050ti"), "dedicated_pascal", 4, False, False, False, 7_500),
+    Gpu(("gtx1050", "geforce1050", "nvidia1050"), "dedicated_pascal", 4, False, False, False, 7_500),
+    Gpu(("gtx980ti", "geforce980ti", "nvidia980ti"), "dedicated_maxwell", 4, False, False, False, 12_500),
+    Gpu(("gtx980", "geforce980", "nvidia980"), "dedicated_maxwell", 4, False, False, False, 12_500),
+    # Count as a GPU with 3 GB of VRAM, since only 3.5 GB of VRAM
+    # (out of 4 GB physically present) are full-speed on a GeForce GTX 970.
+    Gpu(("gtx970", "geforce970", "nvidia970"), "dedicated_maxwell", 3, False, False, False, 7_500),
+    Gpu(("gtx960", "geforce960", "nvidia960"), "dedicated_maxwell", 2, False, False, False, 7_500),
+    Gpu(("gtx950", "geforce950", "nvidia950"), "dedicated_maxwell", 2, False, False, False, 7_500),
+    Gpu(("gtx750ti", "geforce750ti", "nvidia750ti"), "dedicated_maxwell", 2, False, False, False, 3_750),
+    Gpu(("gtx750", "geforce750", "nvidia750"), "dedicated_maxwell", 1, False, False, False, 3_750),
+    # Dual-GPU card; since Godot doesn't support multi-GPU,
+    # only account for the VRAM and performance of a single GPU.
+    Gpu(("gtx690", "geforce690", "nvidia690"), "dedicated_kepler", 2, False, False, False, 7_500),
+    Gpu(("gtx680", "geforce680", "nvidia680"), "dedicated_kepler", 2, False, False, False, 7_500),
+    Gpu(("gtx670", "geforce670", "nvidia670"), "dedicated_kepler", 2, False, False, False, 7_500),
+    Gpu(("gtx660ti", "geforce660ti", "nvidia660ti"), "dedicated_kepler", 2, False, False, False, 3_750),
+    Gpu(("gtx660", "geforce660", "nvidia660"), "dedicated_kepler", 2, False, False, False, 3_750),
+    Gpu(("gtx650ti", "geforce650ti", "nvidia650ti"), "dedicated_kepler", 1, False, False, False, 3_750),
+    Gpu(("gtx650", "geforce650", "nvidia650"), "dedicated_kepler", 1, False, False, False, 1_250),
+    # Dual-GPU card; since Godot doesn't support multi-GPU,
+    # only account for the VRAM and performance of a single GPU.
+    # 1.5 GB of VRAM per GPU; round down to 1 GB.
+    Gpu(("gtx590", "geforce590", "nvidia590"), "dedicated_fermi", 1, False, False, False, 3_750),
+    # 1.5 GB of VRAM; round down to 1 GB.
+    Gpu(("gtx580", "geforce580", "nvidia580"), "dedicated_fermi", 1, False, False, False, 3_750),
+    # 1.25 GB of VRAM; round down to 1 GB.
+    Gpu(("gtx570", "geforce570", "nvidia570"), "dedicated_fermi", 1, False, False, False, 3_750),
+    Gpu(("gtx560ti", "geforce560ti", "nvidia560ti"), "dedicated_fermi", 1, False, False, False, 3_750),
+    Gpu(("gtx560", "geforce560", "nvidia560"), "dedicated_fermi", 1, False, False, False, 3_750),
+    Gpu(("gtx550ti", "geforce550ti", "nvidia550ti"), "dedicated_fermi", 1, False, False, False, 1_250),
+    # The GeForce GT 710 is a Fermi GPU despite being in the 700 series.
+    Gpu(("gt710", "geforce710", "nvidia710"), "dedicated_fermi", 12, False, False, False, 1_250),
+    Gpu(("nvidia", "quadro", "tesla"), "unknown"),
+)
+
+AMD_GPUS: Final = (
+    Gpu(("rx9070xt", "radeon9070xt", "amd9070xt"), "dedicated_rdna3", 16, True, True, True, 27_500),
+    Gpu(("rx9070", "radeon9070", "amd9070"), "dedicated_rdna3", 16, True, True, True, 22_500),
+    Gpu(("rx7900xtx", "radeon7900xtx", "amd7900xtx"), "dedicated_rdna3", 24, True, True, True, 30_000),
+    Gpu(("rx7900xt", "radeon7900xt", "amd7900xt"), "dedicated_rdna3", 20, True, True, True, 27_500),
+    Gpu(("rx7600", "radeon7600", "amd7600"), "dedicated_rdna3", 8, True, True, True, 17_500),
+    Gpu(("rx6950xt", "radeon6950xt", "amd6950xt"), "dedicated_rdna2", 16, True, True, True, 27_500),
+    Gpu(("rx6900xt", "radeon6900xt", "amd6900xt"), "dedicated_rdna2", 16, True, True, True, 27_500),
+    Gpu(("rx6800xt", "radeon6800xt", "amd6800xt"), "dedicated_rdna2", 16, True, True, True, 27_500),
+    Gpu(("rx6800", "radeon6800", "amd6800"), "dedicated_rdna2", 16, True, True, True, 22_500),
+    Gpu(("rx6750xt", "radeon6750xt", "amd6750xt"), "dedicated_rdna2", 12, True, True, True, 22_500),
+    Gpu(("rx6700xt", "radeon6700xt", "amd6700xt"), "dedicated_rdna2", 12, True, True, True, 17_500),
+    Gpu(("rx6700", "radeon6700", "amd6700"), "dedicated_rdna2", 10, True, True, True, 17_500),
+    Gpu(("rx6650xt", "radeon6650xt", "amd6650xt"), "dedicated_rdna2", 8, True, True, True, 17_500),
+    Gpu(("rx6600xt", "radeon6600xt", "amd6600xt"), "dedicated_rdna2", 8, True, True, True, 17_500),
+    Gpu(("rx6600", "radeon6600", "amd6600"), "dedicated_rdna2", 8, True, True, True, 17_500),
+    Gpu(("rx6500xt", "radeon6500xt", "amd6500xt"), "dedicated_rdna2", 4, True, True, True, 7_500),
+    Gpu(("rx6400", "radeon6400", "amd6400"), "dedicated_rdna2", 4, True, True, True, 7_500),
+    Gpu(("rx5700xt", "radeon5700xt", "amd5700xt"), "dedicated_rdna1", 8, False, False, False, 17_500),
+    Gpu(("rx5700", "radeon5700", "amd5700"), "dedicated_rdna1", 8, False, False, False, 12_500),
+    Gpu(("rx5600xt", "radeon5600xt", "amd5600xt"), "dedicated_rdna1", 6, False, False, False, 12_500),
+    Gpu(("rx5600", "radeon5600", "amd5600"), "dedicated_rdna1", 6, False, False, False, 12_500),
+    Gpu(("rx5500xt", "radeon5500xt", "amd5500xt"), "dedicated_rdna1", 4, False, False, False, 7_500),
+    Gpu(("rx5500", "radeon5500", "amd5500"), "dedicated_rdna1", 4, False, False, False, 7_500),
+    Gpu(("radeonvii",), "dedicated_gcn5.0", 4, False, False, False, 17_500),
+    Gpu(("vega64",), "dedicated_gcn5.0", 8, False, False, False, 12_500),
+    Gpu(("vega56",), "dedicated_gcn5.0", 8, False, False, False, 12_500),
+    Gpu(("rx590", "radeon590", "amd590"), "dedicated_gcn4.0", 8, False, False, False, 7_500),
+    Gpu(("rx580", "radeon580", "amd580"), "dedicated_gcn4.0", 8, False, False, False, 7_500),
+    Gpu(("rx570", "radeon570", "amd570"), "dedicated_gcn4.0", 4, False, False, False, 7_500),
+    Gpu(("rx560", "radeon560", "amd560"), "dedicated_gcn4.0", 4, False, False, False, 3_750),
+    Gpu(("rx550", "radeon550", "amd550"), "dedicated_gcn4.0", 2, False, False, False, 3_750),
+    Gpu(("rx480", "radeon480", "amd480"), "dedicated_gcn4.0", 8, False, False, False, 7_500),
+    Gpu(("rx470", "radeon470", "amd470"), "dedicated_gcn4.0", 4, False, False, False, 7_500),
+    Gpu(("rx460", "radeon460", "amd460"), "dedicated_gcn4.0", 2, False, False, False, 3_750),
+    # "FirePro" is trimmed to "fire", which is too short to search for on its own (it's found in "Firefox").
+    Gpu(("radeon", "amdfire"), "unknown"),
+)
+
+INTEL_GPUS: Final = (
+    Gpu(("b580",), "dedicated_arc_battlemage", 12, True, True, True, 17_500),
+    Gpu(("b570",), "dedicated_arc_battlemage", 10, True, True, True, 12_500),
+    Gpu(("a780",), "dedicated_arc_alchemist", 16, True, True, True, 7_500),
+    Gpu(("a770",), "dedicated_arc_alchemist", 16, True, True, True, 7_500),
+    Gpu(("a750",), "dedicated_arc_alchemist", 8, True, True, True, 7_500),
+    Gpu(("a580",), "dedicated_arc_alchemist", 8, True, True, True, 7_500),
+    Gpu(("a380",), "dedicated_arc_alchemist", 6, True, True, True, 3_750),
+    Gpu(("a350",), "dedicated_arc_alchemist", 4, True, True, True, 3_750),
+    Gpu(("a310",), "dedicated_arc_alchemist", 4, True, True, True, 3_750),
+    Gpu(("uhd770",), "integrated_gen12", None, False, True, False, 1_250),
+    Gpu(("uhd750",), "integrated_gen12", None, False, True, False, 1_250),
+    Gpu(("uhd730",), "integrated_gen12", None, False, True, False, 1_250),
+    Gpu(("uhd710",), "integrated_gen12", None, False, True, False, 1_250),
+    Gpu(("irisplus655",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("irisplus645",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("uhd630",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("uhd620",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("uhd617",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("uhd615",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("uhd610",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("irisplus650",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("irisplus640",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("hd630",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("hd620",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("hd615",), "integrated_gen9.5", None, False, False, False, 1_250),
+    Gpu(("hd610",), "integrated_gen9.5", None, False, False, False, 1_250),
+    # Originally "irispro580", but we stripped "pro" to make parsing Ryzen PRO easier.
+    Gpu(("iris580",), "integrated_gen9", None, False, False, False, 1_250),
+    Gpu(("iris550",), "integrated_gen9", None, False, False, False, 1_250),
+    Gpu(("iris540",), "integrated_gen9", None, False, False, False, 1_250),
+    Gpu(("hd530",), "integrated_gen9", None, False, False, False, 1_250),
+    Gpu(("hd520",), "integrated_gen9", None, False, False, False, 1_250),
+    Gpu(("hd515",), "integrated_gen9", None, False, False, False, 1_250),
+    Gpu(("hd510",), "integrated_gen9", None, False, False, False, 1_250),
+    # Originally "irispro6200", but we stripped "pro" to make parsing Ryzen PRO easier.
+    Gpu(("iris6200",), "integrated_gen8", None, False, False, False, 1_250),
+    Gpu(("iris6100",), "integrated_gen8", None, False, False, False, 1_250),
+    Gpu(("hd6000",), "integrated_gen8", None, False, False, False, 1_250),
+    Gpu(("hd5600",), "integrated_gen8", None, False, False, False, 1_250),
+    Gpu(("hd5500",), "integrated_gen8", None, False, False, False, 1_250),
+    Gpu(("hd5300",), "integrated_gen8", None, False, False, False, 1_250),
+    # Originally "irispro5200", but we stripped "pro" to make parsing Ryzen PRO easier.
+    Gpu(("iris5200",), "integrated_gen7.5", None, False, False, False, 1_250),
+    Gpu(("iris5100",), "integrated_gen7.5", None, False, False, False, 1_250),
+    Gpu(("hd5000",), "integrated_gen7.5", None, False, False, False, 1_250),
+    Gpu(("hd4600",), "integrated_gen7.5", None, False, False, False, 1_250),
+    Gpu(("hd4400",), "integrated_gen7.5", None, False, False, False, 1_250),
+    Gpu(("hd4200",), "integrated_gen7.5", None, False, False, False, 1_250),
+    Gpu(("hd4000",), "integrated_gen7", None, False, False, False, 1_250),
+    Gpu(("hd2500",), "integrated_gen7", None, False, False, False, 1_250),
+    Gpu(("hd3000",), "integrated_gen6", None, False, False, False, 1_250),
+    Gpu(("hd2000",), "integrated_gen6", None, False, False, False),
+    # Assume this is a slow GPU, as even high-end Iris Xe barely scratches
+    # the 2,500 points mark as of June 2023.
+    Gpu(("irisxe", "intelhd"), "unknown", passmark_score=1_250),
+)
+
+
+class DetectionBlock(NamedTuple):
+    # Statistic the table entries are counted in, such as `("cpu", "intel")`.
+    prefix: StatisticPath
+    # Keywords of which at least one is contained in every pattern of the table.
+    # If none of them is found in the system information, no entry can match and the table is skipped.
+    gate: Tuple[str, ...]
+    entries: Tuple[Union[Os, Cpu, Gpu], ...]
+    # If set, every entry found is counted. More specific patterns still win over patterns found at the same place
+    # (e.g. "tx4070ti" over "tx4070"), and the last entry of the table is only counted if no other entry is found.
+    multiple: bool = False
+
+
+# Short patterns that are also part of common words ("arch" of "search" or "architecture", "opera" of "operating
+# system", "ios" of "BIOS", "fx" of "gfx1030"). They are only found as whole words of the system information
+# (see `system_information_words()`), such as "Arch Linux" or "AMD FX-8350". As gate keywords, they only cover
+# themselves: other patterns of their table need another keyword, including compound words written without a space
+# ("archlinux" or "operagx"). Patterns with one of them as their family must start at the start of a word
+# ("iOS 17", but not "BIOS 17").
+WHOLE_WORD_PATTERNS: Final = frozenset(("arch", "edge", "web", "opera", "ios", "fx"))
+
+
+DETECTION_BLOCKS: Final = (
+    DetectionBlock(("os", "windows"), ("windows",), WINDOWS_VERSIONS),
+    DetectionBlock(
+        ("os", "linux"),
+        ("ubuntu", "fedora", "debian", "mint", "arch", "manjaro", "endeavor", "endeavour", "linux"),
+        LINUX_DISTRIBUTIONS,
+    ),
+    DetectionBlock(("os", "macos"), ("macos",), MACOS_VERSIONS),
+    DetectionBlock(("os", "android"), ("android",), ANDROID_VERSIONS),
+    DetectionBlock(("os", "ios"), ("ios",), IOS_VERSIONS),
+    DetectionBlock(
+        ("os", "web"), ("firefox", "chrome", "opera", "operagx", "edge", "safari", "web", "webgl"), WEB_BROWSERS
+    ),
+    DetectionBlock(
+        ("cpu", "intel"),
+        ("intel", "core", "ultra", "i3", "i5", "i7", "i9", "celeron", "pentium", "xeon"),
+        INTEL_CPUS,
+    ),
+    DetectionBlock(("cpu", "amd"), ("ryzen", "fx", "athlon", "phenom", "threadripper", "epyc"), AMD_CPUS),
+    DetectionBlock(
+        ("gpu", "nvidia"),
+        ("tx", "gt", "geforce", "nvidia", "laptop", "mobile", "quadro", "tesla"),
+        NVIDIA_GPUS,
+        multiple=True,
+    ),
+    DetectionBlock(("gpu", "amd"), ("rx", "radeon", "amd", "vega"), AMD_GPUS, multiple=True),
+    DetectionBlock(
+        ("gpu", "intel"),
+        # Intel Arc GPUs are detected by model number alone, so those are part of the gate.
+        ("b580", "b570", "a780", "a770", "a750", "a580", "a380", "a350", "a310", "hd", "iris"),
+        INTEL_GPUS,
+        multiple=True,
+    ),
+)
+
+# Splits patterns and trimmed system information into tokens made of a family (letters) followed by
+# a model number (digits), such as "tx" + "4070", "ryzen" + "75800" or "hd" + "4600".
+# Whatever follows the model number is its suffix, such as "ti" or "x3d".
+MODEL_NUMBER_REGEX: Final = re.compile(r"([a-z]*)(\d+)")
+
+# Words of system information, split at anything but letters and between letters and digits ("fx8350" is "fx 8350").
+WORD_REGEX: Final = re.compile(r"[a-z]+|\d+")
+
+# Tokens that match no pattern are looked up again allowing for a typo in the model number, such as "GTX 1605"
+# for "GTX 1650". Only typos that rarely turn a model number into another real one are allowed: two adjacent digits
+# swapped or a digit typed twice. A dropped digit isn't, as it often names a real model ("i7-1270P" isn't "i7-12700"),
+# and neither is a different digit ("i7-11800H" isn't "i7-11850H"). The family must be spelled exactly (so that
+# "Ryzen 5 3550H" can't be read as "i5 3550"), and the model number must have at least `FUZZY_MIN_DIGITS` digits.
+FUZZY_MIN_DIGITS: Final = 4
+
+
+def digit_deletions(digits: str) -> Set[str]:
+    # Returns `digits` and all strings obtained by deleting one of its digits. A model number and its typos
+    # have one of these in common.
+    return {digits} | {digits[: end - 1] + digits[end:] for end in range(1, len(digits) + 1)}
+
+
+def is_model_number_typo(digits: str, model_number: str) -> bool:
+    # Returns whether `digits` is `model_number` with two adjacent digits swapped or a digit typed twice.
+    if len(digits) == len(model_number):
+        differences: Final = [position for position in range(len(digits)) if digits[position] != model_number[position]]
+        return (
+            len(differences) == 2
+            and differences[1] == differences[0] + 1
+            and digits[differences[0]] == model_number[differences[1]]
+            and digits[differences[1]] == model_number[differences[0]]
+        )
+    if len(digits) == len(model_number) + 1:
+        return any(
+            digits[end - 1] == digits[end] and digits[: end - 1] + digits[end:] == model_number
+            for end in range(1, len(digits))
+        )
+    return False
+
+
+class CompiledRules(NamedTuple):
+    # Gate keyword -> tables that may match if the keyword is found.
+    keyword_blocks: Dict[str, FrozenSet[int]]
+    # Gate keyword -> gate keywords found along with it at the same position (itself and its prefixes).
+    keyword_prefixes: Dict[str, FrozenSet[str]]
+    # Regular expression finding all gate keywords, except those only found as whole words.
+    keyword_pattern: str
+    # Gate keywords only found as whole words (see `WHOLE_WORD_PATTERNS`).
+    word_keywords: FrozenSet[str]
+    # Statistics incremented by each entry of each table.
+    statistic_paths: Tuple[Tuple[Tuple[StatisticPath, ...], ...], ...]
+    # (numeric statistic, value) pairs of each entry of each table.
+    numeric_attributes: Tuple[Tuple[Tuple[Tuple[StatisticPath, int], ...], ...], ...]
+    # (pattern, entry index) pairs of each table in evaluation order.
+    rules: Tuple[Tuple[Tuple[str, int], ...], ...]
+    # (family, model number) -> [(suffix, table index, rank of the pattern in the table), ...]
+    model_numbers: Dict[Tuple[str, str], List[Tuple[str, int, int]]]
+    # Patterns without a model number, as (rank, pattern, longest gate keyword in the pattern) for each table.
+    keyword_rules: List[List[Tuple[int, str, str]]]
+    # (family, model number with up to one digit deleted) -> model numbers of `model_numbers` (as in SymSpell).
+    # A model number and its typos have such a deletion in common.
+    fuzzy_index: Dict[Tuple[str, str], List[str]]
+
+
+def pattern_keyword(pattern: str, keywords: List[str]) -> Optional[str]:
+    # Returns the first of the gate keywords that a pattern without a model number can't be found without, if any.
+    return next(
+        (
+            keyword
+            for keyword in keywords
+            if keyword == pattern or (keyword not in WHOLE_WORD_PATTERNS and keyword in pattern)
+        ),
+        None,
     )
-    client: Final = Client(transport=transport, fetch_schema_from_transport=True)
 
-    results: Final = []
-    cursor = None
-    # Get the 30×100 = 3,000 last issues.
-    # TODO: Retry requests a few times if they fail.
-    num_queries = 30
-    for i in range(num_queries):
-        print(f"Running query {i + 1}/{num_queries}...")
-        query = gql(
-            """
-            query($cursor: String) {
-                repository(owner: "godotengine", name: "godot") {
-                    issues(last: 100, orderBy: { direction: ASC, field: CREATED_AT }, before: $cursor) {
-                        edges {
-                            cursor
-                            node {
-                                body
-                                createdAt
-                                author {
-                                    login
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-            """
+
+def compile_detection_blocks(blocks: Tuple[DetectionBlock, ...]) -> CompiledRules:
+    for pattern in WHOLE_WORD_PATTERNS:
+        if WORD_REGEX.fullmatch(pattern) is None:
+            raise ValueError(f'Pattern "{pattern}" can never be found as a whole word.')
+
+    keyword_blocks: Final[Dict[str, Set[int]]] = {}
+    for index, block in enumerate(blocks):
+        for entry in block.entries:
+            for pattern in entry.patterns:
+                if trim_system_information(pattern) != pattern:
+                    raise ValueError(f'Pattern "{pattern}" can never be found in trimmed system information.')
+                # A pattern not covered by the gate would be silently ignored whenever the table is skipped.
+                if not any(keyword in pattern for keyword in block.gate) or (
+                    MODEL_NUMBER_REGEX.match(pattern) is None and pattern_keyword(pattern, list(block.gate)) is None
+                ):
+                    raise ValueError(f'Pattern "{pattern}" is not covered by the gate of the {block.prefix} table.')
+        for keyword in block.gate:
+            keyword_blocks.setdefault(keyword, set()).add(index)
+
+    keywords: Final = sorted(keyword_blocks, key=len, reverse=True)
+    # Whole words are looked up in the words of the system information instead of being searched for.
+    searched_keywords: Final = [keyword for keyword in keywords if keyword not in WHOLE_WORD_PATTERNS]
+    # Flatten every table into (pattern, entry index) pairs in evaluation order. As the patterns of each entry
+    # are combined with "or", the first pattern found always belongs to the first matching entry.
+    rules: Final = tuple(
+        tuple((pattern, entry_index) for entry_index, entry in enumerate(block.entries) for pattern in entry.patterns)
+        for block in blocks
+    )
+
+    model_numbers: Final[Dict[Tuple[str, str], List[Tuple[str, int, int]]]] = {}
+    keyword_rules: Final[List[List[Tuple[int, str, str]]]] = []
+    for index, table_rules in enumerate(rules):
+        keyword_rules.append([])
+        for rank, (pattern, _) in enumerate(table_rules):
+            match = MODEL_NUMBER_REGEX.match(pattern)
+            if match is None:
+                # Keywords are sorted from the longest, which is the least likely to be found.
+                rule_keyword = pattern_keyword(pattern, keywords)
+                assert rule_keyword is not None
+                keyword_rules[index].append((rank, pattern, rule_keyword))
+            else:
+                family, model_number = match.groups()
+                suffix_start = match.end()
+                model_numbers.setdefault((family, model_number), []).append((pattern[suffix_start:], index, rank))
+
+    fuzzy_index: Final[Dict[Tuple[str, str], List[str]]] = {}
+    for family, model_number in model_numbers:
+        if family and len(model_number) >= FUZZY_MIN_DIGITS:
+            for deletion in digit_deletions(model_number):
+                fuzzy_index.setdefault((family, deletion), []).append(model_number)
+
+    return CompiledRules(
+        # The regular expression tries the longest keywords first and only reports one keyword per position.
+        # Any other keyword matching at the same position is a prefix of the reported one, so merge their tables.
+        # Whole words aren't found by the regular expression, so they can't be implied by another keyword.
+        {
+            keyword: frozenset(
+                index
+                for other, indices in keyword_blocks.items()
+                if other == keyword or (other in searched_keywords and keyword.startswith(other))
+                for index in indices
+            )
+            for keyword in keyword_blocks
+        },
+        {
+            keyword: frozenset(
+                other
+                for other in keyword_blocks
+                if other == keyword or (other in searched_keywords and keyword.startswith(other))
+            )
+            for keyword in keyword_blocks
+        },
+        # Use a lookahead so that overlapping keywords are all found.
+        "(?=(" + "|".join(re.escape(keyword) for keyword in searched_keywords) + "))",
+        frozenset(keyword for keyword in keywords if keyword in WHOLE_WORD_PATTERNS),
+        tuple(tuple(entry.statistic_paths(block.prefix) for entry in block.entries) for block in blocks),
+        tuple(tuple(entry.numeric_attributes() for entry in block.entries) for block in blocks),
+        rules,
+        model_numbers,
+        keyword_rules,
+        fuzzy_index,
+    )
+
+
+class Detector:
+    # Runs the detection tables on system information strings, which are trimmed first.
+    #
+    # Patterns containing a model number are resolved through a table indexed by family and model number:
+    # a single regular expression sweep extracts all tokens from the system information, and each token
+    # is looked up in the table. This way, the cost of detection doesn't depend on the number of known models.
+    #
+    # Other patterns (such as "windows" or "radeon") are tested one by one. A dispatch index sits in front
+    # of them: a single regular expression scan finds all gate keywords present in the system information,
+    # which determines the tables that can possibly match. All other tables are skipped. Keywords that are
+    # whole words (such as "arch") are looked up in the set of words of the system information instead.
+    #
+    # Tables with `multiple` set (GPU tables) are resolved by the same sweep and scan: each token keeps its most
+    # specific entry, and all entries found are returned instead of the first one.
+    #
+    # The tables are compiled by `compile_detection_blocks()`, unless already compiled tables are given.
+
+    def __init__(self, blocks: Tuple[DetectionBlock, ...], compiled: Optional[CompiledRules] = None) -> None:
+        if compiled is None:
+            compiled = compile_detection_blocks(blocks)
+        self.keyword_blocks = compiled.keyword_blocks
+        self.keyword_prefixes = compiled.keyword_prefixes
+        self.regex = re.compile(compiled.keyword_pattern)
+        self.word_keywords = compiled.word_keywords
+        self.blocks = blocks
+        self.statistic_paths = compiled.statistic_paths
+        self.numeric_attributes = compiled.numeric_attributes
+        # Statistics incremented by each entry, including the bins of its numeric attributes.
+        self.entry_paths = tuple(
+            tuple(
+                paths + tuple(path + (NUMERIC_STATISTICS[path].key(value),) for path, value in attributes)
+                for paths, attributes in zip(table_paths, table_attributes)
+            )
+            for table_paths, table_attributes in zip(self.statistic_paths, self.numeric_attributes)
+        )
+        self.rules = compiled.rules
+        self.model_numbers = compiled.model_numbers
+        self.keyword_rules = compiled.keyword_rules
+        self.fuzzy_index = compiled.fuzzy_index
+        self.multiple = frozenset(index for index, block in enumerate(blocks) if block.multiple)
+        # Length of the family of each pattern whose family is in `WHOLE_WORD_PATTERNS`, by (table index, rank).
+        self.word_family_lengths: Dict[Tuple[int, int], int] = {}
+        for index, table_rules in enumerate(self.rules):
+            for rank, (pattern, _) in enumerate(table_rules):
+                match = MODEL_NUMBER_REGEX.match(pattern)
+                if match is not None and match.group(1) in WHOLE_WORD_PATTERNS:
+                    self.word_family_lengths[(index, rank)] = len(match.group(1))
+        # Rank of the first pattern of the last entry of each table, which is only counted if no other entry is.
+        self.fallback_ranks = [
+            next(rank for rank, (_, entry_index) in enumerate(table_rules) if entry_index == len(block.entries) - 1)
+            for block, table_rules in zip(blocks, self.rules)
+        ]
+        self.families = {family for family, _ in self.model_numbers}
+        self.family_lengths = sorted({len(family) for family in self.families})
+        # Tokens repeat a lot across reports (e.g. "windows10" or "geforcertx3060"), so remember their candidates.
+        self.token_cache: Dict[Tuple[str, str], Tuple[Tuple[str, int, int], ...]] = {}
+        # Tokens whose candidates are those of a typo, which only match tables found by a gate keyword.
+        self.misspelled_tokens: Set[Tuple[str, str]] = set()
+
+        # Number of times each table was evaluated or skipped thanks to the dispatch index.
+        self.evaluated_count = [0] * len(blocks)
+        self.skipped_count = [0] * len(blocks)
+        self.token_count = 0
+        # Number of times patterns without a model number were searched for.
+        self.searched_count = 0
+
+    def scan_keywords(self, system_information_trimmed: str, words: FrozenSet[str]) -> Tuple[Set[int], Set[str]]:
+        # Returns the tables that can possibly match and all gate keywords found.
+        active: Set[int] = set()
+        found: Set[str] = set()
+        for keyword in self.regex.findall(system_information_trimmed):
+            active |= self.keyword_blocks[keyword]
+            found |= self.keyword_prefixes[keyword]
+        for keyword in self.word_keywords & words:
+            active |= self.keyword_blocks[keyword]
+            found.add(keyword)
+        return active, found
+
+    def resolve_token(self, letters: str, digits: str) -> Tuple[Tuple[str, int, int], ...]:
+        # Returns (suffix, table index, rank) for all patterns that a token may match,
+        # depending on whether the text following the token starts with the suffix.
+        candidates = self.token_cache.get((letters, digits))
+        if candidates is not None:
+            return candidates
+
+        found: Final = self.resolve_exact_token(letters, digits) or self.resolve_misspelled_token(letters, digits)
+        candidates = tuple(found)
+        self.token_cache[(letters, digits)] = candidates
+        return candidates
+
+    def resolve_exact_token(self, letters: str, digits: str) -> List[Tuple[str, int, int]]:
+        # Returns the candidates of `resolve_token()` without allowing for misspellings.
+        found: Final[List[Tuple[str, int, int]]] = []
+        for family_length in self.family_lengths:
+            if family_length > len(letters):
+                break
+            family = letters[-family_length:] if family_length > 0 else ""
+            if family not in self.families:
+                continue
+
+            # Tokens are as long as possible, so the pattern's family must be a suffix of the token's letters
+            # and its model number must start with the token's digits (or anywhere in them without a family).
+            # A pattern whose model number is shorter than the token's can't have a suffix.
+            for start in range(len(digits)) if family_length == 0 else (0,):
+                for end in range(start + 1, len(digits) + 1):
+                    for suffix, index, rank in self.model_numbers.get((family, digits[start:end]), ()):
+                        if end == len(digits) or not suffix:
+                            found.append((suffix, index, rank))
+        return found
+
+    def resolve_misspelled_token(self, letters: str, digits: str) -> List[Tuple[str, int, int]]:
+        # Returns the candidates of the only known model number that a token is a typo of (with the same family),
+        # or no candidates if there are several (for instance "gtx1066" could be a GTX 1060 or GTX 1660).
+        keys: Final[Set[Tuple[str, str]]] = set()
+        for family_length in self.family_lengths:
+            if family_length == 0:
+                continue
+            if family_length > len(letters):
+                break
+            family = letters[-family_length:]
+            if family not in self.families:
+                continue
+            for deletion in digit_deletions(digits):
+                for model_number in self.fuzzy_index.get((family, deletion), ()):
+                    if is_model_number_typo(digits, model_number):
+                        keys.add((family, model_number))
+
+        if len(keys) != 1:
+            return []
+        self.misspelled_tokens.add((letters, digits))
+        return list(self.model_numbers[next(iter(keys))])
+
+    def match_model_numbers(
+        self, system_information: str, system_information_trimmed: str, active: Set[int]
+    ) -> Tuple[Dict[int, int], Dict[int, Set[int]]]:
+        # Returns the rank of the first matching pattern with a model number for each table,
+        # and the rank of the first matching pattern of each token for tables with `multiple` set.
+        # Typos of model numbers only match the tables that can possibly match (see `scan_keywords()`).
+        best_ranks: Dict[int, int] = {}
+        found_ranks: Dict[int, Set[int]] = {}
+        # Offsets of the start of words, only computed if a pattern whose family is a whole word is found.
+        word_starts: Optional[Set[int]] = None
+        for match in MODEL_NUMBER_REGEX.finditer(system_information_trimmed):
+            self.token_count += 1
+            token = match.groups()
+            candidates = self.resolve_token(*token)
+            if not candidates:
+                continue
+            misspelled = token in self.misspelled_tokens
+            token_ranks: Dict[int, int] = {}
+            for suffix, index, rank in candidates:
+                if misspelled and index not in active:
+                    continue
+                if rank >= token_ranks.get(index, rank + 1) or not system_information_trimmed.startswith(
+                    suffix, match.end()
+                ):
+                    continue
+                if (index, rank) in self.word_family_lengths:
+                    if word_starts is None:
+                        word_starts = word_start_offsets(system_information)
+                    if match.end(1) - self.word_family_lengths[(index, rank)] not in word_starts:
+                        continue
+                token_ranks[index] = rank
+            for index, rank in token_ranks.items():
+                if index in self.multiple:
+                    found_ranks.setdefault(index, set()).add(rank)
+                elif rank < best_ranks.get(index, rank + 1):
+                    best_ranks[index] = rank
+
+        return best_ranks, found_ranks
+
+    def match(self, system_information: str) -> Dict[int, Tuple[int, ...]]:
+        # Returns the indices of the matching entries for each table that matched,
+        # which is a single entry unless the table has `multiple` set.
+        system_information_trimmed: Final = trim_system_information(system_information)
+        active, found = self.scan_keywords(system_information_trimmed, system_information_words(system_information))
+        best_ranks, found_ranks = self.match_model_numbers(system_information, system_information_trimmed, active)
+        searched_count = 0
+        for index, keyword_rules in enumerate(self.keyword_rules):
+            if index not in active:
+                self.skipped_count[index] += 1
+                continue
+
+            self.evaluated_count[index] += 1
+            if index in self.multiple:
+                ranks = found_ranks.setdefault(index, set())
+                for rank, pattern, keyword in keyword_rules:
+                    # The last entry is only searched for if nothing else was found.
+                    if rank >= self.fallback_ranks[index] and ranks:
+                        break
+                    if keyword not in found:
+                        continue
+                    searched_count += 1
+                    if pattern == keyword or pattern in system_information_trimmed:
+                        ranks.add(rank)
+                continue
+
+            for rank, pattern, keyword in keyword_rules:
+                # Patterns past the best model number match can't win anymore.
+                if rank > best_ranks.get(index, rank):
+                    break
+                # A pattern can't be found without the keywords it contains, which were all found by the scan.
+                # This rules out most patterns of the tables that are evaluated without searching for them,
+                # and patterns that are keywords themselves (including whole words) don't need to be searched for.
+                if keyword not in found:
+                    continue
+                searched_count += 1
+                if pattern == keyword or pattern in system_information_trimmed:
+                    best_ranks[index] = rank
+                    break
+
+        self.searched_count += searched_count
+        matches: Final[Dict[int, Tuple[int, ...]]] = {
+            index: (self.rules[index][rank][1],) for index, rank in best_ranks.items()
+        }
+        for index, ranks in found_ranks.items():
+            if ranks:
+                # Patterns of the same entry may be found in several places.
+                matches[index] = tuple(sorted({self.rules[index][rank][1] for rank in ranks}))
+        return {index: matches[index] for index in sorted(matches)}
+
+    def combine(self, all_matches: List[Dict[int, Tuple[int, ...]]]) -> Dict[int, Tuple[int, ...]]:
+        # Returns the entries matched by any of the given results of `match()` (such as matches of several parts
+        # of the same system information), as if they were matched together.
+        combined: Final[Dict[int, Set[int]]] = {}
+        for matches in all_matches:
+            for index, entry_indices in matches.items():
+                if index in self.multiple:
+                    combined.setdefault(index, set()).update(entry_indices)
+                else:
+                    # The first entry of the table to match anywhere wins.
+                    combined[index] = {min(combined.get(index, set()) | set(entry_indices))}
+
+        for index, indices in combined.items():
+            if len(indices) > 1:
+                indices.discard(len(self.blocks[index].entries) - 1)
+        return {index: tuple(sorted(combined[index])) for index in sorted(combined)}
+
+    def detect(self, system_information: str) -> List[StatisticPath]:
+        return self.paths(self.match(system_information))
+
+    def paths(self, matches: Dict[int, Tuple[int, ...]]) -> List[StatisticPath]:
+        # Returns the statistics incremented by the entries returned by `match()`, without duplicates.
+        paths: List[StatisticPath] = []
+        for index, entry_indices in matches.items():
+            for entry_index in entry_indices:
+                paths.extend(self.entry_paths[index][entry_index])
+        if any(len(entry_indices) > 1 for entry_indices in matches.values()):
+            # Several GPUs of the same vendor usually have statistics in common (such as their VRAM).
+            return list(dict.fromkeys(paths))
+        return paths
+
+    def print_dispatch_statistics(self) -> None:
+        skipped: Final = sum(self.skipped_count)
+        total: Final = skipped + sum(self.evaluated_count)
+        print(f"Detection tables skipped by the dispatch index: {skipped}/{total} ({skipped / max(total, 1):.0%})")
+        for block, skipped_count, evaluated_count in zip(self.blocks, self.skipped_count, self.evaluated_count):
+            print(f"    {'/'.join(block.prefix)}: {skipped_count}/{skipped_count + evaluated_count}")
+        print(f"Model number tokens looked up: {self.token_count} ({len(self.model_numbers)} known model numbers)")
+        print(f"Misspelled model number tokens resolved: {len(self.misspelled_tokens)}")
+        print(f"Other patterns searched for: {self.searched_count}")
+
+
+# File caching the compiled detection tables, see `load_detector()`.
+DETECTOR_CACHE_PATH: Final = "detector.pickle"
+
+
+def load_detector(blocks: Tuple[DetectionBlock, ...], cache_path: str) -> Detector:
+    # Compiling the detection tables takes longer than detecting the issues reported in a day,
+    # so compiled tables are cached. The cache is keyed by a hash of this script, which defines the tables
+    # and how they're compiled: it's recompiled automatically whenever either changes.
+    start: Final = time.perf_counter()
+    with open(__file__, "rb") as script_file:
+        key: Final = hashlib.sha256(script_file.read()).hexdigest()
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cached_key, state = pickle.load(cache_file)
+        if cached_key == key:
+            detector = Detector(blocks, CompiledRules(*state))
+            print(f"Loaded detection tables from: {cache_path} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+            return detector
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        # Missing or unreadable cache.
+        pass
+
+    compiled: Final = compile_detection_blocks(blocks)
+    # Only built-in types are pickled, so that the cache doesn't depend on the classes defined in this script.
+    with open(f"{cache_path}.tmp", "wb") as cache_file:
+        pickle.dump((key, tuple(compiled)), cache_file, pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{cache_path}.tmp", cache_path)
+    detector = Detector(blocks, compiled)
+    print(f"Compiled detection tables to: {cache_path} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+    return detector
+
+
+def trim_system_information(system_information: str) -> str:
+    # Make the search case-insensitive and punctuation-insensitive.
+    return (
+        system_information.lower()
+        .replace(" ", "")
+        .replace("-", "")
+        .replace("_", "")
+        .replace(":", "")
+        .replace(",", "")
+        .replace("(r)", "")
+        .replace("(tm)", "")
+        .replace("graphics", "")  # Makes it easier to parse "Intel HD Graphics ...".
+        .replace(
+            "pro", ""
+        )  # Makes it easier to parse "Ryzen PRO" (these are very close to their non-PRO counterparts).
+    )
+
+
+def system_information_words(system_information: str) -> FrozenSet[str]:
+    # Returns the words of system information, where `WHOLE_WORD_PATTERNS` are looked up.
+    return frozenset(WORD_REGEX.findall(system_information.lower()))
+
+
+def word_start_offsets(system_information: str) -> Set[int]:
+    # Returns the offsets in trimmed system information where a word of the system information starts.
+    # Trimming a prefix of the system information gives the same result as trimming it all, up to that offset.
+    system_information_lower: Final = system_information.lower()
+    return {
+        len(trim_system_information(system_information_lower[: word.start()]))
+        for word in WORD_REGEX.finditer(system_information_lower)
+    }
+
+
+class SystemInfoLineMatcher:
+    # Fast path for the line copied by the "Copy System Info" button of the Godot editor (4.2 and later), such as
+    # `Godot v4.3.stable - Windows 10.0.22631 - Vulkan (Forward+) - dedicated NVIDIA GeForce RTX 3060 (NVIDIA; ...)
+    # - AMD Ryzen 5 5600X 6-Core Processor (12 Threads)`. Each field (OS, renderer, GPU, CPU, ...) is looked up
+    # by its exact name, and only detected once per distinct name. Fields are matched against all tables, as CPU names
+    # such as "AMD Ryzen 7 5800H with Radeon Graphics" also describe the GPU.
+
+    def __init__(self, detector: Detector) -> None:
+        self.detector: Final = detector
+        # Entries matched by each distinct field, as returned by `Detector.match()`.
+        self.field_matches: Final[Dict[str, Dict[int, Tuple[int, ...]]]] = {}
+        self.matched_count = 0
+        self.unmatched_count = 0
+
+    def match(self, system_information: str) -> Optional[Dict[int, Tuple[int, ...]]]:
+        # Returns the indices of the matching entries for each table that matched, like `Detector.match()`,
+        # or `None` if the system information isn't a single "Copy System Info" line.
+        line: Final = system_information.strip()
+        if not line.startswith("Godot v") or " - " not in line or "\n" in line:
+            self.unmatched_count += 1
+            return None
+
+        self.matched_count += 1
+        all_matches: Final[List[Dict[int, Tuple[int, ...]]]] = []
+        for field in line.split(" - "):
+            field_matches = self.field_matches.get(field)
+            if field_matches is None:
+                field_matches = self.detector.match(field)
+                self.field_matches[field] = field_matches
+            all_matches.append(field_matches)
+        # Entries are combined like when matching the whole line.
+        return self.detector.combine(all_matches)
+
+    def print_statistics(self) -> None:
+        total: Final = self.matched_count + self.unmatched_count
+        print(
+            f'Reports with a "Copy System Info" line: {self.matched_count}/{total} '
+            f"({self.matched_count / max(total, 1):.0%}, {len(self.field_matches)} distinct fields)"
         )
 
-        # We're querying the first page, so we don't need to supply a valid cursor.
-        # GQL will take care of not submitting the variable if it's set to `None`.
-        result = client.execute(query, variable_values={"cursor": cursor})
-        results.append(result)
-        # Get the cursor value of the last returned item, as we need it for subsequent requests (pagination).
-        cursor = result["repository"]["issues"]["edges"][0]["cursor"]
-        if i == 0:
-            # Store the date and time of the most recent report.
-            # Reports are sorted by ascending date, so this is the last item in the first query.
-            last_report_date = result["repository"]["issues"]["edges"][-1]["node"]["createdAt"]
-        if i == num_queries - 1:
-            # Store the date and time of the oldest report.
-            # Reports are sorted by ascending date, so this is the first item in the last query.
-            first_report_date = result["repository"]["issues"]["edges"][0]["node"]["createdAt"]
-
-    # Array of dictionaries with user and system information string.
-    user_system_infos: Final = []
 
+def get_statistic(statistics: Dict[str, Any], path: StatisticPath) -> Any:
+    node = statistics
+    for key in path:
+        node = node[key]
+    return node
+
+
+def create_statistics() -> Dict[str, Any]:
     # Counters for all statistics (values are a set of usernames).
     # A set is used, so that each user may only increment a given counter once.
     # A single user may increment multiple counters in the same category,
     # as they may report issues with different hardware or operating systems.
-    statistics: Dict[str, Any] = {
+    return {
         "os": {
             "windows": {
                 "windows_11": set(),
@@ -164,21 +1403,7 @@ def main() -> None:
                 "unknown": set(),
             },
         },
-        "cpu_core_count": {
-            # Number of physical CPU cores.
-            # On CPUs with hybrid topologies (such as 12th generation Intel and newer),
-            # this is the sum of P-cores and E-cores.
-            "24_cores": set(),
-            "20_cores": set(),
-            "16_cores": set(),
-            "14_cores": set(),
-            "12_cores": set(),
-            "10_cores": set(),
-            "8_cores": set(),
-            "6_cores": set(),
-            "4_cores": set(),
-            "2_cores": set(),
-        },
+        "cpu_core_count": numeric_statistic(("cpu_core_count",)),
         "cpu_x86_features": {
             # Support for modern x86 CPU features, which binaries can be optimized for.
             # Currently, Godot only requires SSE2 (which is the baseline for all x86_64 CPUs).
@@ -190,28 +1415,8 @@ def main() -> None:
             "sse4.2": set(),
         },
         "cpu_passmark_score": {
-            # Scores from <https://www.cpubenchmark.net/>.
-            "multi_thread": {
-                ">70,000": set(),
-                "60,000-70,000": set(),
-                "50,000-60,000": set(),
-                "40,000-50,000": set(),
-                "30,000-40,000": set(),
-                "20,000-30,000": set(),
-                "10,000-20,000": set(),
-                "5,000-10,000": set(),
-                "<5,000": set(),
-            },
-            "single_thread": {
-                ">4,500": set(),
-                "4,000-4,500": set(),
-                "3,500-4,000": set(),
-                "3,000-3,500": set(),
-                "2,500-3,000": set(),
-                "2,000-2,500": set(),
-                "1,500-2,000": set(),
-                "<1,500": set(),
-            },
+            "multi_thread": numeric_statistic(("cpu_passmark_score", "multi_thread")),
+            "single_thread": numeric_statistic(("cpu_passmark_score", "single_thread")),
         },
         "gpu": {
             "amd": {
@@ -257,33 +1462,8 @@ def main() -> None:
                 "unknown": set(),
             },
         },
-        "gpu_vram": {
-            # Only dedicated GPUs increment this statistic.
-            "32_gb": set(),
-            "24_gb": set(),
-            "20_gb": set(),
-            "16_gb": set(),
-            "12_gb": set(),
-            "11_gb": set(),
-            "10_gb": set(),
-            "8_gb": set(),
-            "6_gb": set(),
-            "4_gb": set(),
-            "3_gb": set(),
-            "2_gb": set(),
-            "1_gb": set(),
-        },
-        "gpu_passmark_score": {
-            # Scores from <https://www.videocardbenchmark.net/>.
-            ">30,000": set(),
-            "25,000-30,000": set(),
-            "20,000-25,000": set(),
-            "15,000-20,000": set(),
-            "10,000-15,000": set(),
-            "5,000-10,000": set(),
-            "2,500-5,000": set(),
-            "<2,500": set(),
-        },
+        "gpu_vram": numeric_statistic(("gpu_vram",)),
+        "gpu_passmark_score": numeric_statistic(("gpu_passmark_score",)),
         "gpu_raytracing": {
             # GPUs with hardware-accelerated raytracing (not used in Godot yet).
             "dedicated": {
@@ -319,3356 +1499,703 @@ def main() -> None:
         },
     }
 
-    for result in results:
-        for node in result["repository"]["issues"]["edges"]:
-            # Handle deleted ("ghost") users.
-            user = node["node"]["author"]["login"] if node["node"]["author"] is not None else "ghost"
-            # Fix CRLF line endings causing issues with detection,
-            # as some issue reports use them instead of LF line endings.
-            body = node["node"]["body"].replace("\r\n", "\n")
-            # Only issues reported with the issue template form can be scanned with this approach.
-            # This means issues reported before 2020 can't be scanned.
-            system_info_index = body.find("### System information\n\n")
-            issue_description_index = body.find("\n\n### Issue description")
-            if system_info_index != -1 and issue_description_index != -1:
-                system_info_index_end = system_info_index + len("### System information\n\n")
-                system_information = body[system_info_index_end:issue_description_index]
-                user_system_infos.append({"user": user, "system_information": system_information})
-
-                # Make the search case-insensitive and punctuation-insensitive.
-                system_information_trimmed = (
-                    system_information.lower()
-                    .replace(" ", "")
-                    .replace("-", "")
-                    .replace("_", "")
-                    .replace(":", "")
-                    .replace(",", "")
-                    .replace("(r)", "")
-                    .replace("(tm)", "")
-                    .replace("graphics", "")  # Makes it easier to parse "Intel HD Graphics ...".
-                    .replace(
-                        "pro", ""
-                    )  # Makes it easier to parse "Ryzen PRO" (these are very close to their non-PRO counterparts).
+
+def statistic_leaves(statistics: Dict[str, Any], prefix: StatisticPath = ()) -> List[StatisticPath]:
+    # Returns the paths to all sets of users in the statistics, in the same order as the JSON output.
+    leaves: List[StatisticPath] = []
+    for key, value in statistics.items():
+        if isinstance(value, dict):
+            leaves.extend(statistic_leaves(value, prefix + (key,)))
+        elif isinstance(value, set):
+            leaves.append(prefix + (key,))
+    return leaves
+
+
+def unique_integers(values: "npt.NDArray[np.int64]") -> "npt.NDArray[np.int64]":
+    # Equivalent to `np.unique()` for integer arrays, but sorting and comparing neighbors
+    # is several times faster than the hash-based implementation of recent NumPy versions.
+    values = np.sort(values)
+    return values[np.concatenate(([True], values[1:] != values[:-1]))] if len(values) > 0 else values
+
+
+class FeatureMatrix:
+    # Column-oriented alternative to the `statistics` sets, used with `--engine numpy`.
+    #
+    # Each report is stored as one row of small integer codes, with one column per detection table:
+    # 0 if the table didn't match, or 1 + the index of its matching entry. Tables that can match several entries
+    # (GPU tables) have as many columns as the most entries matched by a single report. User-deduplicated counts
+    # for all statistics are then computed at once with a few array operations.
+    #
+    # Numeric attributes (such as VRAM) are kept as values for each code, and binned with `NUMERIC_STATISTICS`
+    # for all codes at once. Bins can then be changed without detecting reports again.
+
+    def __init__(self, detector: Detector, leaves: List[StatisticPath]) -> None:
+        self.leaves = leaves
+        leaf_ids: Final = {path: leaf_id for leaf_id, path in enumerate(leaves)}
+        # For each table, value of each numeric statistic for each code (-1 if the entry doesn't have it).
+        self.code_values: List[Dict[StatisticPath, "npt.NDArray[np.int64]"]] = []
+        for table_attributes in detector.numeric_attributes:
+            code_values: Dict[StatisticPath, "npt.NDArray[np.int64]"] = {}
+            for entry_index, attributes in enumerate(table_attributes):
+                for path, value in attributes:
+                    if path not in code_values:
+                        code_values[path] = np.full(len(table_attributes) + 1, -1, dtype=np.int64)
+                    code_values[path][entry_index + 1] = value
+            self.code_values.append(code_values)
+
+        num_slots: Final = max(len(paths) for table in detector.statistic_paths for paths in table)
+        width: Final = num_slots + max(len(code_values) for code_values in self.code_values)
+        # For each table, IDs of the statistics incremented by each code (padded with -1).
+        self.code_leaves: List["npt.NDArray[np.int64]"] = []
+        for table, code_values in zip(detector.statistic_paths, self.code_values):
+            code_leaves = np.full((len(table) + 1, width), -1, dtype=np.int64)
+            for entry_index, paths in enumerate(table):
+                code_leaves[entry_index + 1, : len(paths)] = [leaf_ids[path] for path in paths]
+            for slot, (path, values) in enumerate(code_values.items(), num_slots):
+                bins = NUMERIC_STATISTICS[path]
+                bin_leaves = np.array([leaf_ids[path + (key,)] for key in bins.keys()], dtype=np.int64)
+                code_leaves[:, slot] = np.where(values >= 0, bin_leaves[bins.bin_values(values)], -1)
+            self.code_leaves.append(code_leaves)
+
+        # Most entries of each table matched by a single report.
+        self.table_columns = [0] * len(detector.blocks)
+        self.user_ids: Dict[str, int] = {}
+        # User ID of each report.
+        self.users = array.array("q")
+        # Flattened (report, table, column of the table, code) tuples for all tables that matched.
+        # Codes of other tables are 0.
+        self.cells = array.array("q")
+
+    def add(self, user: str, matches: Dict[int, Tuple[int, ...]]) -> None:
+        report = len(self.users)
+        self.users.append(self.user_ids.setdefault(user, len(self.user_ids)))
+        for index, entry_indices in matches.items():
+            for column, entry_index in enumerate(entry_indices):
+                self.cells.extend((report, index, column, entry_index + 1))
+            self.table_columns[index] = max(self.table_columns[index], len(entry_indices))
+
+    def arrays(self) -> Tuple["npt.NDArray[np.uint16]", "npt.NDArray[np.int64]", List[int]]:
+        # Returns the codes (reports × columns), the user ID of each report and the table of each column.
+        tables = [index for index, num_columns in enumerate(self.table_columns) for _ in range(num_columns)]
+        first_columns = np.cumsum([0] + self.table_columns)
+        codes = np.zeros((len(self.users), len(tables)), dtype=np.uint16)
+        cells = np.frombuffer(self.cells, dtype=np.int64).reshape(-1, 4)
+        codes[cells[:, 0], first_columns[cells[:, 1]] + cells[:, 2]] = cells[:, 3]
+        return codes, np.frombuffer(self.users, dtype=np.int64), tables
+
+    def user_leaf_pairs(self) -> "npt.NDArray[np.int64]":
+        # Returns distinct (user, statistic) pairs encoded as `user * len(leaves) + leaf`.
+        codes, users, tables = self.arrays()
+        num_leaves = len(self.leaves)
+        user_leaves = [np.zeros(0, dtype=np.int64)]
+        for column, index in enumerate(tables):
+            # Encode (user, code) pairs as single integers and remove duplicates first,
+            # as there are much fewer distinct pairs than reports.
+            code_leaves = self.code_leaves[index]
+            num_codes = len(code_leaves)
+            user_codes = unique_integers(users * num_codes + codes[:, column])
+            leaves = code_leaves[user_codes % num_codes]
+            mask = leaves >= 0
+            user_leaves.append(
+                np.broadcast_to((user_codes // num_codes)[:, np.newaxis], leaves.shape)[mask] * num_leaves
+                + leaves[mask]
+            )
+
+        # Different codes (and tables) can increment the same statistic, so remove duplicates again.
+        return unique_integers(np.concatenate(user_leaves))
+
+    def count_users(self) -> "npt.NDArray[np.int64]":
+        # Returns the number of distinct users for each statistic, in the same order as `leaves`.
+        return np.bincount(self.user_leaf_pairs() % len(self.leaves), minlength=len(self.leaves))
+
+    def percentiles(self, path: StatisticPath, percents: Tuple[int, ...]) -> Dict[str, int]:
+        # Returns percentiles of a numeric statistic, with each distinct value reported by each user counted once.
+        codes, users, tables = self.arrays()
+        user_values = []
+        for column, index in enumerate(tables):
+            if path in self.code_values[index]:
+                values = self.code_values[index][path][codes[:, column]]
+                mask = values >= 0
+                user_values.append((users[mask], values[mask]))
+        if not user_values or not any(len(values) > 0 for _, values in user_values):
+            return {}
+
+        modulus = max(int(values.max()) for _, values in user_values if len(values) > 0) + 1
+        pairs = unique_integers(np.concatenate([value_users * modulus + values for value_users, values in user_values]))
+        return {
+            f"p{percent}": round(float(value))
+            for percent, value in zip(percents, np.percentile(pairs % modulus, percents))
+        }
+
+    def bootstrap_shares(self, num_resamples: int, seed: int) -> Dict[str, Tuple[float, float]]:
+        # Returns the 95% bootstrap confidence interval of each percentage shown on the website, by the path
+        # of the statistic or group of statistics (such as `os/windows/windows_11` or `os/windows`). Each value
+        # is shown as a percentage of the sum of its siblings, with groups counting the sum of their statistics.
+        #
+        # Users are resampled (with replacement) rather than reports, as each user is counted once.
+        # A resample is a vector of how many times each user was drawn, so that the users counted in each
+        # statistic for all resamples are given by a single product with the user × statistic incidence matrix.
+        num_leaves: Final = len(self.leaves)
+        pairs: Final = self.user_leaf_pairs()
+        num_users: Final = len(self.user_ids)
+        if num_users == 0:
+            return {}
+        incidence: Final = np.zeros((num_users, num_leaves), dtype=np.float32)
+        incidence[pairs // num_leaves, pairs % num_leaves] = 1
+
+        # Every statistic and group below the top level is a slice of the chart of its parent.
+        slices: Final[Dict[StatisticPath, int]] = {}
+        parents: Final[Dict[StatisticPath, int]] = {}
+        for path in self.leaves:
+            for depth in range(2, len(path) + 1):
+                slices.setdefault(path[:depth], len(slices))
+                parents.setdefault(path[: depth - 1], len(parents))
+        slice_leaves: Final = np.zeros((num_leaves, len(slices)), dtype=np.float32)
+        parent_leaves: Final = np.zeros((num_leaves, len(parents)), dtype=np.float32)
+        for leaf_id, path in enumerate(self.leaves):
+            for depth in range(2, len(path) + 1):
+                slice_leaves[leaf_id, slices[path[:depth]]] = 1
+                parent_leaves[leaf_id, parents[path[: depth - 1]]] = 1
+        slice_parents: Final = np.array([parents[path[:-1]] for path in slices], dtype=np.int64)
+
+        rng: Final = np.random.default_rng(seed)
+        shares: Final = np.empty((num_resamples, len(slices)), dtype=np.float32)
+        # Limit the size of the resample weights for large numbers of users.
+        batch_size: Final = max(1, 2**22 // max(num_users, 1))
+        for batch_start in range(0, num_resamples, batch_size):
+            batch_end = min(batch_start + batch_size, num_resamples)
+            weights = rng.multinomial(num_users, np.full(num_users, 1 / num_users), size=batch_end - batch_start)
+            counts = weights.astype(np.float32) @ incidence
+            totals = (counts @ parent_leaves)[:, slice_parents]
+            shares[batch_start:batch_end] = np.divide(
+                counts @ slice_leaves, totals, out=np.zeros_like(totals), where=totals > 0
+            )
+
+        lows, highs = np.percentile(shares, [2.5, 97.5], axis=0) * 100
+        return {"/".join(path): (float(lows[index]), float(highs[index])) for path, index in slices.items()}
+
+    def dimension_columns(
+        self, codes: "npt.NDArray[np.uint16]", tables: List[int], dimension: StatisticPath
+    ) -> Tuple[List[str], List["npt.NDArray[np.int64]"]]:
+        # Returns the values of a statistic (its keys, such as "windows" and "linux" for `("os",)`),
+        # and arrays holding the value ID reported by each report (or -1) for every table slot that has any.
+        depth = len(dimension)
+        keys: List[str] = []
+        # The last item is indexed by the -1 padding of `code_leaves`.
+        leaf_values = np.full(len(self.leaves) + 1, -1, dtype=np.int64)
+        for leaf_id, path in enumerate(self.leaves):
+            if len(path) > depth and path[:depth] == dimension:
+                if path[depth] not in keys:
+                    keys.append(path[depth])
+                leaf_values[leaf_id] = keys.index(path[depth])
+
+        columns = []
+        for column, index in enumerate(tables):
+            code_values = leaf_values[self.code_leaves[index]]
+            for slot in range(code_values.shape[1]):
+                if (code_values[:, slot] >= 0).any():
+                    columns.append(code_values[:, slot][codes[:, column]])
+        return keys, columns
+
+    def cross_tab(self, rows: StatisticPath, columns: StatisticPath) -> Dict[str, Dict[str, int]]:
+        # Returns the number of distinct users who reported both values in a single report,
+        # for every pair of values of two statistics. Pairs without any user are omitted.
+        codes, users, tables = self.arrays()
+        row_keys, row_columns = self.dimension_columns(codes, tables, rows)
+        column_keys, column_columns = self.dimension_columns(codes, tables, columns)
+        num_cells = len(row_keys) * len(column_keys)
+
+        user_cells = [np.zeros(0, dtype=np.int64)]
+        for row_values in row_columns:
+            for column_values in column_columns:
+                mask = (row_values >= 0) & (column_values >= 0)
+                user_cells.append(
+                    (users[mask] * len(row_keys) + row_values[mask]) * len(column_keys) + column_values[mask]
                 )
+        counts = np.bincount(unique_integers(np.concatenate(user_cells)) % num_cells, minlength=num_cells)
 
-                # Gather statistics for each issue reported.
-                if "windows11" in system_information_trimmed:
-                    statistics["os"]["windows"]["windows_11"].add(user)
-                elif "windows10" in system_information_trimmed:
-                    statistics["os"]["windows"]["windows_10"].add(user)
-                elif "windows8.1" in system_information_trimmed:
-                    statistics["os"]["windows"]["windows_8.1"].add(user)
-                elif "windows8" in system_information_trimmed:
-                    statistics["os"]["windows"]["windows_8"].add(user)
-                elif "windows7" in system_information_trimmed:
-                    statistics["os"]["windows"]["windows_7"].add(user)
-                elif "windows" in system_information_trimmed:
-                    statistics["os"]["windows"]["unknown"].add(user)
-
-                if "ubuntu" in system_information_trimmed:
-                    statistics["os"]["linux"]["ubuntu"].add(user)
-                elif "fedora" in system_information_trimmed:
-                    statistics["os"]["linux"]["fedora"].add(user)
-                elif "debian" in system_information_trimmed:
-                    statistics["os"]["linux"]["debian"].add(user)
-                elif "mint" in system_information_trimmed:
-                    statistics["os"]["linux"]["mint"].add(user)
-                elif (
-                    "arch" in system_information_trimmed
-                    or "manjaro" in system_information_trimmed
-                    or "endeavor" in system_information_trimmed
-                    or "endeavour" in system_information_trimmed
-                ):
-                    statistics["os"]["linux"]["arch"].add(user)
-                elif "linux" in system_information_trimmed:
-                    statistics["os"]["linux"]["unknown"].add(user)
-
-                if "macos26" in system_information_trimmed or "macostahoe" in system_information_trimmed:
-                    statistics["os"]["macos"]["macos_26"].add(user)
-                elif "macos15" in system_information_trimmed or "macossequoia" in system_information_trimmed:
-                    statistics["os"]["macos"]["macos_15"].add(user)
-                elif "macos14" in system_information_trimmed or "macossonoma" in system_information_trimmed:
-                    statistics["os"]["macos"]["macos_14"].add(user)
-                elif "macos13" in system_information_trimmed or "macosventura" in system_information_trimmed:
-                    statistics["os"]["macos"]["macos_13"].add(user)
-                elif "macos12" in system_information_trimmed or "macosmonterey" in system_information_trimmed:
-                    statistics["os"]["macos"]["macos_12"].add(user)
-                elif "macos11" in system_information_trimmed or "macosbigsur" in system_information_trimmed:
-                    statistics["os"]["macos"]["macos_11"].add(user)
-                elif "macos10.15" in system_information_trimmed or "macoscatalina" in system_information_trimmed:
-                    statistics["os"]["macos"]["macos_10.15"].add(user)
-                elif "macos10.14" in system_information_trimmed or "macosmojave" in system_information_trimmed:
-                    statistics["os"]["macos"]["macos_10.14"].add(user)
-                elif "macos" in system_information_trimmed:
-                    statistics["os"]["macos"]["unknown"].add(user)
-
-                if "android16" in system_information_trimmed:
-                    statistics["os"]["android"]["android_16"].add(user)
-                elif "android15" in system_information_trimmed:
-                    statistics["os"]["android"]["android_15"].add(user)
-                elif "android14" in system_information_trimmed:
-                    statistics["os"]["android"]["android_14"].add(user)
-                elif "android13" in system_information_trimmed:
-                    statistics["os"]["android"]["android_13"].add(user)
-                elif "android12" in system_information_trimmed:
-                    statistics["os"]["android"]["android_12"].add(user)
-                elif "android11" in system_information_trimmed:
-                    statistics["os"]["android"]["android_11"].add(user)
-                elif "android10" in system_information_trimmed:
-                    statistics["os"]["android"]["android_10"].add(user)
-                elif "android9" in system_information_trimmed:
-                    statistics["os"]["android"]["android_9"].add(user)
-                elif "android8" in system_information_trimmed:
-                    statistics["os"]["android"]["android_8"].add(user)
-                elif "android7" in system_information_trimmed:
-                    statistics["os"]["android"]["android_7"].add(user)
-                elif "android" in system_information_trimmed:
-                    statistics["os"]["android"]["unknown"].add(user)
-
-                if "ios26" in system_information_trimmed:
-                    statistics["os"]["ios"]["ios_26"].add(user)
-                elif "ios18" in system_information_trimmed:
-                    statistics["os"]["ios"]["ios_18"].add(user)
-                elif "ios17" in system_information_trimmed:
-                    statistics["os"]["ios"]["ios_17"].add(user)
-                elif "ios16" in system_information_trimmed:
-                    statistics["os"]["ios"]["ios_16"].add(user)
-                elif "ios15" in system_information_trimmed:
-                    statistics["os"]["ios"]["ios_15"].add(user)
-                elif "ios14" in system_information_trimmed:
-                    statistics["os"]["ios"]["ios_14"].add(user)
-                elif "ios13" in system_information_trimmed:
-                    statistics["os"]["ios"]["ios_13"].add(user)
-                elif "ios12" in system_information_trimmed:
-                    statistics["os"]["ios"]["ios_12"].add(user)
-                elif "ios" in system_information_trimmed:
-                    statistics["os"]["ios"]["unknown"].add(user)
-
-                if "firefox" in system_information_trimmed:
-                    statistics["os"]["web"]["firefox"].add(user)
-                elif "chrome" in system_information_trimmed:
-                    statistics["os"]["web"]["chrome"].add(user)
-                elif "opera" in system_information_trimmed:
-                    statistics["os"]["web"]["opera"].add(user)
-                elif "edge" in system_information_trimmed:
-                    statistics["os"]["web"]["edge"].add(user)
-                elif "safari" in system_information_trimmed:
-                    statistics["os"]["web"]["safari"].add(user)
-                elif "web" in system_information_trimmed:
-                    statistics["os"]["web"]["unknown"].add(user)
-
-                # TODO: Add laptop and Celeron/Pentium Intel CPUs.
-                # The Intel CPU detection considers -KS and -KF CPUs identical to -K,
-                # and -F identical to not having any suffix.
-                # (The -S suffix denotes a slightly higher CPU clock,
-                # while the -F suffix denotes a non-functional IGP.)
-                if (
-                    "ultra9285k" in system_information_trimmed
-                    or "ultra285k" in system_information_trimmed
-                    or "intel285k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["arrow_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["60,000-70,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif (
-                    "ultra9285" in system_information_trimmed
-                    or "ultra285" in system_information_trimmed
-                    or "intel285" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["arrow_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["50,000-60,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif (
-                    "ultra7265k" in system_information_trimmed
-                    or "ultra265k" in system_information_trimmed
-                    or "intel265k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["arrow_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["50,000-60,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif (
-                    "ultra7265" in system_information_trimmed
-                    or "ultra265" in system_information_trimmed
-                    or "intel265" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["arrow_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif (
-                    "ultra5245k" in system_information_trimmed
-                    or "ultra245k" in system_information_trimmed
-                    or "intel245k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["arrow_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif (
-                    "ultra5245" in system_information_trimmed
-                    or "ultra245" in system_information_trimmed
-                    or "intel245" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["arrow_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "ultra5235" in system_information_trimmed
-                    or "ultra235" in system_information_trimmed
-                    or "intel235" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["arrow_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "ultra5225" in system_information_trimmed
-                    or "ultra225" in system_information_trimmed
-                    or "intel225" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["arrow_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i914900k" in system_information_trimmed
-                    or "core14900k" in system_information_trimmed
-                    or "intel14900k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["60,000-70,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif (
-                    "i914900" in system_information_trimmed
-                    or "core14900" in system_information_trimmed
-                    or "intel14900" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i714700k" in system_information_trimmed
-                    or "core14700k" in system_information_trimmed
-                    or "intel14700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["20_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["50,000-60,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i714700" in system_information_trimmed
-                    or "core14700" in system_information_trimmed
-                    or "intel14700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["20_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i514600k" in system_information_trimmed
-                    or "core14600k" in system_information_trimmed
-                    or "intel14600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["14_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i514600" in system_information_trimmed
-                    or "core14600" in system_information_trimmed
-                    or "intel14600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["14_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i514,500" in system_information_trimmed
-                    or "core14,500" in system_information_trimmed
-                    or "intel14,500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["14_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i514400" in system_information_trimmed
-                    or "core14400" in system_information_trimmed
-                    or "intel14400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["10_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i314100" in system_information_trimmed
-                    or "core14100" in system_information_trimmed
-                    or "intel14100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i913900k" in system_information_trimmed
-                    or "core13900k" in system_information_trimmed
-                    or "intel13900k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["60,000-70,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif (
-                    "i913900" in system_information_trimmed
-                    or "core13900" in system_information_trimmed
-                    or "intel13900" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["24_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i713700k" in system_information_trimmed
-                    or "core13700k" in system_information_trimmed
-                    or "intel13700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i713700" in system_information_trimmed
-                    or "core13700" in system_information_trimmed
-                    or "intel13700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i513600k" in system_information_trimmed
-                    or "core13600k" in system_information_trimmed
-                    or "intel13600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["14_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i513600" in system_information_trimmed
-                    or "core13600" in system_information_trimmed
-                    or "intel13600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["14_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i513,500" in system_information_trimmed
-                    or "core13,500" in system_information_trimmed
-                    or "intel13,500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["14_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i513400" in system_information_trimmed
-                    or "core13400" in system_information_trimmed
-                    or "intel13400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["10_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i313100" in system_information_trimmed
-                    or "core13100" in system_information_trimmed
-                    or "intel13100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["raptor_lake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i912900k" in system_information_trimmed
-                    or "core12900k" in system_information_trimmed
-                    or "intel12900k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i912900" in system_information_trimmed
-                    or "core12900" in system_information_trimmed
-                    or "intel12900" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i712700k" in system_information_trimmed
-                    or "core12700k" in system_information_trimmed
-                    or "intel12700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif (
-                    "i712700" in system_information_trimmed
-                    or "core12700" in system_information_trimmed
-                    or "intel12700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i512600k" in system_information_trimmed
-                    or "core12600k" in system_information_trimmed
-                    or "intel12600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["10_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i512600" in system_information_trimmed
-                    or "core12600" in system_information_trimmed
-                    or "intel12600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i512500" in system_information_trimmed
-                    or "core12500" in system_information_trimmed
-                    or "intel12500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i512400" in system_information_trimmed
-                    or "core12400" in system_information_trimmed
-                    or "intel12400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i312300" in system_information_trimmed
-                    or "core12300" in system_information_trimmed
-                    or "intel12300" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i312100" in system_information_trimmed
-                    or "core12100" in system_information_trimmed
-                    or "intel12100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["alder_lake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i911900k" in system_information_trimmed
-                    or "core11900k" in system_information_trimmed
-                    or "intel11900k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["rocket_lake"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif (
-                    "i911900" in system_information_trimmed
-                    or "core11900" in system_information_trimmed
-                    or "intel11900" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["rocket_lake"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i711700k" in system_information_trimmed
-                    or "core11700k" in system_information_trimmed
-                    or "intel11700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["rocket_lake"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i711700" in system_information_trimmed
-                    or "core11700" in system_information_trimmed
-                    or "intel11700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["rocket_lake"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i511600k" in system_information_trimmed
-                    or "core11600k" in system_information_trimmed
-                    or "intel11600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["rocket_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i511600" in system_information_trimmed
-                    or "core11600" in system_information_trimmed
-                    or "intel11600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["rocket_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i511500" in system_information_trimmed
-                    or "core11500" in system_information_trimmed
-                    or "intel11500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["rocket_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i511400" in system_information_trimmed
-                    or "core11400" in system_information_trimmed
-                    or "intel11400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["rocket_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i910900k" in system_information_trimmed
-                    or "core10900k" in system_information_trimmed
-                    or "intel10900k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["10_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i910900" in system_information_trimmed
-                    or "core10900" in system_information_trimmed
-                    or "intel10900" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["10_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif (
-                    "i710700k" in system_information_trimmed
-                    or "core10700k" in system_information_trimmed
-                    or "intel10700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i710700" in system_information_trimmed
-                    or "core10700" in system_information_trimmed
-                    or "intel10700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i510600k" in system_information_trimmed
-                    or "core10600k" in system_information_trimmed
-                    or "intel10600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i510600" in system_information_trimmed
-                    or "core10600" in system_information_trimmed
-                    or "intel10600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i510500" in system_information_trimmed
-                    or "core10500" in system_information_trimmed
-                    or "intel10500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i510400" in system_information_trimmed
-                    or "core10400" in system_information_trimmed
-                    or "intel10400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i310300" in system_information_trimmed
-                    or "core10300" in system_information_trimmed
-                    or "intel10300" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i310100" in system_information_trimmed
-                    or "core10100" in system_information_trimmed
-                    or "intel10100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["comet_lake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i99900k" in system_information_trimmed
-                    or "core9900k" in system_information_trimmed
-                    or "intel9900k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i99900" in system_information_trimmed
-                    or "core9900" in system_information_trimmed
-                    or "intel9900" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i79700k" in system_information_trimmed
-                    or "core9700k" in system_information_trimmed
-                    or "intel9700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i79700" in system_information_trimmed
-                    or "core9700" in system_information_trimmed
-                    or "intel9700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i59600k" in system_information_trimmed
-                    or "core9600k" in system_information_trimmed
-                    or "intel9600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i59600" in system_information_trimmed
-                    or "core9600" in system_information_trimmed
-                    or "intel9600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i59500" in system_information_trimmed
-                    or "core9500" in system_information_trimmed
-                    or "intel9500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i59400" in system_information_trimmed
-                    or "core9400" in system_information_trimmed
-                    or "intel9400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i39350k" in system_information_trimmed
-                    or "core9350k" in system_information_trimmed
-                    or "intel9350k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i39300" in system_information_trimmed
-                    or "core9300" in system_information_trimmed
-                    or "intel9300" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i39100" in system_information_trimmed
-                    or "core9100" in system_information_trimmed
-                    or "intel9100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake_refresh"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i78700k" in system_information_trimmed
-                    or "core8700k" in system_information_trimmed
-                    or "intel8700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i78700" in system_information_trimmed
-                    or "core8700" in system_information_trimmed
-                    or "intel8700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i78086k" in system_information_trimmed
-                    or "core8086k" in system_information_trimmed
-                    or "intel8086k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i58600k" in system_information_trimmed
-                    or "core8600k" in system_information_trimmed
-                    or "intel8600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i58500" in system_information_trimmed
-                    or "core8500" in system_information_trimmed
-                    or "intel8500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i58400" in system_information_trimmed
-                    or "core8400" in system_information_trimmed
-                    or "intel8400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i38350k" in system_information_trimmed
-                    or "core8350k" in system_information_trimmed
-                    or "intel8350k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i38100" in system_information_trimmed
-                    or "core8100" in system_information_trimmed
-                    or "intel8100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["coffee_lake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i77700k" in system_information_trimmed
-                    or "core7700k" in system_information_trimmed
-                    or "intel7700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i77700" in system_information_trimmed
-                    or "core7700" in system_information_trimmed
-                    or "intel7700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i57600k" in system_information_trimmed
-                    or "core7600k" in system_information_trimmed
-                    or "intel7600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i57600" in system_information_trimmed
-                    or "core7600" in system_information_trimmed
-                    or "intel7600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i57500" in system_information_trimmed
-                    or "core7500" in system_information_trimmed
-                    or "intel7500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i57400" in system_information_trimmed
-                    or "core7400" in system_information_trimmed
-                    or "intel7400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i37350k" in system_information_trimmed
-                    or "core7350k" in system_information_trimmed
-                    or "intel7350k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i37300" in system_information_trimmed
-                    or "core7300" in system_information_trimmed
-                    or "intel7300" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i37100" in system_information_trimmed
-                    or "core7100" in system_information_trimmed
-                    or "intel7100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i76700k" in system_information_trimmed
-                    or "core6700k" in system_information_trimmed
-                    or "intel6700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif (
-                    "i76700" in system_information_trimmed
-                    or "core6700" in system_information_trimmed
-                    or "intel6700" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i56600k" in system_information_trimmed
-                    or "core6600k" in system_information_trimmed
-                    or "intel6600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i56600" in system_information_trimmed
-                    or "core6600" in system_information_trimmed
-                    or "intel6600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i56500" in system_information_trimmed
-                    or "core6500" in system_information_trimmed
-                    or "intel6500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i56400" in system_information_trimmed
-                    or "core6400" in system_information_trimmed
-                    or "intel6400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i36300" in system_information_trimmed
-                    or "core6300" in system_information_trimmed
-                    or "intel6300" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i36100" in system_information_trimmed
-                    or "core6100" in system_information_trimmed
-                    or "intel6100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["skylake"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i74790k" in system_information_trimmed
-                    or "core4790k" in system_information_trimmed
-                    or "intel4790k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i74790" in system_information_trimmed
-                    or "core4790" in system_information_trimmed
-                    or "intel4790" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i74770k" in system_information_trimmed
-                    or "core4770k" in system_information_trimmed
-                    or "intel4770k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i74770" in system_information_trimmed
-                    or "core4770" in system_information_trimmed
-                    or "intel4770" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i54670k" in system_information_trimmed
-                    or "core4670k" in system_information_trimmed
-                    or "intel4670k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i54670" in system_information_trimmed
-                    or "core4670" in system_information_trimmed
-                    or "intel4670" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i54590" in system_information_trimmed
-                    or "core4590" in system_information_trimmed
-                    or "intel4590" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i54570" in system_information_trimmed
-                    or "core4570" in system_information_trimmed
-                    or "intel4570" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i54460" in system_information_trimmed
-                    or "core4460" in system_information_trimmed
-                    or "intel4460" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i54440" in system_information_trimmed
-                    or "core4440" in system_information_trimmed
-                    or "intel4440" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i54430" in system_information_trimmed
-                    or "core4430" in system_information_trimmed
-                    or "intel4430" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i34370" in system_information_trimmed
-                    or "core4370" in system_information_trimmed
-                    or "intel4370" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i34360" in system_information_trimmed
-                    or "core4360" in system_information_trimmed
-                    or "intel4360" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i34350" in system_information_trimmed
-                    or "core4350" in system_information_trimmed
-                    or "intel4350" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i34340" in system_information_trimmed
-                    or "core4340" in system_information_trimmed
-                    or "intel4340" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i34330" in system_information_trimmed
-                    or "core4330" in system_information_trimmed
-                    or "intel4330" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i34170" in system_information_trimmed
-                    or "core4170" in system_information_trimmed
-                    or "intel4170" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i34160" in system_information_trimmed
-                    or "core4160" in system_information_trimmed
-                    or "intel4160" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i34150" in system_information_trimmed
-                    or "core4150" in system_information_trimmed
-                    or "intel4150" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i34130" in system_information_trimmed
-                    or "core4130" in system_information_trimmed
-                    or "intel4130" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["haswell"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i73770k" in system_information_trimmed
-                    or "core3770k" in system_information_trimmed
-                    or "intel3770k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i73770" in system_information_trimmed
-                    or "core3770" in system_information_trimmed
-                    or "intel3770" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i53570k" in system_information_trimmed
-                    or "core3570k" in system_information_trimmed
-                    or "intel3570k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i53570" in system_information_trimmed
-                    or "core3570" in system_information_trimmed
-                    or "intel3570" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif (
-                    "i53550" in system_information_trimmed
-                    or "core3550" in system_information_trimmed
-                    or "intel3550" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i53470" in system_information_trimmed
-                    or "core3470" in system_information_trimmed
-                    or "intel3470" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i53450" in system_information_trimmed
-                    or "core3450" in system_information_trimmed
-                    or "intel3450" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i53340" in system_information_trimmed
-                    or "core3340" in system_information_trimmed
-                    or "intel3340" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i53330" in system_information_trimmed
-                    or "core3330" in system_information_trimmed
-                    or "intel3330" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i33250" in system_information_trimmed
-                    or "core3250" in system_information_trimmed
-                    or "intel3250" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i33240" in system_information_trimmed
-                    or "core3240" in system_information_trimmed
-                    or "intel3240" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i33220" in system_information_trimmed
-                    or "core3220" in system_information_trimmed
-                    or "intel3220" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i33210" in system_information_trimmed
-                    or "core3210" in system_information_trimmed
-                    or "intel3210" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["ivy_bridge"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i72700k" in system_information_trimmed
-                    or "core2700k" in system_information_trimmed
-                    or "intel2700k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i72600k" in system_information_trimmed
-                    or "core2600k" in system_information_trimmed
-                    or "intel2600k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i72600" in system_information_trimmed
-                    or "core2600" in system_information_trimmed
-                    or "intel2600" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i52,500k" in system_information_trimmed
-                    or "core2,500k" in system_information_trimmed
-                    or "intel2,500k" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i52,500" in system_information_trimmed
-                    or "core2,500" in system_information_trimmed
-                    or "intel2,500" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i52400" in system_information_trimmed
-                    or "core2400" in system_information_trimmed
-                    or "intel2400" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i52300" in system_information_trimmed
-                    or "core2300" in system_information_trimmed
-                    or "intel2300" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["<1,500"].add(user)
-                elif (
-                    "i32130" in system_information_trimmed
-                    or "core2130" in system_information_trimmed
-                    or "intel2130" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i32120" in system_information_trimmed
-                    or "core2120" in system_information_trimmed
-                    or "intel2120" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "i32100" in system_information_trimmed
-                    or "core2100" in system_information_trimmed
-                    or "intel2100" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["sandy_bridge"].add(user)
-                    statistics["cpu_core_count"]["2_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["<5,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["<1,500"].add(user)
-                elif (
-                    "intelcore" in system_information_trimmed
-                    or "inteli" in system_information_trimmed
-                    or "celeron" in system_information_trimmed
-                    or "pentium" in system_information_trimmed
-                    or "xeon" in system_information_trimmed
-                ):
-                    statistics["cpu"]["intel"]["unknown"].add(user)
-
-                # TODO: Add laptop AMD CPUs, Athlons and Threadrippers.
-                # NOTE: Unlike Intel CPUs, detection does not allow "amd<number>" as this syntax is used for GPUs instead.
-                #       There would be some ambiguities otherwise, such as Ryzen 5 7600 versus Radeon RX 7600.
-                if "ryzen99950x3d" in system_information_trimmed or "ryzen9950x3d" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_5"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"][">70,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif "ryzen99950x" in system_information_trimmed or "ryzen9950x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_5"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["60,000-70,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif "ryzen99900x3d" in system_information_trimmed or "ryzen9900x3d" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_5"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["50,000-60,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif "ryzen99900x" in system_information_trimmed or "ryzen9900x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_5"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["50,000-60,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif "ryzen79800x3d" in system_information_trimmed or "ryzen9800x3d" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_5"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif "ryzen79700x" in system_information_trimmed or "ryzen9700x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_5"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"][">4,500"].add(user)
-                elif "ryzen59600x" in system_information_trimmed or "ryzen9600x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_5"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen59600" in system_information_trimmed or "ryzen9600" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_5"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen97950x3d" in system_information_trimmed or "ryzen7950x3d" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["60,000-70,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen97950x" in system_information_trimmed or "ryzen7950x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["60,000-70,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen97900x3d" in system_information_trimmed or "ryzen7900x3d" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["50,000-60,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen97900x" in system_information_trimmed or "ryzen7900x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["50,000-60,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen97900" in system_information_trimmed or "ryzen7900" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen77800x3d" in system_information_trimmed or "ryzen7800x3d" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,500-4,000"].add(user)
-                elif "ryzen77700x" in system_information_trimmed or "ryzen7700x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen77700" in system_information_trimmed or "ryzen7700" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen57600x" in system_information_trimmed or "ryzen7600x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen57600" in system_information_trimmed or "ryzen7600" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_4"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx512"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["4,000-4,500"].add(user)
-                elif "ryzen95950x" in system_information_trimmed or "ryzen5950x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["40,000-50,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen95900x" in system_information_trimmed or "ryzen5900x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen95900" in system_information_trimmed or "ryzen5900" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen75800x3d" in system_information_trimmed or "ryzen5800x3d" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen75800x" in system_information_trimmed or "ryzen5800x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen75800" in system_information_trimmed or "ryzen5800" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen75700x" in system_information_trimmed or "ryzen5700x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen75700g" in system_information_trimmed or "ryzen5700g" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen75700" in system_information_trimmed or "ryzen5700" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen55600x" in system_information_trimmed or "ryzen5600x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen55600g" in system_information_trimmed or "ryzen5600g" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen55600" in system_information_trimmed or "ryzen5600" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_3"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen55500" in system_information_trimmed or "ryzen5500" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["3,000-3,500"].add(user)
-                elif "ryzen93950x" in system_information_trimmed or "ryzen3950x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["16_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif "ryzen93900x" in system_information_trimmed or "ryzen3900x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif "ryzen93900" in system_information_trimmed or "ryzen3900" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["12_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["30,000-40,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif "ryzen73800x" in system_information_trimmed or "ryzen3800x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif "ryzen73700x" in system_information_trimmed or "ryzen3700x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["20,000-30,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif "ryzen53600x" in system_information_trimmed or "ryzen3600x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif "ryzen53600" in system_information_trimmed or "ryzen3600" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif "ryzen33300x" in system_information_trimmed or "ryzen3300x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen_2"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,500-3,000"].add(user)
-                elif "ryzen72700x" in system_information_trimmed or "ryzen2700x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen72700" in system_information_trimmed or "ryzen2700" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen52600x" in system_information_trimmed or "ryzen2600x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen52600" in system_information_trimmed or "ryzen2600" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen52500x" in system_information_trimmed or "ryzen2500x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen52400g" in system_information_trimmed or "ryzen2400g" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen32300x" in system_information_trimmed or "ryzen2300x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen32200g" in system_information_trimmed or "ryzen2200g" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen71800x" in system_information_trimmed or "ryzen1800x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen71700x" in system_information_trimmed or "ryzen1700x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen71700" in system_information_trimmed or "ryzen1700" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["8_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen51600x" in system_information_trimmed or "ryzen1600x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen51600" in system_information_trimmed or "ryzen1600" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["6_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["10,000-20,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen51500x" in system_information_trimmed or "ryzen1500x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen51400" in system_information_trimmed or "ryzen1400" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif "ryzen31300x" in system_information_trimmed or "ryzen1300x" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["2,000-2,500"].add(user)
-                elif "ryzen31200" in system_information_trimmed or "ryzen1200" in system_information_trimmed:
-                    statistics["cpu"]["amd"]["zen+"].add(user)
-                    statistics["cpu_core_count"]["4_cores"].add(user)
-                    statistics["cpu_x86_features"]["avx2"].add(user)
-                    statistics["cpu_passmark_score"]["multi_thread"]["5,000-10,000"].add(user)
-                    statistics["cpu_passmark_score"]["single_thread"]["1,500-2,000"].add(user)
-                elif (
-                    "ryzen" in system_information_trimmed
-                    or "fx" in system_information_trimmed
-                    or "athlon" in system_information_trimmed
-                    or "phenom" in system_information_trimmed
-                    or "threadripper" in system_information_trimmed
-                    or "epyc" in system_information_trimmed
-                ):
-                    statistics["cpu"]["amd"]["unknown"].add(user)
+        cross_tab: Dict[str, Dict[str, int]] = {}
+        for row_key, row in zip(row_keys, counts.reshape(len(row_keys), len(column_keys))):
+            if row.any():
+                cross_tab[row_key] = {key: int(count) for key, count in zip(column_keys, row) if count > 0}
+        return cross_tab
 
-                # RTX models only scan for "tx" to allow for misspellings (e.g. "GTX 2070").
-                # NOTE: In this scanning, laptop GPUs are only separated from desktop GPUs since Ampere.
-                #       This may not be reliable in all cases if the user has removed the "Mobile"
-                #       or "Laptop" suffix from the model name.
-                if (
-                    "tx5090" in system_information_trimmed
-                    or "geforce5090" in system_information_trimmed
-                    or "nvidia5090" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["32_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"][">30,000"].add(user)
-                elif "5090laptop" in system_information_trimmed or "5090mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["24_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"][">30,000"].add(user)
-                elif (
-                    "tx5080" in system_information_trimmed
-                    or "geforce5080" in system_information_trimmed
-                    or "nvidia5080" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"][">30,000"].add(user)
-                elif "5080laptop" in system_information_trimmed or "5080mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "tx5070ti" in system_information_trimmed
-                    or "geforce5070ti" in system_information_trimmed
-                    or "nvidia5070ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"][">30,000"].add(user)
-                elif "5070tilaptop" in system_information_trimmed or "5070timobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "tx5070" in system_information_trimmed
-                    or "geforce5070" in system_information_trimmed
-                    or "nvidia5070" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif "5070laptop" in system_information_trimmed or "5070mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "tx5060ti" in system_information_trimmed
-                    or "geforce5060ti" in system_information_trimmed
-                    or "nvidia5060ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    # Assume 8 GB variant, which is much more widespread than the 16 GB one.
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "tx5060" in system_information_trimmed
-                    or "geforce5060" in system_information_trimmed
-                    or "nvidia5060" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif "5060laptop" in system_information_trimmed or "5060mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_blackwell"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx4090" in system_information_trimmed
-                    or "geforce4090" in system_information_trimmed
-                    or "nvidia4090" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["24_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"][">30,000"].add(user)
-                elif "4090laptop" in system_information_trimmed or "4090mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "tx4080" in system_information_trimmed
-                    or "geforce4080" in system_information_trimmed
-                    or "nvidia4080" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"][">30,000"].add(user)
-                elif "4080laptop" in system_information_trimmed or "4080mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "tx4070ti" in system_information_trimmed
-                    or "geforce4070ti" in system_information_trimmed
-                    or "nvidia4070ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"][">30,000"].add(user)
-                elif (
-                    "tx4070" in system_information_trimmed
-                    or "geforce4070" in system_information_trimmed
-                    or "nvidia4070" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif "4070laptop" in system_information_trimmed or "4070mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx4060ti" in system_information_trimmed
-                    or "geforce4060ti" in system_information_trimmed
-                    or "nvidia4060ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    # Assume 8 GB variant, which is much more widespread than the 16 GB one.
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "tx4060" in system_information_trimmed
-                    or "geforce4060" in system_information_trimmed
-                    or "nvidia4060" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif "4060laptop" in system_information_trimmed or "4060mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif "4050laptop" in system_information_trimmed or "4050mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx3090ti" in system_information_trimmed
-                    or "geforce3090ti" in system_information_trimmed
-                    or "nvidia3090ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["24_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "tx3090" in system_information_trimmed
-                    or "geforce3090" in system_information_trimmed
-                    or "nvidia3090" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["24_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "tx3080ti" in system_information_trimmed
-                    or "geforce3080ti" in system_information_trimmed
-                    or "nvidia3080ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["10_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif "3080tilaptop" in system_information_trimmed or "3080timobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "tx3080" in system_information_trimmed
-                    or "geforce3080" in system_information_trimmed
-                    or "nvidia3080" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    # Assume 8 GB variant, which is much more widespread than the 16 GB one.
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif "3080laptop" in system_information_trimmed or "3080mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx3070ti" in system_information_trimmed
-                    or "geforce3070ti" in system_information_trimmed
-                    or "nvidia3070ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif "3070tilaptop" in system_information_trimmed or "3070timobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx3070" in system_information_trimmed
-                    or "geforce3070" in system_information_trimmed
-                    or "nvidia3070" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif "3070laptop" in system_information_trimmed or "3070mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx3060ti" in system_information_trimmed
-                    or "geforce3060ti" in system_information_trimmed
-                    or "nvidia3060ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "tx3060" in system_information_trimmed
-                    or "geforce3060" in system_information_trimmed
-                    or "nvidia3060" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    # Assume 12 GB variant, which is much more widespread than the 8 GB one.
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif "3060laptop" in system_information_trimmed or "3060mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif "3050tilaptop" in system_information_trimmed or "3050timobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "tx3050" in system_information_trimmed
-                    or "geforce3050" in system_information_trimmed
-                    or "nvidia3050" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif "3050laptop" in system_information_trimmed or "3050mobile" in system_information_trimmed:
-                    statistics["gpu"]["nvidia"]["dedicated_ampere"].add(user)
-                    # Assume 4 GB variant, which is much more widespread than the 6 GB one.
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "tx2080ti" in system_information_trimmed
-                    or "geforce2080ti" in system_information_trimmed
-                    or "nvidia2080ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["11_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "tx2080super" in system_information_trimmed
-                    or "geforce2080super" in system_information_trimmed
-                    or "nvidia2080super" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["11_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx2080" in system_information_trimmed
-                    or "geforce2080" in system_information_trimmed
-                    or "nvidia2080" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx2070super" in system_information_trimmed
-                    or "geforce2070super" in system_information_trimmed
-                    or "nvidia2070super" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx2070" in system_information_trimmed
-                    or "geforce2070" in system_information_trimmed
-                    or "nvidia2070" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx2060super" in system_information_trimmed
-                    or "geforce2060super" in system_information_trimmed
-                    or "nvidia2060super" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "tx2060" in system_information_trimmed
-                    or "geforce2060" in system_information_trimmed
-                    or "nvidia2060" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    # Assume 6 GB variant, which is much more widespread than the 12 GB one.
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    # 6 GB variant is slower than the 12 GB one;
-                    # the 12 GB one is in the 15,000-20,000 performance bracket.
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx1660ti" in system_information_trimmed
-                    or "geforce1660ti" in system_information_trimmed
-                    or "nvidia1660ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx1660super" in system_information_trimmed
-                    or "geforce1660super" in system_information_trimmed
-                    or "nvidia1660super" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx1660" in system_information_trimmed
-                    or "geforce1660" in system_information_trimmed
-                    or "nvidia1660" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx1650super" in system_information_trimmed
-                    or "geforce1650super" in system_information_trimmed
-                    or "nvidia1650super" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx1650" in system_information_trimmed
-                    or "geforce1650" in system_information_trimmed
-                    or "nvidia1650" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx1630" in system_information_trimmed
-                    or "geforce1630" in system_information_trimmed
-                    or "nvidia1630" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_turing"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx1080ti" in system_information_trimmed
-                    or "geforce1080ti" in system_information_trimmed
-                    or "nvidia1080ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_pascal"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "gtx1080" in system_information_trimmed
-                    or "geforce1080" in system_information_trimmed
-                    or "nvidia1080" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_pascal"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "gtx1070ti" in system_information_trimmed
-                    or "geforce1070ti" in system_information_trimmed
-                    or "nvidia1070ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_pascal"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx1070" in system_information_trimmed
-                    or "geforce1070" in system_information_trimmed
-                    or "nvidia1070" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_pascal"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx1060" in system_information_trimmed
-                    or "geforce1060" in system_information_trimmed
-                    or "nvidia1060" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_pascal"].add(user)
-                    # Assume 6 GB variant, which is much more widespread than the 3 GB one.
-                    # This also applies to the Passmark score, as its 6 GB variant is faster
-                    # than the 3 GB thanks to additional CUDA cores.
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx1050ti" in system_information_trimmed
-                    or "geforce1050ti" in system_information_trimmed
-                    or "nvidia1050ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_pascal"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx1050" in system_information_trimmed
-                    or "geforce1050" in system_information_trimmed
-                    or "nvidia1050" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_pascal"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx980ti" in system_information_trimmed
-                    or "geforce980ti" in system_information_trimmed
-                    or "nvidia980ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_maxwell"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx980" in system_information_trimmed
-                    or "geforce980" in system_information_trimmed
-                    or "nvidia980" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_maxwell"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "gtx970" in system_information_trimmed
-                    or "geforce970" in system_information_trimmed
-                    or "nvidia970" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_maxwell"].add(user)
-                    # Count as a GPU with 3 GB of VRAM, since only 3.5 GB of VRAM
-                    # (out of 4 GB physically present) are full-speed on a GeForce GTX 970.
-                    statistics["gpu_vram"]["3_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx960" in system_information_trimmed
-                    or "geforce960" in system_information_trimmed
-                    or "nvidia960" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_maxwell"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx950" in system_information_trimmed
-                    or "geforce950" in system_information_trimmed
-                    or "nvidia950" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_maxwell"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx750ti" in system_information_trimmed
-                    or "geforce750ti" in system_information_trimmed
-                    or "nvidia750ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_maxwell"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx750" in system_information_trimmed
-                    or "geforce750" in system_information_trimmed
-                    or "nvidia750" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_maxwell"].add(user)
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx690" in system_information_trimmed
-                    or "geforce690" in system_information_trimmed
-                    or "nvidia690" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_kepler"].add(user)
-                    # Dual-GPU card; since Godot doesn't support multi-GPU,
-                    # only account for the VRAM and performance of a single GPU.
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx680" in system_information_trimmed
-                    or "geforce680" in system_information_trimmed
-                    or "nvidia680" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_kepler"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx670" in system_information_trimmed
-                    or "geforce670" in system_information_trimmed
-                    or "nvidia670" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_kepler"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "gtx660ti" in system_information_trimmed
-                    or "geforce660ti" in system_information_trimmed
-                    or "nvidia660ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_kepler"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx660" in system_information_trimmed
-                    or "geforce660" in system_information_trimmed
-                    or "nvidia660" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_kepler"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx650ti" in system_information_trimmed
-                    or "geforce650ti" in system_information_trimmed
-                    or "nvidia650ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_kepler"].add(user)
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx650" in system_information_trimmed
-                    or "geforce650" in system_information_trimmed
-                    or "nvidia650" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_kepler"].add(user)
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif (
-                    "gtx590" in system_information_trimmed
-                    or "geforce590" in system_information_trimmed
-                    or "nvidia590" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_fermi"].add(user)
-                    # Dual-GPU card; since Godot doesn't support multi-GPU,
-                    # only account for the VRAM and performance of a single GPU.
-                    # 1.5 GB of VRAM per GPU; round down to 1 GB.
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx580" in system_information_trimmed
-                    or "geforce580" in system_information_trimmed
-                    or "nvidia580" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_fermi"].add(user)
-                    # 1.5 GB of VRAM; round down to 1 GB.
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx570" in system_information_trimmed
-                    or "geforce570" in system_information_trimmed
-                    or "nvidia570" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_fermi"].add(user)
-                    # 1.25 GB of VRAM; round down to 1 GB.
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx560ti" in system_information_trimmed
-                    or "geforce560ti" in system_information_trimmed
-                    or "nvidia560ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_fermi"].add(user)
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx560" in system_information_trimmed
-                    or "geforce560" in system_information_trimmed
-                    or "nvidia560" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_fermi"].add(user)
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "gtx550ti" in system_information_trimmed
-                    or "geforce550ti" in system_information_trimmed
-                    or "nvidia550ti" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["dedicated_fermi"].add(user)
-                    statistics["gpu_vram"]["1_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif (
-                    "gt710" in system_information_trimmed
-                    or "geforce710" in system_information_trimmed
-                    or "nvidia710" in system_information_trimmed
-                ):
-                    # The GeForce GT 710 is a Fermi GPU despite being in the 700 series.
-                    statistics["gpu"]["nvidia"]["dedicated_fermi"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif (
-                    "nvidia" in system_information_trimmed
-                    or "quadro" in system_information_trimmed
-                    or "tesla" in system_information_trimmed
-                ):
-                    statistics["gpu"]["nvidia"]["unknown"].add(user)
 
-                if (
-                    "rx9070xt" in system_information_trimmed
-                    or "radeon9070xt" in system_information_trimmed
-                    or "amd9070xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna3"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "rx9070" in system_information_trimmed
-                    or "radeon9070" in system_information_trimmed
-                    or "amd9070" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna3"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "rx7900xtx" in system_information_trimmed
-                    or "radeon7900xtx" in system_information_trimmed
-                    or "amd7900xtx" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna3"].add(user)
-                    statistics["gpu_vram"]["24_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"][">30,000"].add(user)
-                elif (
-                    "rx7900xt" in system_information_trimmed
-                    or "radeon7900xt" in system_information_trimmed
-                    or "amd7900xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna3"].add(user)
-                    statistics["gpu_vram"]["20_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "rx7600" in system_information_trimmed
-                    or "radeon7600" in system_information_trimmed
-                    or "amd7600" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna3"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "rx6950xt" in system_information_trimmed
-                    or "radeon6950xt" in system_information_trimmed
-                    or "amd6950xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "rx6900xt" in system_information_trimmed
-                    or "radeon6900xt" in system_information_trimmed
-                    or "amd6900xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "rx6800xt" in system_information_trimmed
-                    or "radeon6800xt" in system_information_trimmed
-                    or "amd6800xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["25,000-30,000"].add(user)
-                elif (
-                    "rx6800" in system_information_trimmed
-                    or "radeon6800" in system_information_trimmed
-                    or "amd6800" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "rx6750xt" in system_information_trimmed
-                    or "radeon6750xt" in system_information_trimmed
-                    or "amd6750xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["20,000-25,000"].add(user)
-                elif (
-                    "rx6700xt" in system_information_trimmed
-                    or "radeon6700xt" in system_information_trimmed
-                    or "amd6700xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "rx6700" in system_information_trimmed
-                    or "radeon6700" in system_information_trimmed
-                    or "amd6700" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["10_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "rx6650xt" in system_information_trimmed
-                    or "radeon6650xt" in system_information_trimmed
-                    or "amd6650xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "rx6600xt" in system_information_trimmed
-                    or "radeon6600xt" in system_information_trimmed
-                    or "amd6600xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "rx6600" in system_information_trimmed
-                    or "radeon6600" in system_information_trimmed
-                    or "amd6600" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "rx6500xt" in system_information_trimmed
-                    or "radeon6500xt" in system_information_trimmed
-                    or "amd6500xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "rx6400" in system_information_trimmed
-                    or "radeon6400" in system_information_trimmed
-                    or "amd6400" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna2"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "rx5700xt" in system_information_trimmed
-                    or "radeon5700xt" in system_information_trimmed
-                    or "amd5700xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna1"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif (
-                    "rx5700" in system_information_trimmed
-                    or "radeon5700" in system_information_trimmed
-                    or "amd5700" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna1"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "rx5600xt" in system_information_trimmed
-                    or "radeon5600xt" in system_information_trimmed
-                    or "amd5600xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna1"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "rx5600" in system_information_trimmed
-                    or "radeon5600" in system_information_trimmed
-                    or "amd5600" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna1"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "rx5500xt" in system_information_trimmed
-                    or "radeon5500xt" in system_information_trimmed
-                    or "amd5500xt" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna1"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "rx5500" in system_information_trimmed
-                    or "radeon5500" in system_information_trimmed
-                    or "amd5500" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_rdna1"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif "radeonvii" in system_information_trimmed:
-                    statistics["gpu"]["amd"]["dedicated_gcn5.0"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif "vega64" in system_information_trimmed:
-                    statistics["gpu"]["amd"]["dedicated_gcn5.0"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif "vega56" in system_information_trimmed:
-                    statistics["gpu"]["amd"]["dedicated_gcn5.0"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif (
-                    "rx590" in system_information_trimmed
-                    or "radeon590" in system_information_trimmed
-                    or "amd590" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_gcn4.0"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "rx580" in system_information_trimmed
-                    or "radeon580" in system_information_trimmed
-                    or "amd580" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_gcn4.0"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "rx570" in system_information_trimmed
-                    or "radeon570" in system_information_trimmed
-                    or "amd570" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_gcn4.0"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "rx560" in system_information_trimmed
-                    or "radeon560" in system_information_trimmed
-                    or "amd560" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_gcn4.0"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "rx550" in system_information_trimmed
-                    or "radeon550" in system_information_trimmed
-                    or "amd550" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_gcn4.0"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif (
-                    "rx480" in system_information_trimmed
-                    or "radeon480" in system_information_trimmed
-                    or "amd480" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_gcn4.0"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "rx470" in system_information_trimmed
-                    or "radeon470" in system_information_trimmed
-                    or "amd470" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_gcn4.0"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif (
-                    "rx460" in system_information_trimmed
-                    or "radeon460" in system_information_trimmed
-                    or "amd460" in system_information_trimmed
-                ):
-                    statistics["gpu"]["amd"]["dedicated_gcn4.0"].add(user)
-                    statistics["gpu_vram"]["2_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["no"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif "radeon" in system_information_trimmed or "firepro" in system_information_trimmed:
-                    statistics["gpu"]["amd"]["unknown"].add(user)
-
-                if "b580" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_battlemage"].add(user)
-                    statistics["gpu_vram"]["12_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["15,000-20,000"].add(user)
-                elif "b570" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_battlemage"].add(user)
-                    statistics["gpu_vram"]["10_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["10,000-15,000"].add(user)
-                elif "a780" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_alchemist"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif "a770" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_alchemist"].add(user)
-                    statistics["gpu_vram"]["16_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif "a750" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_alchemist"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif "a580" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_alchemist"].add(user)
-                    statistics["gpu_vram"]["8_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["5,000-10,000"].add(user)
-                elif "a380" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_alchemist"].add(user)
-                    statistics["gpu_vram"]["6_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif "a350" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_alchemist"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif "a310" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["dedicated_arc_alchemist"].add(user)
-                    statistics["gpu_vram"]["4_gb"].add(user)
-                    statistics["gpu_raytracing"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_vrs"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["dedicated"]["yes"].add(user)
-                    statistics["gpu_passmark_score"]["2,500-5,000"].add(user)
-                elif "uhd770" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen12"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "uhd750" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen12"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "uhd730" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen12"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "uhd710" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen12"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["yes"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "irisplus655" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "irisplus645" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "uhd630" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "uhd620" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "uhd617" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "uhd615" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "uhd610" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "irisplus650" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "irisplus640" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd630" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd620" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd615" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd610" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif (
-                    "iris580" in system_information_trimmed
-                ):  # Originally "irispro580", but we stripped "pro" to make parsing Ryzen PRO easier.
-                    statistics["gpu"]["intel"]["integrated_gen9"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "iris550" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "iris540" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd530" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd520" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd515" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd510" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen9"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif (
-                    "iris6200" in system_information_trimmed
-                ):  # Originally "irispro6200", but we stripped "pro" to make parsing Ryzen PRO easier.
-                    statistics["gpu"]["intel"]["integrated_gen8"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "iris6100" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen8"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd6000" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen8"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd5600" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen8"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd5500" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen8"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd5300" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen8"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif (
-                    "iris5200" in system_information_trimmed
-                ):  # Originally "irispro5200", but we stripped "pro" to make parsing Ryzen PRO easier.
-                    statistics["gpu"]["intel"]["integrated_gen7.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "iris5100" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen7.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd5,000" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen7.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd4600" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen7.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd4400" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen7.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd4200" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen7.5"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd4,000" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen7"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd2,500" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen7"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd3000" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen6"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-                elif "hd2000" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["integrated_gen6"].add(user)
-                    statistics["gpu_raytracing"]["integrated"]["no"].add(user)
-                    statistics["gpu_vrs"]["integrated"]["no"].add(user)
-                    statistics["gpu_mesh_shaders"]["integrated"]["no"].add(user)
-                elif "irisxe" in system_information_trimmed or "intelhd" in system_information_trimmed:
-                    statistics["gpu"]["intel"]["unknown"].add(user)
-                    # Assume this is a slow GPU, as even high-end Iris Xe barely scratches
-                    # the 2,500 points mark as of June 2023.
-                    statistics["gpu_passmark_score"]["<2,500"].add(user)
-
-    statistics["num_reports"] = len(user_system_infos)
-    statistics["first_report_date"] = first_report_date
-    statistics["last_report_date"] = last_report_date
-    print(f"Number of scannable reports: {statistics['num_reports']}")
+def fit_cross_tabs(
+    cross_tabs: Dict[str, Dict[str, Dict[str, int]]], budget: int
+) -> Tuple[Dict[str, Dict[str, Dict[str, int]]], int]:
+    # Omits the cells with the fewest users from the cross-tabulations until their JSON representation
+    # fits in `budget` bytes. Returns the resulting cross-tabulations and the minimum number of users per cell.
+    def prune(min_users: int) -> Dict[str, Dict[str, Dict[str, int]]]:
+        pruned: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for name, cross_tab in cross_tabs.items():
+            pruned[name] = {}
+            for row_key, row in cross_tab.items():
+                cells = {column_key: count for column_key, count in row.items() if count >= min_users}
+                if cells:
+                    pruned[name][row_key] = cells
+        return pruned
 
-    output_path: Final = "statistics.json"
-    with open(output_path, "w") as out_file:
+    # The size only decreases as the threshold increases, so binary search the lowest threshold that fits.
+    thresholds: Final = sorted(
+        {count for cross_tab in cross_tabs.values() for row in cross_tab.values() for count in row.values()}
+    )
+    low = 0
+    high = len(thresholds)
+    while low < high:
+        middle = (low + high) // 2
+        if len(json.dumps(prune(thresholds[middle]))) <= budget:
+            high = middle
+        else:
+            low = middle + 1
+    min_users: Final = thresholds[low] if low < len(thresholds) else (thresholds[-1] + 1 if thresholds else 1)
+    return prune(min_users), min_users
+
+
+def stable_hash(value: str) -> int:
+    # Returns a 64-bit hash. Unlike `hash()`, it's the same across processes, so that sketches built
+    # on different machines can be merged and random samples can be reproduced.
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    # Estimates the number of distinct users added, using one byte per register (`2 ** precision` registers)
+    # regardless of the number of users. The relative standard error is about `1.04 / sqrt(2 ** precision)`.
+    # Sketches with the same precision are merged by keeping the maximum of each register.
+
+    def __init__(self, precision: int, registers: Optional[bytearray] = None) -> None:
+        self.precision = precision
+        self.registers = registers if registers is not None else bytearray(1 << precision)
+
+    def add(self, item_hash: int) -> None:
+        # The first bits of the 64-bit hash select a register, which keeps the longest run of leading zeros
+        # (plus one) seen in the remaining bits.
+        remaining_bits = 64 - self.precision
+        index = item_hash >> remaining_bits
+        rank = remaining_bits - (item_hash & ((1 << remaining_bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError(f"Can't merge sketches of precision {self.precision} and {other.precision}.")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> Tuple[int, int]:
+        # Returns the estimated number of distinct users, and the margin of error of the estimate at 95% confidence.
+        num_registers: Final = len(self.registers)
+        empty_registers: Final = self.registers.count(0)
+        inverse_sum: Final = sum(self.registers.count(rank) * 2.0**-rank for rank in range(66 - self.precision))
+        estimate = 0.7213 / (1 + 1.079 / num_registers) * num_registers**2 / inverse_sum
+        if estimate <= 2.5 * num_registers and empty_registers > 0:
+            # Small counts are estimated from the number of empty registers (linear counting),
+            # which is much more accurate. See Whang et al., "A linear-time probabilistic counting algorithm".
+            estimate = num_registers * math.log(num_registers / empty_registers)
+            load = estimate / num_registers
+            standard_error = math.sqrt(num_registers * (math.exp(load) - load - 1))
+        else:
+            standard_error = 1.04 / math.sqrt(num_registers) * estimate
+        return round(estimate), math.ceil(1.96 * standard_error)
+
+
+class SlidingWindow:
+    # Statistics over the `size` most recent issues, which can be updated as issues are added and expire.
+    # Sets of users can't tell whether a user has other reports left once a report is removed,
+    # so the number of reports in the window is counted for each (statistic, user) pair instead.
+    # Adding or removing an issue only touches the statistics it increments.
+
+    def __init__(self, leaves: List[StatisticPath], size: int) -> None:
+        self.leaves: Final = leaves
+        self.leaf_ids: Final = {path: leaf_id for leaf_id, path in enumerate(leaves)}
+        self.size: Final = size
+        # User and statistics of each issue in the window, from the oldest to the most recent.
+        # Issues that can't be scanned are kept as `None`, as they still take up a place in the window.
+        self.issues: Final["OrderedDict[int, Optional[Tuple[str, FrozenSet[int]]]]"] = OrderedDict()
+        # Number of reports in the window for each (statistic ID, user) pair.
+        self.report_counts: Final[Dict[Tuple[int, str], int]] = {}
+        # Number of distinct users for each statistic, indexed by statistic ID.
+        self.user_counts: Final = [0] * len(leaves)
+        self.num_reports = 0
+
+    def add(self, number: int, user: Optional[str], paths: List[StatisticPath]) -> List[int]:
+        # Adds an issue in the order of issue numbers (usually as the most recent one), then expires the oldest issues
+        # if the window is full. An issue older than all others in a full window expires right away.
+        # If the issue is already in the window (such as an edited issue), its report is replaced in place instead.
+        # `user` is `None` if the issue can't be scanned. Returns the numbers of the expired issues.
+        # Several tables can increment the same statistic, but a report only counts once.
+        report: Final = (user, frozenset(self.leaf_ids[path] for path in paths)) if user is not None else None
+        if number in self.issues:
+            self.count(self.issues[number], -1)
+            self.issues[number] = report
+        else:
+            # Issues delivered late (such as redelivered webhook events) are inserted before more recent issues.
+            newer: Final = []
+            for other in reversed(self.issues):
+                if other < number:
+                    break
+                newer.append(other)
+            self.issues[number] = report
+            for other in reversed(newer):
+                self.issues.move_to_end(other)
+        self.count(report, 1)
+
+        expired: Final = []
+        while len(self.issues) > self.size:
+            expired.append(next(iter(self.issues)))
+            self.remove(expired[-1])
+        return expired
+
+    def remove(self, number: int) -> None:
+        # Removes an issue from the window, if it's in the window.
+        if number in self.issues:
+            self.count(self.issues.pop(number), -1)
+
+    def count(self, report: Optional[Tuple[str, FrozenSet[int]]], delta: int) -> None:
+        # Adds (`delta` = 1) or removes (`delta` = -1) a report from the counts.
+        if report is None:
+            return
+
+        user, leaf_ids = report
+        self.num_reports += delta
+        for leaf_id in leaf_ids:
+            count = self.report_counts.get((leaf_id, user), 0) + delta
+            if count == 0:
+                del self.report_counts[(leaf_id, user)]
+                self.user_counts[leaf_id] -= 1
+            else:
+                self.report_counts[(leaf_id, user)] = count
+                if delta == 1 and count == 1:
+                    self.user_counts[leaf_id] += 1
+
+
+class ReportStore:
+    # Classified reports sorted by creation date, indexed to compute statistics for a subset of reports
+    # (such as a date range, or reports from Windows users with an NVIDIA GPU).
+
+    def __init__(self, leaves: List[StatisticPath], reports: List[Tuple[str, str, List[StatisticPath]]]) -> None:
+        # `reports` holds the creation date, user and detected statistics of each report.
+        self.leaves: Final = leaves
+        leaf_ids: Final = {path: leaf_id for leaf_id, path in enumerate(leaves)}
+        reports = sorted(reports, key=lambda report: report[0])
+        self.dates: Final = [date for date, _, _ in reports]
+        self.users: Final = [user for _, user, _ in reports]
+        self.report_leaves: Final = [tuple(sorted({leaf_ids[path] for path in paths})) for _, _, paths in reports]
+        # All statistics and groups of statistics that can be filtered on.
+        self.statistics: Final = {path[:depth] for path in leaves for depth in range(1, len(path) + 1)}
+        # Sorted indices of the reports that increment a statistic or any statistic in a group,
+        # such as `("os", "windows", "windows_11")` or `("os", "windows")`.
+        self.postings: Final[Dict[StatisticPath, List[int]]] = {}
+        for index, (_, _, paths) in enumerate(reports):
+            for prefix in {path[:depth] for path in paths for depth in range(1, len(path) + 1)}:
+                self.postings.setdefault(prefix, []).append(index)
+        # Results are cached per instance, as a store never changes once created.
+        self.query: Final = functools.lru_cache(maxsize=256)(self.compute_query)
+
+    def compute_query(
+        self, since: Optional[str], until: Optional[str], filters: Tuple[StatisticPath, ...]
+    ) -> Tuple[bytes, str]:
+        # Returns statistics in the format of `statistics.json` (and their ETag) for reports created between
+        # `since` and `until` (ISO 8601 dates or date prefixes, both inclusive) that increment all `filters`.
+        for statistic in filters:
+            if statistic not in self.statistics:
+                raise ValueError(f"Unknown statistic: {'/'.join(statistic)}")
+
+        start: Final = bisect.bisect_left(self.dates, since) if since else 0
+        # Any date starting with `until` sorts before `until` followed by the highest character.
+        end: Final = bisect.bisect_right(self.dates, until + "\uffff") if until else len(self.dates)
+        indices: Optional[Set[int]] = None
+        # Intersect the smallest sets of reports first.
+        for postings in sorted((self.postings.get(statistic, []) for statistic in filters), key=len):
+            low = bisect.bisect_left(postings, start)
+            high = bisect.bisect_left(postings, end)
+            indices = set(postings[low:high]) if indices is None else indices.intersection(postings[low:high])
+        selected: Final = sorted(indices) if indices is not None else range(start, end)
+
+        users: Final[List[Set[str]]] = [set() for _ in self.leaves]
+        for index in selected:
+            for leaf_id in self.report_leaves[index]:
+                users[leaf_id].add(self.users[index])
+
+        statistics: Final = create_statistics()
+        for path, leaf_users in zip(self.leaves, users):
+            get_statistic(statistics, path[:-1])[path[-1]] = len(leaf_users)
+        statistics["num_reports"] = len(selected)
+        # Dates of the oldest and most recent matching reports.
+        statistics["first_report_date"] = self.dates[selected[0]] if selected else None
+        statistics["last_report_date"] = self.dates[selected[-1]] if selected else None
+        body: Final = json.dumps(statistics).encode()
+        return body, f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+
+
+class StatisticsServer(ThreadingHTTPServer):
+    def __init__(self, address: Tuple[str, int], store: ReportStore) -> None:
+        super().__init__(address, StatisticsRequestHandler)
+        self.store: Final = store
+
+
+class StatisticsRequestHandler(BaseHTTPRequestHandler):
+    # Serves `GET /statistics?since=2024-01-01&until=2024-06-30&filter=os/windows&filter=gpu/nvidia`.
+    # All parameters are optional, and `filter` can be repeated.
+    server: StatisticsServer
+    # Keep connections alive between requests, and send responses without waiting for acknowledgements
+    # (headers and body are written separately).
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        url: Final = urlsplit(self.path)
+        if url.path != "/statistics":
+            self.send_error(404)
+            return
+
+        parameters: Final = parse_qs(url.query)
+        filters: Final = tuple(sorted({tuple(value.split("/")) for value in parameters.get("filter", [])}))
+        try:
+            body, etag = self.server.store.query(
+                parameters.get("since", [None])[0], parameters.get("until", [None])[0], filters
+            )
+        except ValueError as error:
+            self.send_error(400, str(error))
+            return
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+# Parsed once, rather than for every query.
+ISSUES_QUERY: Final = gql(
+    """
+    query($cursor: String, $pageSize: Int = 100) {
+        repository(owner: "godotengine", name: "godot") {
+            issues(last: $pageSize, orderBy: { direction: ASC, field: CREATED_AT }, before: $cursor) {
+                edges {
+                    cursor
+                    node {
+                        id
+                        number
+                        body
+                        createdAt
+                        updatedAt
+                        author {
+                            login
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+)
+
+# Lists the most recently updated issues. Bodies aren't requested, so that listing issues is cheap.
+UPDATED_ISSUES_QUERY: Final = gql(
+    """
+    query($cursor: String, $pageSize: Int = 100) {
+        repository(owner: "godotengine", name: "godot") {
+            issues(first: $pageSize, orderBy: { direction: DESC, field: UPDATED_AT }, after: $cursor) {
+                edges {
+                    cursor
+                    node {
+                        id
+                        number
+                        updatedAt
+                    }
+                }
+            }
+        }
+    }
+    """
+)
+
+# Fetches issues by node ID, in the same format as `ISSUES_QUERY`.
+ISSUE_NODES_QUERY: Final = gql(
+    """
+    query($ids: [ID!]!) {
+        nodes(ids: $ids) {
+            ... on Issue {
+                id
+                number
+                body
+                createdAt
+                updatedAt
+                author {
+                    login
+                }
+            }
+        }
+    }
+    """
+)
+
+
+# Limits of the GitHub GraphQL API, see
+# <https://docs.github.com/en/graphql/overview/rate-limits-and-query-limits-for-the-graphql-api>.
+# Maximum number of items requested by a single connection (`first` or `last` argument).
+MAX_CONNECTION_SIZE: Final = 100
+# Maximum number of nodes a single query may request.
+MAX_QUERY_NODES: Final = 500_000
+# Maximum number of results of a single search, even when following cursors.
+MAX_SEARCH_RESULTS: Final = 1_000
+# Maximum number of IDs accepted by `nodes(ids: ...)`.
+MAX_NODE_IDS: Final = 100
+# Number of issues requested by the first query of each poll in watch mode.
+WATCH_PAGE_SIZE: Final = 10
+# Maximum time between polls in watch mode after consecutive failed polls (in seconds).
+WATCH_MAX_BACKOFF: Final = 3600
+# Errors that make a poll fail in watch mode without stopping it: connection errors and timeouts,
+# and errors returned by the API (such as when the rate limit is exceeded).
+WATCH_POLL_ERRORS: Final = (aiohttp.ClientError, asyncio.TimeoutError, TransportError)
+
+# Search query matching the issues of the main Godot repository (in any state).
+ISSUES_SEARCH_QUERY: Final = "repo:godotengine/godot is:issue"
+# Fields requested for each issue found when searching.
+ISSUES_SEARCH_FIELDS: Final = """
+    issueCount
+    edges {
+        node {
+            ... on Issue {
+                id
+                number
+                body
+                createdAt
+                updatedAt
+                author {
+                    login
+                }
+            }
+        }
+    }
+    pageInfo {
+        endCursor
+        hasNextPage
+    }
+"""
+
+
+def issue_user(issue: Dict[str, Any]) -> str:
+    # Handle deleted ("ghost") users.
+    return issue["author"]["login"] if issue["author"] is not None else "ghost"
+
+
+def issue_system_information(issue: Dict[str, Any]) -> Optional[str]:
+    # Returns the system information of an issue, or `None` if the issue can't be scanned.
+    # Fix CRLF line endings causing issues with detection,
+    # as some issue reports use them instead of LF line endings.
+    body: Final[str] = issue["body"].replace("\r\n", "\n")
+    # Only issues reported with the issue template form can be scanned with this approach.
+    # This means issues reported before 2020 can't be scanned.
+    system_info_index: Final = body.find("### System information\n\n")
+    issue_description_index: Final = body.find("\n\n### Issue description")
+    if system_info_index == -1 or issue_description_index == -1:
+        return None
+
+    system_info_index_end: Final = system_info_index + len("### System information\n\n")
+    return body[system_info_index_end:issue_description_index]
+
+
+def match_issue(
+    issue: Dict[str, Any], detector: Detector, system_info_line_matcher: SystemInfoLineMatcher
+) -> Optional[Dict[int, Tuple[int, ...]]]:
+    # Returns the index of the matching entry for each table that matched the system information of an issue,
+    # or `None` if the issue can't be scanned.
+    system_information: Final = issue_system_information(issue)
+    if system_information is None:
+        return None
+    # Free-form system information is matched as a whole.
+    matches: Final = system_info_line_matcher.match(system_information)
+    return matches if matches is not None else detector.match(system_information)
+
+
+def add_issue_to_window(
+    issue: Dict[str, Any],
+    sliding_window: SlidingWindow,
+    issue_dates: Dict[int, str],
+    detector: Detector,
+    system_info_line_matcher: SystemInfoLineMatcher,
+) -> Optional[Dict[int, Tuple[int, ...]]]:
+    # Adds an issue to a sliding window (or replaces it) and keeps track of its creation date.
+    # Returns the entries matched by the issue, or `None` if it can't be scanned.
+    matches: Final = match_issue(issue, detector, system_info_line_matcher)
+    issue_dates[issue["number"]] = issue["createdAt"]
+    expired: Final = sliding_window.add(
+        issue["number"],
+        issue_user(issue) if matches is not None else None,
+        detector.paths(matches) if matches is not None else [],
+    )
+    for number in expired:
+        del issue_dates[number]
+    return matches
+
+
+def window_state_entry(sliding_window: SlidingWindow, issue_dates: Dict[int, str], number: int) -> List[Any]:
+    # Returns the number, creation date, user (`None` if it can't be scanned) and statistics of an issue in a window.
+    # Statistics are saved by path rather than by ID, so that statistics can be added in later versions.
+    report: Final = sliding_window.issues[number]
+    user, leaf_ids = report if report is not None else (None, frozenset())
+    return [number, issue_dates[number], user, sorted("/".join(sliding_window.leaves[leaf_id]) for leaf_id in leaf_ids)]
+
+
+def save_window(sliding_window: SlidingWindow, issue_dates: Dict[int, str], state_path: str) -> None:
+    # Saves the issues of a sliding window from the oldest to the most recent, replacing the journal.
+    issues: Final = [window_state_entry(sliding_window, issue_dates, number) for number in sliding_window.issues]
+    with open(f"{state_path}.tmp", "w") as state_file:
+        json.dump({"size": sliding_window.size, "issues": issues}, state_file)
+    os.replace(f"{state_path}.tmp", state_path)
+    if os.path.exists(f"{state_path}.log"):
+        os.remove(f"{state_path}.log")
+
+
+def append_to_window_journal(state_path: str, entry: List[Any]) -> None:
+    # Records a change made after the window was saved, which is much faster than saving the whole window.
+    # Entries are either a state entry (the issue was added or replaced), or only an issue number (it was removed).
+    # Replaying entries is idempotent, so the journal can be replayed on top of a more recent save.
+    with open(f"{state_path}.log", "a") as journal_file:
+        journal_file.write(json.dumps(entry) + "\n")
+
+
+def load_window(leaves: List[StatisticPath], state_path: str) -> Tuple[SlidingWindow, Dict[int, str]]:
+    # Loads a sliding window saved by `save_window()` and replays its journal,
+    # along with the creation date of each issue.
+    with open(state_path) as state_file:
+        state: Final = json.load(state_file)
+    entries: Final = state["issues"]
+    if os.path.exists(f"{state_path}.log"):
+        with open(f"{state_path}.log") as journal_file:
+            entries.extend(json.loads(line) for line in journal_file)
+
+    sliding_window: Final = SlidingWindow(leaves, state["size"])
+    issue_dates: Final[Dict[int, str]] = {}
+    for entry in entries:
+        if len(entry) == 1:
+            sliding_window.remove(entry[0])
+            issue_dates.pop(entry[0], None)
+            continue
+
+        number, created_at, user, paths = entry
+        # Statistics that don't exist anymore are ignored.
+        statistic_paths = [tuple(path.split("/")) for path in paths]
+        for expired in sliding_window.add(
+            number, user, [path for path in statistic_paths if path in sliding_window.leaf_ids]
+        ):
+            del issue_dates[expired]
+        issue_dates[number] = created_at
+    return sliding_window, issue_dates
+
+
+def write_statistics(statistics: Dict[str, Any], output_path: str) -> None:
+    # The file is replaced atomically, so that it can be served while statistics are being updated.
+    with open(f"{output_path}.tmp", "w") as out_file:
         # Serialize Python sets as their length as an integer, since we only need to know how many users
         # match each metric (and not who exactly).
         def set_default(obj: object) -> int:
@@ -3677,8 +2204,1348 @@ def main() -> None:
             raise TypeError
 
         json.dump(statistics, out_file, default=set_default)
+    os.replace(f"{output_path}.tmp", output_path)
+
+
+def add_sketch_estimates(statistics: Dict[str, Any], sketches: Dict[StatisticPath, HyperLogLog]) -> None:
+    # Replaces each statistic with the estimated number of users, and adds the margin of error of each estimate
+    # (at 95% confidence) to `count_errors`, with the same layout as the statistics.
+    count_errors: Final = create_statistics()
+    for path in statistic_leaves(count_errors):
+        estimate, error = sketches[path].estimate() if path in sketches else (0, 0)
+        get_statistic(statistics, path[:-1])[path[-1]] = estimate
+        get_statistic(count_errors, path[:-1])[path[-1]] = error
+    statistics["count_errors"] = count_errors
+
+
+def in_sample(user: str, seed: int, fraction: float) -> bool:
+    # Returns whether a user is part of a random sample of `fraction` of all users. The same users are sampled
+    # for a given seed regardless of the other users, so that samples are reproducible.
+    return stable_hash(f"{seed}:{user}") < fraction * 2**64
+
+
+def wilson_interval(successes: int, trials: int, finite_population_correction: float) -> Tuple[float, float]:
+    # Returns the 95% confidence interval of a proportion (Wilson score interval). The variance is scaled by the
+    # finite population correction, so that the interval narrows down to the proportion as the sample grows.
+    if trials == 0:
+        return 0.0, 1.0
+    z_squared: Final = 1.96**2 * finite_population_correction
+    proportion: Final = successes / trials
+    center: Final = (proportion + z_squared / (2 * trials)) / (1 + z_squared / trials)
+    margin: Final = math.sqrt(
+        z_squared * proportion * (1 - proportion) / trials + z_squared**2 / (4 * trials**2)
+    ) / (1 + z_squared / trials)
+    return max(center - margin, 0.0), min(center + margin, 1.0)
+
+
+def add_sample_estimates(statistics: Dict[str, Any], num_sampled_users: int, num_users: int) -> None:
+    # Replaces each statistic (a set of sampled users) with the number of users extrapolated from its share of
+    # the sampled users, and adds the 95% confidence interval of each estimate to `count_intervals`, with the same
+    # layout as the statistics.
+    count_intervals: Final = create_statistics()
+    finite_population_correction: Final = 1 - num_sampled_users / num_users if num_users > 0 else 0.0
+    for path in statistic_leaves(count_intervals):
+        num_sampled = len(get_statistic(statistics, path))
+        estimate = round(num_sampled / num_sampled_users * num_users) if num_sampled_users > 0 else 0
+        low, high = wilson_interval(num_sampled, num_sampled_users, finite_population_correction)
+        get_statistic(statistics, path[:-1])[path[-1]] = estimate
+        get_statistic(count_intervals, path[:-1])[path[-1]] = [
+            min(math.floor(low * num_users), estimate),
+            max(math.ceil(high * num_users), estimate),
+        ]
+    statistics["count_intervals"] = count_intervals
+
+
+def create_user_partial(reports: List[Tuple[str, str, List[StatisticPath]]]) -> Dict[str, Any]:
+    # Returns the users counted in each statistic by the given reports (creation date, user, statistics).
+    # Users are stored as their stable hash rather than their username, listed once, and referred to
+    # by their index in each statistic.
+    user_hashes: Final = {user: stable_hash(user) for _, user, _ in reports}
+    users: Final = sorted(set(user_hashes.values()))
+    user_ids: Final = {user: user_id for user_id, user in enumerate(users)}
+    statistic_users: Final[Dict[str, Set[int]]] = {}
+    for _, user, paths in reports:
+        for path in paths:
+            statistic_users.setdefault("/".join(path), set()).add(user_ids[user_hashes[user]])
+    return {
+        "num_reports": len(reports),
+        "users": users,
+        "statistics": {path: sorted(user_ids) for path, user_ids in sorted(statistic_users.items())},
+    }
+
+
+def create_sketch_partial(
+    sketches: Dict[StatisticPath, HyperLogLog], precision: int, num_reports: int
+) -> Dict[str, Any]:
+    # Returns the registers of the sketch of each statistic, compressed (as most registers are empty
+    # unless a statistic has many users) and encoded in Base64.
+    return {
+        "num_reports": num_reports,
+        "hll_precision": precision,
+        "sketches": {
+            "/".join(path): base64.b64encode(zlib.compress(sketch.registers)).decode()
+            for path, sketch in sorted(sketches.items())
+        },
+    }
+
+
+def write_partial(
+    partial: Dict[str, Any], first_report_date: Optional[str], last_report_date: Optional[str], partial_path: str
+) -> None:
+    # Unlike user counts, partial aggregates of disjoint sets of issues (such as date ranges fetched on
+    # different machines) can be merged with `merge_partials()` without counting users twice.
+    with open(f"{partial_path}.tmp", "w") as partial_file:
+        json.dump(
+            {"first_report_date": first_report_date, "last_report_date": last_report_date, **partial}, partial_file
+        )
+    os.replace(f"{partial_path}.tmp", partial_path)
+
+
+def merge_partials(leaves: List[StatisticPath], partial_paths: List[str]) -> Dict[str, Any]:
+    # Returns the statistics of all issues in the partial aggregates written by `write_partial()`,
+    # with each statistic as a set of hashed users (or an estimated count for sketches).
+    known_leaves: Final = set(leaves)
+    statistics: Final = create_statistics()
+    sketches: Final[Dict[StatisticPath, HyperLogLog]] = {}
+    precision: Optional[int] = None
+    num_reports = 0
+    first_report_dates: Final[List[str]] = []
+    last_report_dates: Final[List[str]] = []
+    for partial_index, partial_path in enumerate(partial_paths):
+        with open(partial_path) as partial_file:
+            partial = json.load(partial_file)
+        if partial_index == 0:
+            precision = partial.get("hll_precision")
+        elif partial.get("hll_precision") != precision:
+            raise ValueError(
+                f"{partial_path}: can't merge sets of users with sketches, or sketches of different precisions"
+            )
+
+        for path, value in (partial["statistics"] if precision is None else partial["sketches"]).items():
+            statistic_path = tuple(path.split("/"))
+            # Statistics that don't exist anymore are ignored.
+            if statistic_path not in known_leaves:
+                continue
+            if precision is None:
+                get_statistic(statistics, statistic_path).update(partial["users"][user_id] for user_id in value)
+            else:
+                sketch = HyperLogLog(precision, bytearray(zlib.decompress(base64.b64decode(value))))
+                if statistic_path in sketches:
+                    sketches[statistic_path].merge(sketch)
+                else:
+                    sketches[statistic_path] = sketch
+
+        num_reports += partial["num_reports"]
+        # Dates are `None` in partial aggregates of date ranges without issues.
+        if partial["first_report_date"] is not None:
+            first_report_dates.append(partial["first_report_date"])
+            last_report_dates.append(partial["last_report_date"])
+
+    if precision is not None:
+        add_sketch_estimates(statistics, sketches)
+    statistics["num_reports"] = num_reports
+    statistics["first_report_date"] = min(first_report_dates, default=None)
+    statistics["last_report_date"] = max(last_report_dates, default=None)
+    return statistics
+
+
+# Endpoint of the GitHub GraphQL API, unless `GODOT_ISSUES_STATS_GRAPHQL_URL` is set (such as to a local stand-in
+# to measure latency or test `watch` without a network connection).
+GRAPHQL_URL: Final = "https://api.github.com/graphql"
+
+
+def create_transport(token: Optional[str]) -> AIOHTTPTransport:
+    return AIOHTTPTransport(
+        url=os.getenv("GODOT_ISSUES_STATS_GRAPHQL_URL") or GRAPHQL_URL,
+        headers={"Authorization": f"Bearer {token}"},
+        ssl=True,
+        client_session_args={
+            # Idle connections are kept alive between queries. Responses are compressed,
+            # as aiohttp sends `Accept-Encoding: gzip, deflate` and decompresses responses by default.
+            "connector": aiohttp.TCPConnector(limit=4, keepalive_timeout=60, ttl_dns_cache=300),
+        },
+    )
+
+
+async def fetch_issue_pages(token: Optional[str], num_queries: int) -> List[Dict[str, Any]]:
+    # Returns `num_queries` pages of 100 issues, from the most recent to the oldest.
+    # All queries are sent over a single session, so that the connection (and its TLS handshake)
+    # is set up once instead of once per query.
+    results: Final = []
+    cursor = None
+    async with Client(transport=create_transport(token), fetch_schema_from_transport=True) as session:
+        # TODO: Retry requests a few times if they fail.
+        for i in range(num_queries):
+            print(f"Running query {i + 1}/{num_queries}...", end=" ", flush=True)
+            start = time.perf_counter()
+            # We're querying the first page, so we don't need to supply a valid cursor.
+            # GQL will take care of not submitting the variable if it's set to `None`.
+            result = await session.execute(GraphQLRequest(ISSUES_QUERY, variable_values={"cursor": cursor}))
+            print(f"{(time.perf_counter() - start) * 1000:.0f} ms")
+            results.append(result)
+            edges = result["repository"]["issues"]["edges"]
+            if not edges:
+                # There are no more issues (or none at all in a new repository).
+                break
+            # Get the cursor value of the last returned item, as we need it for subsequent requests (pagination).
+            cursor = edges[0]["cursor"]
+
+    return results
+
+
+class QueryCost(NamedTuple):
+    # Number of nodes requested, which is limited to `MAX_QUERY_NODES` per query.
+    nodes: int
+    # Rate limit points: each connection counts as one request, and every 100 requests cost one point.
+    # A query costs at least one point.
+    points: int
+
+
+def estimate_search_cost(sizes: List[int]) -> QueryCost:
+    # Returns the cost of a query made of one aliased `search` connection per item of `sizes`
+    # (each requesting that many issues, without nested connections).
+    return QueryCost(nodes=sum(sizes), points=max(1, (len(sizes) + 99) // 100))
+
+
+def batch_searches(sizes: List[int], max_nodes: int, max_points: int) -> List[List[int]]:
+    # Groups searches into as few queries as possible, so that the estimated cost of each query
+    # stays within `max_nodes` and `max_points`. Returns the indices of the searches in each query.
+    batches: Final[List[List[int]]] = [[]]
+    for index, size in enumerate(sizes):
+        cost = estimate_search_cost([sizes[other] for other in batches[-1]] + [size])
+        if batches[-1] and (cost.nodes > min(max_nodes, MAX_QUERY_NODES) or cost.points > max_points):
+            batches.append([])
+        batches[-1].append(index)
+    return batches if batches[0] else []
+
+
+class CreationRange(NamedTuple):
+    # Issues created between `start` and `end` (both inclusive, to the second).
+    start: datetime
+    end: datetime
+
+    def search_query(self) -> str:
+        return f"{ISSUES_SEARCH_QUERY} created:{self.start:%Y-%m-%dT%H:%M:%SZ}..{self.end:%Y-%m-%dT%H:%M:%SZ}"
+
+    def can_split(self) -> bool:
+        # Ranges of a single second can't be split any further.
+        return self.end > self.start
+
+    def split(self) -> Tuple["CreationRange", "CreationRange"]:
+        middle = self.start + (self.end - self.start) / 2
+        middle = middle.replace(microsecond=0)
+        return CreationRange(self.start, middle), CreationRange(middle + timedelta(seconds=1), self.end)
+
+
+async def search_issue_pages(
+    token: Optional[str],
+    num_issues: Optional[int],
+    max_nodes: int,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    max_points: int = 1,
+) -> List[Dict[str, Any]]:
+    # Returns the `num_issues` most recent issues created before `until` (or all issues created since `since`
+    # if `num_issues` is `None`) in pages of 100 issues, from the most recent to the oldest,
+    # in the same format as `fetch_issue_pages()`. Instead of following cursors one page at a time,
+    # issues are searched by creation date range. Many ranges are searched in a single query
+    # using aliases, so that the whole window is fetched in a handful of round trips.
+    async with Client(transport=create_transport(token), fetch_schema_from_transport=True) as session:
+
+        async def search(
+            ranges: List[CreationRange], sizes: List[int], fields: str, cursors: Optional[List[Optional[str]]] = None
+        ) -> List[Dict[str, Any]]:
+            # Runs one aliased `search` per range (after the given cursor of each range, if any),
+            # batched by estimated cost. Queries are sent concurrently.
+            batches = batch_searches(sizes, max_nodes, max_points)
+            print(f"Searching {len(ranges)} date ranges in {len(batches)} queries...", end=" ", flush=True)
+            start = time.perf_counter()
+            queries = []
+            for batch in batches:
+                searches = []
+                for index in batch:
+                    arguments = f"query: {json.dumps(ranges[index].search_query())}, type: ISSUE, first: {sizes[index]}"
+                    if cursors is not None and cursors[index] is not None:
+                        arguments += f", after: {json.dumps(cursors[index])}"
+                    searches.append(f"s{index}: search({arguments}) {{ {fields} }}")
+                queries.append(session.execute(gql("query {\n" + "\n".join(searches) + "\n}")))
+            results = await asyncio.gather(*queries)
+            print(f"{(time.perf_counter() - start) * 1000:.0f} ms")
+            return [result[f"s{index}"] for batch, result in zip(batches, results) for index in batch]
+
+        # Count issues created on each day, going back in time until there are enough issues.
+        # Counting only requests a single node per search, so many days can be counted in a single query.
+        counts: Final[List[Tuple[CreationRange, int]]] = []
+        end = (until - timedelta(seconds=1) if until is not None else datetime.now(timezone.utc)).replace(microsecond=0)
+        num_found = 0
+        while num_issues is None or num_found < num_issues:
+            ranges = []
+            for _ in range(MAX_CONNECTION_SIZE):
+                if since is not None and end < since:
+                    break
+                start = end - timedelta(days=1) + timedelta(seconds=1)
+                ranges.append(CreationRange(max(start, since) if since is not None else start, end))
+                end = start - timedelta(seconds=1)
+            if not ranges:
+                break
+            num_found_before = num_found
+            while ranges:
+                # Ranges with more issues than a connection can return are split in two and counted again.
+                too_large: List[CreationRange] = []
+                for creation_range, result in zip(ranges, await search(ranges, [1] * len(ranges), "issueCount")):
+                    if result["issueCount"] > MAX_CONNECTION_SIZE and creation_range.can_split():
+                        too_large.extend(creation_range.split())
+                    elif result["issueCount"] > 0:
+                        counts.append((creation_range, result["issueCount"]))
+                        num_found += result["issueCount"]
+                ranges = too_large
+            if since is None and num_found == num_found_before:
+                # There are no issues left.
+                break
+
+        # Ranges were counted from the most recent to the oldest (except for split ranges).
+        counts.sort(key=lambda count: count[0].start, reverse=True)
+        needed: Final = []
+        num_needed = 0
+        for creation_range, count in counts:
+            if num_issues is not None and num_needed >= num_issues:
+                break
+            needed.append((creation_range, count))
+            num_needed += count
+
+        # Ranges of a single second can't be split, but can still have more issues than a connection can return
+        # (such as issues created by a script). These are fetched one page after another by following their cursor,
+        # up to the number of results a search can return.
+        for creation_range, count in needed:
+            if count > MAX_SEARCH_RESULTS:
+                raise RuntimeError(
+                    f"{count} issues were created at {creation_range.start:%Y-%m-%dT%H:%M:%SZ}, but a search can only "
+                    f"return {MAX_SEARCH_RESULTS} issues created within the same second."
+                )
+        issues: Final[List[Dict[str, Any]]] = []
+        # Range, number of issues left to fetch and cursor of each range to search.
+        pending: List[Tuple[CreationRange, int, Optional[str]]] = [
+            (creation_range, count, None) for creation_range, count in needed
+        ]
+        while pending:
+            results = await search(
+                [creation_range for creation_range, _, _ in pending],
+                [min(count, MAX_CONNECTION_SIZE) for _, count, _ in pending],
+                ISSUES_SEARCH_FIELDS,
+                [cursor for _, _, cursor in pending],
+            )
+            next_pending = []
+            for (creation_range, count, _), result in zip(pending, results):
+                issues.extend(edge["node"] for edge in result["edges"])
+                if count > MAX_CONNECTION_SIZE and result["pageInfo"]["hasNextPage"]:
+                    next_pending.append((creation_range, count - MAX_CONNECTION_SIZE, result["pageInfo"]["endCursor"]))
+            pending = next_pending
+
+    # Match the order of pages returned by `fetch_issue_pages()`.
+    issues.sort(key=lambda issue: issue["createdAt"], reverse=True)
+    if num_issues is not None:
+        del issues[num_issues:]
+    pages: Final = []
+    for page_start in range(0, len(issues), MAX_CONNECTION_SIZE):
+        page_end = page_start + MAX_CONNECTION_SIZE
+        edges = [{"node": issue} for issue in reversed(issues[page_start:page_end])]
+        pages.append({"repository": {"issues": {"edges": edges}}})
+    return pages
+
+
+def window_statistics(sliding_window: SlidingWindow, issue_dates: Dict[int, str]) -> Dict[str, Any]:
+    # Returns the statistics of the issues in a sliding window, given the creation date of each issue.
+    statistics: Final = create_statistics()
+    for path, user_count in zip(sliding_window.leaves, sliding_window.user_counts):
+        get_statistic(statistics, path[:-1])[path[-1]] = user_count
+    statistics["num_reports"] = sliding_window.num_reports
+    statistics["first_report_date"] = issue_dates[next(iter(sliding_window.issues))] if sliding_window.issues else None
+    statistics["last_report_date"] = (
+        issue_dates[next(reversed(sliding_window.issues))] if sliding_window.issues else None
+    )
+    return statistics
+
+
+async def fetch_new_issues(session: Any, watermark: int) -> List[Dict[str, Any]]:
+    # Returns the issues with a number greater than `watermark`, from the oldest to the most recent.
+    # Only a few issues are reported between polls, so start with a small page.
+    new_issues: Final[List[Dict[str, Any]]] = []
+    cursor = None
+    page_size = WATCH_PAGE_SIZE
+    while True:
+        result = await session.execute(
+            GraphQLRequest(ISSUES_QUERY, variable_values={"cursor": cursor, "pageSize": page_size})
+        )
+        edges = result["repository"]["issues"]["edges"]
+        new_issues[:0] = [edge["node"] for edge in edges if edge["node"]["number"] > watermark]
+        if len(edges) < page_size or edges[0]["node"]["number"] <= watermark:
+            return new_issues
+        cursor = edges[0]["cursor"]
+        page_size = MAX_CONNECTION_SIZE
+
+
+async def fetch_edited_issues(
+    session: Any, issue_versions: Dict[int, Tuple[str, str]], updated_since: str
+) -> List[Dict[str, Any]]:
+    # Returns the issues in `issue_versions` (node ID and last update date of each issue, by number)
+    # that were updated after `updated_since` and since they were last fetched.
+    # Updated issues are listed without their body, then only these issues are fetched again in bulk.
+    ids: Final[List[str]] = []
+    cursor = None
+    page_size = WATCH_PAGE_SIZE
+    while True:
+        result = await session.execute(
+            GraphQLRequest(UPDATED_ISSUES_QUERY, variable_values={"cursor": cursor, "pageSize": page_size})
+        )
+        edges = result["repository"]["issues"]["edges"]
+        for edge in edges:
+            node = edge["node"]
+            # Issues that aren't in the window anymore (or not yet) are ignored.
+            if node["number"] in issue_versions and node["updatedAt"] > issue_versions[node["number"]][1]:
+                ids.append(node["id"])
+        if len(edges) < page_size or edges[-1]["node"]["updatedAt"] <= updated_since:
+            break
+        cursor = edges[-1]["cursor"]
+        page_size = MAX_CONNECTION_SIZE
+
+    edited_issues: Final[List[Dict[str, Any]]] = []
+    for ids_start in range(0, len(ids), MAX_NODE_IDS):
+        ids_end = ids_start + MAX_NODE_IDS
+        result = await session.execute(
+            GraphQLRequest(ISSUE_NODES_QUERY, variable_values={"ids": ids[ids_start:ids_end]})
+        )
+        # Issues deleted in the meantime are returned as `null`.
+        edited_issues.extend(node for node in result["nodes"] if node is not None)
+    return edited_issues
+
+
+async def watch_issues(
+    token: Optional[str],
+    interval: float,
+    sliding_window: SlidingWindow,
+    issue_dates: Dict[int, str],
+    issue_versions: Dict[int, Tuple[str, str]],
+    watermark: int,
+    detector: Detector,
+    system_info_line_matcher: SystemInfoLineMatcher,
+    output_path: str,
+) -> None:
+    # Every `interval` seconds, fetches the issues reported since the most recent issue in the window,
+    # adds them to the window (expiring the oldest issues) and rewrites the statistics if any count changed.
+    # Issues in the window that were edited since they were fetched (as their system information is often
+    # added or fixed after reporting) are fetched again and replace their previous version in the window.
+    # `issue_versions` holds the node ID and last update date of each issue in the window, and `watermark` is the
+    # most recent issue number fetched (0 if none). Either may be empty, such as for a repository without issues.
+    # If a poll fails (such as when the connection is lost or the rate limit is exceeded), nothing is changed
+    # and the next poll is delayed twice as long (up to `WATCH_MAX_BACKOFF`), then fetches the same issues again.
+    counts = (sliding_window.num_reports, list(sliding_window.user_counts))
+    updated_since = max(
+        (updated_at for _, updated_at in issue_versions.values()),
+        default=f"{datetime.now(timezone.utc):%Y-%m-%dT%H:%M:%SZ}",
+    )
+    delay = interval
+    async with Client(transport=create_transport(token), fetch_schema_from_transport=True) as session:
+        while True:
+            await asyncio.sleep(delay)
+            start = time.perf_counter()
+            # All issues are fetched before any is added to the window, so that a failed poll can be retried as is.
+            try:
+                # Issue numbers increase over time, so the most recent issue number is used as a watermark.
+                new_issues = await fetch_new_issues(session, watermark)
+                # Only issues in the window are fetched again, so there's nothing to list if the window is empty.
+                edited_issues = (
+                    await fetch_edited_issues(session, issue_versions, updated_since) if issue_versions else []
+                )
+            except WATCH_POLL_ERRORS as error:
+                delay = min(delay * 2, max(interval, WATCH_MAX_BACKOFF))
+                print(
+                    f"{datetime.now():%Y-%m-%d %H:%M:%S}: poll failed ({type(error).__name__}: {error}), "
+                    f"retrying in {delay:g} seconds"
+                )
+                continue
+            delay = interval
+
+            watermark = max([watermark] + [issue["number"] for issue in new_issues])
+            # Edited issues that expired because of new issues expire again right away.
+            for issue in new_issues + edited_issues:
+                add_issue_to_window(issue, sliding_window, issue_dates, detector, system_info_line_matcher)
+                issue_versions[issue["number"]] = (issue["id"], issue["updatedAt"])
+            for number in [number for number in issue_versions if number not in issue_dates]:
+                del issue_versions[number]
+            updated_since = max([updated_since] + [issue["updatedAt"] for issue in new_issues + edited_issues])
+
+            previous_counts = counts
+            counts = (sliding_window.num_reports, list(sliding_window.user_counts))
+            if counts != previous_counts:
+                write_statistics(window_statistics(sliding_window, issue_dates), output_path)
+            print(
+                f"{datetime.now():%Y-%m-%d %H:%M:%S}: {len(new_issues)} new issues, "
+                f"{len(edited_issues)} edited issues, "
+                f"{'wrote statistics to ' + output_path if counts != previous_counts else 'no changes'} "
+                f"({(time.perf_counter() - start) * 1000:.0f} ms)"
+            )
+
+
+class IssueEventIngester:
+    # Applies GitHub `issues` webhook events to a sliding window as they are received. After each event,
+    # the window is saved and statistics are rewritten if any count changed.
+
+    def __init__(
+        self,
+        sliding_window: SlidingWindow,
+        issue_dates: Dict[int, str],
+        detector: Detector,
+        system_info_line_matcher: SystemInfoLineMatcher,
+        state_path: str,
+        output_path: str,
+    ) -> None:
+        self.sliding_window: Final = sliding_window
+        self.issue_dates: Final = issue_dates
+        self.detector: Final = detector
+        self.system_info_line_matcher: Final = system_info_line_matcher
+        self.state_path: Final = state_path
+        self.output_path: Final = output_path
+        self.counts = (sliding_window.num_reports, list(sliding_window.user_counts))
+        self.journal_length = 0
+
+    def apply(self, payload: Dict[str, Any]) -> str:
+        # Returns a description of what was done with the event.
+        action: Final = payload["action"]
+        number: Final = payload["issue"]["number"]
+        if action in ("deleted", "transferred"):
+            self.sliding_window.remove(number)
+            self.issue_dates.pop(number, None)
+            entry = [number]
+        elif action == "opened" or (action == "edited" and number in self.sliding_window.issues):
+            # Webhook payloads use the REST API format, convert them to the format used by GraphQL queries.
+            issue = {
+                "number": number,
+                "body": payload["issue"]["body"] or "",
+                "createdAt": payload["issue"]["created_at"],
+                "author": {"login": payload["issue"]["user"]["login"]} if payload["issue"]["user"] else None,
+            }
+            add_issue_to_window(
+                issue, self.sliding_window, self.issue_dates, self.detector, self.system_info_line_matcher
+            )
+            if number not in self.sliding_window.issues:
+                # The issue is older than all issues in the window (such as a late delivery of an old event).
+                return f"#{number} {action}: older than the window, ignored"
+            entry = window_state_entry(self.sliding_window, self.issue_dates, number)
+        else:
+            # Other actions (such as closing an issue) don't affect statistics,
+            # and edits to issues outside the window are ignored.
+            return f"#{number} {action}: ignored"
+
+        # Save the whole window once the journal gets as long as the window.
+        self.journal_length += 1
+        if self.journal_length < self.sliding_window.size:
+            append_to_window_journal(self.state_path, entry)
+        else:
+            save_window(self.sliding_window, self.issue_dates, self.state_path)
+            self.journal_length = 0
+
+        previous_counts: Final = self.counts
+        self.counts = (self.sliding_window.num_reports, list(self.sliding_window.user_counts))
+        if self.counts == previous_counts:
+            return f"#{number} {action}: no changes"
+        write_statistics(window_statistics(self.sliding_window, self.issue_dates), self.output_path)
+        return f"#{number} {action}: wrote statistics to {self.output_path}"
+
+
+class WebhookServer(HTTPServer):
+    # Events are handled one at a time, as they modify the same sliding window.
+    def __init__(self, address: Tuple[str, int], ingester: IssueEventIngester, secret: Optional[str]) -> None:
+        super().__init__(address, WebhookRequestHandler)
+        self.ingester: Final = ingester
+        self.secret: Final = secret
+
+
+def webhook_signature(secret: str, body: bytes) -> str:
+    # Value of the `X-Hub-Signature-256` header sent by GitHub with webhook deliveries.
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+# Format of the `X-Hub-Signature-256` header. Other values (including non-ASCII ones) are rejected
+# before comparing signatures.
+WEBHOOK_SIGNATURE_REGEX: Final = re.compile(r"sha256=[0-9a-f]{64}")
+
+
+class WebhookRequestHandler(BaseHTTPRequestHandler):
+    # Receives GitHub webhook deliveries with `POST /webhook`.
+    server: WebhookServer
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        if urlsplit(self.path).path != "/webhook":
+            self.send_error(404)
+            return
+
+        body: Final = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.server.secret is not None:
+            signature = self.headers.get("X-Hub-Signature-256")
+            if signature is None:
+                self.send_error(401, "Missing signature")
+                return
+            if not WEBHOOK_SIGNATURE_REGEX.fullmatch(signature):
+                self.send_error(400, "Malformed signature")
+                return
+            if not hmac.compare_digest(webhook_signature(self.server.secret, body).encode(), signature.encode()):
+                self.send_error(401, "Invalid signature")
+                return
+
+        start: Final = time.perf_counter()
+        event: Final = self.headers.get("X-GitHub-Event")
+        message = f"{event} event: ignored"
+        if event == "issues":
+            try:
+                message = self.server.ingester.apply(json.loads(body))
+            except (KeyError, TypeError, ValueError) as error:
+                self.send_error(400, f"Invalid payload: {error!r}")
+                return
+        message += f" ({(time.perf_counter() - start) * 1000:.1f} ms)"
+        print(message)
+
+        response: Final = message.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+
+def replay_webhooks(payload_paths: List[str], port: int, secret: Optional[str]) -> None:
+    # Sends recorded `issues` webhook payloads (one JSON file per delivery, in order)
+    # to the webhook server running on `port`, to test it without GitHub.
+    connection: Final = http.client.HTTPConnection("127.0.0.1", port)
+    for payload_path in payload_paths:
+        with open(payload_path, "rb") as payload_file:
+            body = payload_file.read()
+        headers = {"Content-Type": "application/json", "X-GitHub-Event": "issues"}
+        if secret is not None:
+            headers["X-Hub-Signature-256"] = webhook_signature(secret, body)
+        start = time.perf_counter()
+        connection.request("POST", "/webhook", body, headers)
+        response = connection.getresponse()
+        message = response.read().decode()
+        print(f"{payload_path}: {response.status} {message} ({(time.perf_counter() - start) * 1000:.1f} ms round trip)")
+
+
+def serve_webhooks(ingester: IssueEventIngester, port: int, secret: Optional[str]) -> None:
+    if secret is None:
+        print("Warning: GODOT_ISSUES_STATS_WEBHOOK_SECRET is not set, webhook signatures won't be verified.")
+    print(f"Receiving webhooks at: http://127.0.0.1:{port}/webhook")
+    WebhookServer(("127.0.0.1", port), ingester, secret).serve_forever()
+
+
+# Normalized column headers of PassMark tables (or a part of them), and the score they hold.
+PASSMARK_COLUMNS: Final = (
+    ("cpumark", "passmark_multi_thread"),
+    ("singlethread", "passmark_single_thread"),
+    ("threadmark", "passmark_single_thread"),
+    ("g3dmark", "passmark_score"),
+)
+
+
+class HtmlTableParser(HTMLParser):
+    # Collects the text of every cell of every table row in an HTML page.
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows: List[List[str]] = []
+        self.cell: Optional[List[str]] = None
 
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "tr":
+            self.rows.append([])
+        elif tag in ("td", "th") and self.rows:
+            self.cell = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in ("td", "th") and self.cell is not None:
+            self.rows[-1].append(" ".join("".join(self.cell).split()))
+            self.cell = None
+
+    def handle_data(self, data: str) -> None:
+        if self.cell is not None:
+            self.cell.append(data)
+
+
+def read_passmark_scores(path: str) -> List[Tuple[str, str, int]]:
+    # Returns (attribute, model name, score) for every score of a CSV export or a saved HTML page
+    # of the tables of <https://www.cpubenchmark.net/> and <https://www.videocardbenchmark.net/>.
+    with open(path, encoding="utf-8-sig", errors="replace") as file:
+        text = file.read()
+    if text.lstrip().startswith("<"):
+        parser = HtmlTableParser()
+        parser.feed(text)
+        rows = parser.rows
+    else:
+        rows = list(csv.reader(text.splitlines()))
+
+    scores: List[Tuple[str, str, int]] = []
+    name_column: Optional[int] = None
+    score_columns: List[Tuple[int, str]] = []
+    for row in rows:
+        headers = [re.sub("[^a-z0-9]", "", cell.lower()) for cell in row]
+        columns = [
+            (column, attribute)
+            for column, header in enumerate(headers)
+            for part, attribute in PASSMARK_COLUMNS
+            if part in header
+        ]
+        if columns and any("name" in header for header in headers):
+            # Header row, which may be repeated by long tables.
+            name_column = next(column for column, header in enumerate(headers) if "name" in header)
+            score_columns = columns
+        elif name_column is not None and len(row) > max(column for column, _ in score_columns):
+            for column, attribute in score_columns:
+                score = row[column].replace(",", "").strip()
+                if score.isdigit():
+                    scores.append((attribute, row[name_column], int(score)))
+    return scores
+
+
+def join_passmark_scores(
+    blocks: Tuple[DetectionBlock, ...], scores: List[Tuple[str, str, int]]
+) -> Dict[Tuple[int, int, str], int]:
+    # Returns the score of each (table index, entry index, attribute) of the detection tables found in `scores`.
+    #
+    # Model names are normalized like system information, then their tokens are looked up in the model number
+    # index of the detector. Unlike detection, the longest pattern found wins (so that "RTX 4090 Laptop GPU"
+    # is the "4090laptop" entry rather than "tx4090"). When several models are the same entry
+    # (such as "i7-12700K" and "i7-12700KF"), the one whose name has the fewest other characters wins.
+    # Patterns must end where a word of the model name ends, so that variants such as "5600X3D" or "12700KF"
+    # are never the base model ("5600x" or "12700k") when the base model isn't in `scores`.
+    detector: Final = Detector(blocks)
+    best: Final[Dict[Tuple[int, int, str], Tuple[int, int]]] = {}
+    for attribute, name, score in scores:
+        name_trimmed = trim_system_information(name)
+        # Offsets in `name_trimmed` where a word of the name ends. Trademark symbols aren't words.
+        name_words = name.lower().replace("(r)", " ").replace("(tm)", " ")
+        word_ends = {
+            len(trim_system_information(name_words[: word.end()])) for word in re.finditer("[a-z0-9]+", name_words)
+        }
+        found: Optional[Tuple[int, int, int, int]] = None
+        for match in MODEL_NUMBER_REGEX.finditer(name_trimmed):
+            # Scores of unknown models must not be given to known models with a similar name.
+            for suffix, index, rank in detector.resolve_exact_token(*match.groups()):
+                pattern, entry_index = detector.rules[index][rank]
+                entry = blocks[index].entries[entry_index]
+                if (
+                    getattr(entry, attribute, None) is not None
+                    and name_trimmed.startswith(suffix, match.end())
+                    and match.end() + len(suffix) in word_ends
+                ):
+                    candidate = (len(pattern), -rank, index, entry_index)
+                    if found is None or candidate > found:
+                        found = candidate
+        if found is not None:
+            key = (found[2], found[3], attribute)
+            other_characters = len(name_trimmed) - found[0]
+            if other_characters < best.get(key, (other_characters + 1, 0))[0]:
+                best[key] = (other_characters, score)
+
+    return {key: score for key, (_, score) in best.items()}
+
+
+def rewrite_passmark_scores(
+    source: bytes, blocks: Tuple[DetectionBlock, ...], table_names: List[str], scores: Dict[Tuple[int, int, str], int]
+) -> bytes:
+    # Returns the source of this script with the given scores written in the detection tables.
+    # `table_names` are the names of the variables holding the entries of each table.
+    tables: Final = {
+        node.target.id: node.value.elts
+        for node in ast.parse(source).body
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and isinstance(node.value, ast.Tuple)
+    }
+    lines: Final = source.splitlines(keepends=True)
+    line_offsets: Final = [0]
+    for line in lines:
+        line_offsets.append(line_offsets[-1] + len(line))
+
+    edits: List[Tuple[int, int, bytes]] = []
+    for (index, entry_index, attribute), score in scores.items():
+        calls = tables[table_names[index]]
+        if len(calls) != len(blocks[index].entries):
+            raise ValueError(f"The entries of {table_names[index]} must all be written as calls.")
+        call = calls[entry_index]
+        assert isinstance(call, ast.Call)
+        position = type(blocks[index].entries[entry_index])._fields.index(attribute)
+        node = (
+            call.args[position]
+            if position < len(call.args)
+            else next(keyword.value for keyword in call.keywords if keyword.arg == attribute)
+        )
+        # Column offsets are in bytes, and the literal ends with the number.
+        literal = re.compile(rb"\d[\d_]*").match(lines[node.lineno - 1], node.col_offset)
+        if literal is None:
+            raise ValueError(f"The {attribute} of {table_names[index]}[{entry_index}] must be a number.")
+        start = line_offsets[node.lineno - 1]
+        edits.append((start + literal.start(), start + literal.end(), f"{score:_}".encode()))
+
+    for start, end, text in sorted(edits, reverse=True):
+        source = source[:start] + text + source[end:]
+    return source
+
+
+def import_passmark_scores(paths: List[str], script_path: str) -> None:
+    # Updates the PassMark scores of the detection tables in this script from the given exports.
+    scores: Final = [score for path in paths for score in read_passmark_scores(path)]
+    joined: Final = join_passmark_scores(DETECTION_BLOCKS, scores)
+    variables: Final = {id(value): name for name, value in globals().items() if isinstance(value, tuple)}
+    table_names: Final = [variables[id(block.entries)] for block in DETECTION_BLOCKS]
+
+    changed: Final = {
+        key: score
+        for key, score in joined.items()
+        if getattr(DETECTION_BLOCKS[key[0]].entries[key[1]], key[2]) != score
+    }
+    with open(script_path, "rb") as file:
+        source = file.read()
+    source = rewrite_passmark_scores(source, DETECTION_BLOCKS, table_names, changed)
+    with open(f"{script_path}.tmp", "wb") as file:
+        file.write(source)
+    os.replace(f"{script_path}.tmp", script_path)
+
+    missing: Final = [
+        "/".join(block.prefix) + f" {entry.patterns[0]} ({attribute})"
+        for index, block in enumerate(DETECTION_BLOCKS)
+        for entry_index, entry in enumerate(block.entries)
+        for attribute in ("passmark_multi_thread", "passmark_single_thread", "passmark_score")
+        if getattr(entry, attribute, None) is not None and (index, entry_index, attribute) not in joined
+    ]
+    print(
+        f"Read {len(scores)} scores from {len(paths)} files, found {len(joined)} scores of known models "
+        f"({len(changed)} changed)"
+    )
+    if missing:
+        print(f"Scores not found ({len(missing)}), left unchanged:")
+        for description in missing:
+            print(f"    {description}")
+
+
+def synthetic_catalog(
+    blocks: Tuple[DetectionBlock, ...], num_models: int, rng: random.Random
+) -> Tuple[DetectionBlock, ...]:
+    # Returns the detection tables with made-up models inserted at random positions of the CPU and GPU tables.
+    # Each made-up model copies the patterns and attributes of a real model of its table, with a 10-digit
+    # model number that no real model uses. Reports are then detected the same way with or without them.
+    hardware: Final = [index for index, block in enumerate(blocks) if block.prefix[0] in ("cpu", "gpu")]
+    tables: Final = {index: list(blocks[index].entries) for index in hardware}
+    for model in range(num_models):
+        index = hardware[model % len(hardware)]
+        gate = blocks[index].gate
+        template = rng.choice(blocks[index].entries)
+        patterns = tuple(
+            pattern
+            for pattern in (
+                MODEL_NUMBER_REGEX.sub(lambda match: f"{match.group(1)}99{model:08d}", pattern, count=1)
+                for pattern in template.patterns
+            )
+            if MODEL_NUMBER_REGEX.search(pattern) is not None and any(keyword in pattern for keyword in gate)
+        )
+        if patterns:
+            tables[index].insert(rng.randrange(len(tables[index])), template._replace(patterns=patterns))
+
+    return tuple(
+        block._replace(entries=tuple(tables[index])) if index in tables else block for index, block in enumerate(blocks)
+    )
+
+
+def synthetic_reports(blocks: Tuple[DetectionBlock, ...], num_reports: int, rng: random.Random) -> List[str]:
+    # Returns system information made of the patterns of an operating system, a CPU and a GPU.
+    tables: Final = {
+        category: [
+            pattern
+            for block in blocks
+            if block.prefix[0] == category
+            for entry in block.entries
+            for pattern in entry.patterns
+        ]
+        for category in ("os", "cpu", "gpu")
+    }
+    return [
+        f"godot v4.{rng.randrange(5)}.stable {rng.choice(tables['os'])} vulkan forward "
+        f"{rng.choice(tables['gpu'])} {rng.choice(tables['cpu'])}"
+        for _ in range(num_reports)
+    ]
+
+
+def benchmark_detection(num_models: int, num_reports: int, seed: int) -> None:
+    # Detects the same synthetic reports with catalogs of increasing size, showing that the cost
+    # of detecting a report doesn't depend on the number of known models.
+    rng: Final = random.Random(seed)
+    reports: Final = synthetic_reports(DETECTION_BLOCKS, num_reports, rng)
+    print(f"Detecting {num_reports} synthetic reports with up to {num_models} made-up models:")
+    expected: Optional[List[Dict[int, Tuple[Tuple[str, ...], ...]]]] = None
+    for size in sorted({0, num_models // 10, num_models}):
+        start = time.perf_counter()
+        blocks = synthetic_catalog(DETECTION_BLOCKS, size, rng)
+        detector = Detector(blocks)
+        compile_time = time.perf_counter() - start
+        start = time.perf_counter()
+        # Made-up models never match, so entry indices are compared by their patterns.
+        results = [
+            {
+                index: tuple(blocks[index].entries[entry_index].patterns for entry_index in entry_indices)
+                for index, entry_indices in detector.match(text).items()
+            }
+            for text in reports
+        ]
+        detection_time = time.perf_counter() - start
+        num_entries = sum(len(block.entries) for block in blocks)
+        print(
+            f"    {num_entries:>6} models: compiled in {compile_time * 1000:.0f} ms, "
+            f"{detection_time / num_reports * 1_000_000:.1f} µs per report"
+        )
+        if expected is None:
+            expected = results
+        elif results != expected:
+            raise RuntimeError(f"Made-up models changed detection results with {size} of them.")
+
+
+def utc_date(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+
+def main() -> None:
+    parser: Final = argparse.ArgumentParser(
+        description="Gather hardware and software statistics from the latest Godot issue reports."
+    )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("build", "watch", "serve", "webhook", "replay", "merge", "benchmark", "import"),
+        default="build",
+        help="`build` writes statistics once (default), `watch` then keeps polling for new issues "
+        "and updates statistics as they are reported, `serve` then answers statistics queries over HTTP, "
+        "`webhook` then updates statistics as GitHub `issues` webhook events are received, "
+        "`replay` sends recorded webhook payloads to a running `webhook` command, "
+        "`merge` writes statistics from partial aggregates written with --partial, "
+        "`benchmark` measures detection speed with catalogs of made-up models (without fetching issues), "
+        "`import` updates the PassMark scores of the detection tables in this script from exports of PassMark tables",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        metavar="FILE",
+        help="JSON files with recorded `issues` webhook payloads sent in order by `replay`, "
+        "partial aggregates combined by `merge`, or PassMark tables saved as CSV or HTML read by `import`",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=("sets", "numpy", "window", "hll"),
+        help="how statistics are aggregated: sets of users (default), a NumPy feature matrix, "
+        "report counts per user that allow issues to expire from a sliding window (default with `watch`), "
+        "or HyperLogLog sketches that estimate the number of users in constant memory",
+    )
+    parser.add_argument(
+        "--hll-precision",
+        type=int,
+        default=12,
+        metavar="BITS",
+        help="with --engine hll, each sketch has 2^BITS registers of one byte, "
+        "for a relative standard error of about 1.04/sqrt(2^BITS) (between 7 and 16, default: %(default)s)",
+    )
+    parser.add_argument(
+        "--sample",
+        type=float,
+        metavar="FRACTION",
+        help="only detect the statistics of the reports of a random sample of this fraction of users, "
+        "then extrapolate the number of users of each statistic from its share of the sampled users, "
+        "with 95%% confidence intervals written to `count_intervals`",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="with --sample and --bootstrap, the same seed always samples the same users, "
+        "and `benchmark` always generates the same models and reports (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--models",
+        type=int,
+        default=5_000,
+        help="number of made-up models added to the detection tables by `benchmark` (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cross-tab",
+        action="append",
+        default=[],
+        metavar="STATISTIC:STATISTIC",
+        help="also count users for every pair of values of two statistics, such as `gpu:os` or "
+        "`gpu_vram:cpu_passmark_score/multi_thread` (requires --engine numpy, can be repeated)",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        metavar="RESAMPLES",
+        help="also compute a 95%% confidence interval of each percentage shown on the website from this many "
+        "resamples of users (such as 2000), written to `share_intervals` (requires --engine numpy)",
+    )
+    parser.add_argument(
+        "--cross-tab-budget",
+        type=int,
+        default=20_000,
+        metavar="BYTES",
+        help="maximum size of the cross-tabulations in the JSON output, cells with the fewest users "
+        "are omitted to fit (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--fetch",
+        choices=("pages", "search"),
+        default="pages",
+        help="how issues are fetched: one page of 100 issues per query (default), "
+        "or by searching many date ranges per query",
+    )
+    parser.add_argument(
+        "--since",
+        type=utc_date,
+        metavar="YYYY-MM-DD",
+        help="fetch all issues created on or after this date (UTC) instead of the 3,000 latest issues "
+        "(requires --fetch search)",
+    )
+    parser.add_argument(
+        "--until",
+        type=utc_date,
+        metavar="YYYY-MM-DD",
+        help="only fetch issues created before this date (UTC) (requires --fetch search)",
+    )
+    parser.add_argument(
+        "--partial",
+        metavar="PATH",
+        help="also write the users counted in each statistic to PATH, so that builds of disjoint date ranges "
+        "can be combined with `merge` (without counting users twice)",
+    )
+    parser.add_argument(
+        "--batch-nodes",
+        type=int,
+        default=1_000,
+        metavar="NODES",
+        help="maximum number of issues requested by a single query with --fetch search (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=300,
+        metavar="SECONDS",
+        help="time between polls for new issues with `watch` (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="port to listen on with `serve` and `webhook` (on localhost only), "
+        "or to send payloads to with `replay` (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--state",
+        default="window.json",
+        metavar="PATH",
+        help="file where `webhook` saves issues and their statistics after each event, "
+        "and loads them from instead of fetching issues if it exists (default: %(default)s)",
+    )
+    args: Final = parser.parse_args()
+    engine: Final = args.engine or ("window" if args.command in ("watch", "webhook") else "sets")
+    if engine == "numpy" and not HAS_NUMPY:
+        parser.error("--engine numpy requires NumPy to be installed (`pip install numpy`)")
+    if args.command in ("watch", "webhook") and engine != "window":
+        parser.error(f"{args.command} requires --engine window")
+    if args.files and args.command not in ("replay", "merge", "import"):
+        parser.error("files can only be given to `replay`, `merge` and `import`")
+    if args.command == "merge" and not args.files:
+        parser.error("`merge` requires partial aggregates written with --partial")
+    if args.command == "import" and not args.files:
+        parser.error("`import` requires PassMark tables saved as CSV or HTML")
+    if args.cross_tab and engine != "numpy":
+        parser.error("--cross-tab requires --engine numpy")
+    if not 7 <= args.hll_precision <= 16:
+        parser.error("--hll-precision must be between 7 and 16")
+    if args.sample is not None and not 0 < args.sample <= 1:
+        parser.error("--sample must be greater than 0 and at most 1")
+    if args.sample is not None and (args.command != "build" or engine != "sets" or args.partial):
+        parser.error("--sample can only be used by `build` with --engine sets, and without --partial")
+    if args.bootstrap is not None and engine != "numpy":
+        parser.error("--bootstrap requires --engine numpy")
+    if args.bootstrap is not None and args.bootstrap < 1:
+        parser.error("--bootstrap must be at least 1")
+    if args.cross_tab and args.partial:
+        parser.error("--cross-tab can't be combined with --partial, as cross-tabulations can't be merged")
+    if engine == "numpy" and args.partial:
+        parser.error("--partial can't be used with --engine numpy, as percentiles and share intervals can't be merged")
+    if (args.since or args.until) and args.fetch != "search":
+        parser.error("--since and --until require --fetch search")
+
+    # Statistics are referred to by their path in the JSON output, with `/` as a separator.
+    leaves: Final = statistic_leaves(create_statistics())
+    cross_tab_dimensions: Final[List[Tuple[StatisticPath, StatisticPath]]] = []
+    for cross_tab in args.cross_tab:
+        dimensions = [tuple(dimension.split("/")) for dimension in cross_tab.split(":")]
+        if len(dimensions) != 2:
+            parser.error(f"--cross-tab: expected two statistics separated by `:`, got: {cross_tab}")
+        for dimension in dimensions:
+            depth = len(dimension)
+            if not any(len(path) > depth and path[:depth] == dimension for path in leaves):
+                parser.error(f"--cross-tab: unknown statistic: {'/'.join(dimension)}")
+        cross_tab_dimensions.append((dimensions[0], dimensions[1]))
+
+    if args.command == "import":
+        import_passmark_scores(args.files, os.path.realpath(__file__))
+        return
+
+    if args.command == "benchmark":
+        benchmark_detection(args.models, 20_000, args.seed)
+        return
+
+    if args.command == "replay":
+        load_dotenv()
+        replay_webhooks(args.files, args.port, os.getenv("GODOT_ISSUES_STATS_WEBHOOK_SECRET"))
+        return
+
+    # Unlike other files, partial aggregates are relative to the current directory.
+    partial_paths: Final = [os.path.abspath(path) for path in args.files]
+    partial_path: Final = os.path.abspath(args.partial) if args.partial is not None else None
+
+    # Change to the directory where the script is located,
+    # so that the script can be run from any location.
+    os.chdir(os.path.dirname(os.path.realpath(__file__)))
+
+    load_dotenv()
+    output_path: Final = "statistics.json"
+    webhook_secret: Final = os.getenv("GODOT_ISSUES_STATS_WEBHOOK_SECRET")
+
+    if args.command == "merge":
+        try:
+            merged_statistics = merge_partials(leaves, partial_paths)
+        except ValueError as error:
+            parser.error(str(error))
+        print(f"Merged {len(partial_paths)} partial aggregates ({merged_statistics['num_reports']} reports)")
+        write_statistics(merged_statistics, output_path)
+        print(f"Wrote statistics to: {output_path}")
+        return
+
+    if args.command == "webhook" and os.path.exists(args.state):
+        # Resume from the saved issues without fetching them again.
+        loaded_window, loaded_issue_dates = load_window(leaves, args.state)
+        save_window(loaded_window, loaded_issue_dates, args.state)
+        print(f"Loaded {len(loaded_window.issues)} issues from: {args.state}")
+        write_statistics(window_statistics(loaded_window, loaded_issue_dates), output_path)
+        loaded_detector = load_detector(DETECTION_BLOCKS, DETECTOR_CACHE_PATH)
+        serve_webhooks(
+            IssueEventIngester(
+                loaded_window,
+                loaded_issue_dates,
+                loaded_detector,
+                SystemInfoLineMatcher(loaded_detector),
+                args.state,
+                output_path,
+            ),
+            args.port,
+            webhook_secret,
+        )
+        return
+
+    # Get the 30×100 = 3,000 last issues.
+    token: Final = os.getenv("GODOT_ISSUES_STATS_GITHUB_TOKEN")
+    results: Final = asyncio.run(
+        search_issue_pages(token, None if args.since else 3_000, args.batch_nodes, args.since, args.until)
+        if args.fetch == "search"
+        else fetch_issue_pages(token, 30)
+    )
+    # There may be no issues at all (such as in a date range without any), in which case there are no dates.
+    pages: Final = [
+        result["repository"]["issues"]["edges"] for result in results if result["repository"]["issues"]["edges"]
+    ]
+    # Store the date and time of the most recent report.
+    # Reports are sorted by ascending date, so this is the last item in the first query.
+    last_report_date: Final[Optional[str]] = pages[0][-1]["node"]["createdAt"] if pages else None
+    # Store the date and time of the oldest report.
+    # Reports are sorted by ascending date, so this is the first item in the last query.
+    first_report_date: Final[Optional[str]] = pages[-1][0]["node"]["createdAt"] if pages else None
+
+    detector: Final = load_detector(DETECTION_BLOCKS, DETECTOR_CACHE_PATH)
+    system_info_line_matcher: Final = SystemInfoLineMatcher(detector)
+
+    num_reports = 0
+    statistics: Final = create_statistics()
+    feature_matrix: Final = FeatureMatrix(detector, statistic_leaves(statistics)) if engine == "numpy" else None
+
+    sliding_window: Final = (
+        SlidingWindow(
+            statistic_leaves(statistics),
+            # If no issues were fetched (such as in a new repository), keep as many as a default build fetches.
+            sum(len(result["repository"]["issues"]["edges"]) for result in results) or 30 * 100,
+        )
+        if engine == "window"
+        else None
+    )
+    # Sketch of the users counted in each statistic, created when the first user is counted.
+    sketches: Final[Optional[Dict[StatisticPath, HyperLogLog]]] = {} if engine == "hll" else None
+    # With --sample, users with scannable reports, and those of the sampled reports.
+    users: Final[Set[str]] = set()
+    sampled_users: Final[Set[str]] = set()
+    num_sampled_reports = 0
+    # Creation date of each issue in the sliding window.
+    issue_dates: Final[Dict[int, str]] = {}
+    # Creation date, user and statistics of each report for `serve` and --partial.
+    classified_reports: Final[List[Tuple[str, str, List[StatisticPath]]]] = []
+
+    # Issues are processed from the oldest to the most recent, so that the sliding window expires the oldest issues.
+    for result in reversed(results):
+        for node in result["repository"]["issues"]["edges"]:
+            user = issue_user(node["node"])
+            # Gather statistics for each issue reported.
+            if sliding_window is not None:
+                matches = add_issue_to_window(
+                    node["node"], sliding_window, issue_dates, detector, system_info_line_matcher
+                )
+            elif args.sample is not None and not in_sample(user, args.seed, args.sample):
+                # Users are sampled rather than reports, as a user is counted once for all their reports.
+                # Reports that aren't sampled are still counted, which doesn't require detection.
+                if issue_system_information(node["node"]) is not None:
+                    num_reports += 1
+                    users.add(user)
+                continue
+            else:
+                matches = match_issue(node["node"], detector, system_info_line_matcher)
+            if matches is None:
+                continue
+
+            num_reports += 1
+            if args.sample is not None:
+                num_sampled_reports += 1
+                users.add(user)
+                sampled_users.add(user)
+            if args.command == "serve" or (partial_path is not None and sketches is None):
+                classified_reports.append((node["node"]["createdAt"], user, detector.paths(matches)))
+            if feature_matrix is not None:
+                feature_matrix.add(user, matches)
+            elif sketches is not None:
+                item_hash = stable_hash(user)
+                for path in detector.paths(matches):
+                    if path not in sketches:
+                        sketches[path] = HyperLogLog(args.hll_precision)
+                    sketches[path].add(item_hash)
+            elif sliding_window is None:
+                for path in detector.paths(matches):
+                    get_statistic(statistics, path).add(user)
+
+    if sliding_window is not None:
+        for path, user_count in zip(sliding_window.leaves, sliding_window.user_counts):
+            get_statistic(statistics, path[:-1])[path[-1]] = user_count
+
+    if sketches is not None:
+        add_sketch_estimates(statistics, sketches)
+
+    if args.sample is not None:
+        add_sample_estimates(statistics, len(sampled_users), len(users))
+        statistics["sample"] = {
+            "fraction": args.sample,
+            "seed": args.seed,
+            "num_reports": num_sampled_reports,
+            "num_users": len(sampled_users),
+        }
+        print(
+            f"Detected a sample of {num_sampled_reports} of {num_reports} reports "
+            f"({len(sampled_users)} of {len(users)} users)"
+        )
+
+    if feature_matrix is not None:
+        statistics["percentiles"] = {
+            "/".join(path): feature_matrix.percentiles(path, (10, 25, 50, 75, 90))
+            for path, bins in NUMERIC_STATISTICS.items()
+            if bins.measured
+        }
+        for path, count in zip(feature_matrix.leaves, feature_matrix.count_users()):
+            get_statistic(statistics, path[:-1])[path[-1]] = int(count)
+
+        if cross_tab_dimensions:
+            cross_tabs, min_users = fit_cross_tabs(
+                {
+                    ":".join("/".join(dimension) for dimension in dimensions): feature_matrix.cross_tab(*dimensions)
+                    for dimensions in cross_tab_dimensions
+                },
+                args.cross_tab_budget,
+            )
+            statistics["cross_tabs"] = cross_tabs
+            statistics["cross_tabs_min_users"] = min_users
+            print(
+                f"Cross-tabulations: {len(cross_tabs)} ({len(json.dumps(cross_tabs))} bytes, "
+                f"cells with fewer than {min_users} users omitted)"
+            )
+
+        if args.bootstrap is not None:
+            start = time.perf_counter()
+            share_intervals = feature_matrix.bootstrap_shares(args.bootstrap, args.seed)
+            statistics["share_intervals"] = {
+                path: [round(low, 1), round(high, 1)] for path, (low, high) in share_intervals.items()
+            }
+            print(
+                f"Bootstrap confidence intervals: {len(share_intervals)} percentages, {args.bootstrap} resamples "
+                f"({(time.perf_counter() - start) * 1000:.0f} ms)"
+            )
+
+    statistics["num_reports"] = num_reports
+    statistics["first_report_date"] = first_report_date
+    statistics["last_report_date"] = last_report_date
+    print(f"Number of scannable reports: {statistics['num_reports']}")
+    system_info_line_matcher.print_statistics()
+    detector.print_dispatch_statistics()
+
+    write_statistics(statistics, output_path)
     print(f"Wrote statistics to: {output_path}")
+    if partial_path is not None:
+        write_partial(
+            (
+                create_sketch_partial(sketches, args.hll_precision, num_reports)
+                if sketches is not None
+                else create_user_partial(classified_reports)
+            ),
+            first_report_date,
+            last_report_date,
+            partial_path,
+        )
+        print(f"Wrote partial aggregate to: {partial_path}")
+
+    if args.command == "serve":
+        server: Final = StatisticsServer(("127.0.0.1", args.port), ReportStore(leaves, classified_reports))
+        print(f"Serving statistics queries at: http://127.0.0.1:{args.port}/statistics")
+        server.serve_forever()
+
+    if args.command == "webhook" and sliding_window is not None:
+        save_window(sliding_window, issue_dates, args.state)
+        serve_webhooks(
+            IssueEventIngester(
+                sliding_window, issue_dates, detector, system_info_line_matcher, args.state, output_path
+            ),
+            args.port,
+            webhook_secret,
+        )
+
+    if args.command == "watch" and sliding_window is not None:
+        print(f"Watching for new and edited issues every {args.interval:g} seconds...")
+        asyncio.run(
+            watch_issues(
+                token,
+                args.interval,
+                sliding_window,
+                issue_dates,
+                {
+                    edge["node"]["number"]: (edge["node"]["id"], edge["node"]["updatedAt"])
+                    for result in results
+                    for edge in result["repository"]["issues"]["edges"]
+                    if edge["node"]["number"] in issue_dates
+                },
+                max(
+                    (edge["node"]["number"] for result in results for edge in result["repository"]["issues"]["edges"]),
+                    default=0,
+                ),
+                detector,
+                system_info_line_matcher,
+                output_path,
+            )
+        )
 
 
 if __name__ == "__main__":
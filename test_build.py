@@ -0,0 +1,662 @@
+import asyncio
+import http.client
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import pytest
+
+import build
+from build import (
+    DETECTION_BLOCKS,
+    HAS_NUMPY,
+    ISSUES_QUERY,
+    UPDATED_ISSUES_QUERY,
+    CreationRange,
+    Detector,
+    FeatureMatrix,
+    HyperLogLog,
+    IssueEventIngester,
+    SlidingWindow,
+    StatisticPath,
+    SystemInfoLineMatcher,
+    WebhookServer,
+    add_issue_to_window,
+    add_sketch_estimates,
+    batch_searches,
+    create_sketch_partial,
+    create_statistics,
+    create_user_partial,
+    digit_deletions,
+    is_model_number_typo,
+    join_passmark_scores,
+    load_window,
+    merge_partials,
+    read_passmark_scores,
+    rewrite_passmark_scores,
+    save_window,
+    search_issue_pages,
+    stable_hash,
+    statistic_leaves,
+    system_information_words,
+    trim_system_information,
+    watch_issues,
+    webhook_signature,
+    window_statistics,
+    write_partial,
+)
+
+
+def opened_event(number: int, login: str) -> Dict[str, Any]:
+    # Returns the payload of an `issues` webhook event for a newly opened issue.
+    return {
+        "action": "opened",
+        "issue": {
+            "number": number,
+            "body": "### System information\n\nWindows 11 - NVIDIA GeForce RTX 4070\n\n### Issue description\n\nBroken.",
+            "created_at": f"2024-01-{number:02d}T00:00:00Z",
+            "user": {"login": login},
+        },
+    }
+
+
+def test_opened_events_delivered_out_of_order(tmp_path: Any) -> None:
+    leaves: List[Any] = statistic_leaves(create_statistics())
+    state_path = os.path.join(tmp_path, "window.json")
+    output_path = os.path.join(tmp_path, "statistics.json")
+    sliding_window = SlidingWindow(leaves, 3)
+    issue_dates: Dict[int, str] = {}
+    save_window(sliding_window, issue_dates, state_path)
+    detector = Detector(DETECTION_BLOCKS)
+    ingester = IssueEventIngester(
+        sliding_window, issue_dates, detector, SystemInfoLineMatcher(detector), state_path, output_path
+    )
+
+    for number in (10, 12, 13):
+        ingester.apply(opened_event(number, f"user{number}"))
+    # A late delivery is inserted by issue number, so the oldest issue expires instead of a more recent one.
+    ingester.apply(opened_event(11, "user11"))
+    assert list(sliding_window.issues) == [11, 12, 13]
+    ingester.apply(opened_event(14, "user14"))
+    assert list(sliding_window.issues) == [12, 13, 14]
+    # An issue older than all issues of a full window is ignored.
+    assert ingester.apply(opened_event(9, "user9")).endswith("ignored")
+    assert list(sliding_window.issues) == [12, 13, 14]
+    assert sorted(issue_dates) == [12, 13, 14]
+
+    # Statistics are only rewritten when a count changes, so dates are checked on the window itself.
+    with open(output_path) as output_file:
+        assert json.load(output_file)["num_reports"] == 3
+    statistics = window_statistics(sliding_window, issue_dates)
+    assert statistics["num_reports"] == 3
+    assert statistics["first_report_date"] == "2024-01-12T00:00:00Z"
+    assert statistics["last_report_date"] == "2024-01-14T00:00:00Z"
+    assert statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"] == 3
+
+    # Replaying the journal restores the same window.
+    loaded_window, loaded_dates = load_window(leaves, state_path)
+    assert list(loaded_window.issues) == [12, 13, 14]
+    assert loaded_dates == issue_dates
+
+
+def issue_node(number: int, gpu: str, updated_at: str) -> Dict[str, Any]:
+    # Returns an issue as returned by the GraphQL API.
+    return {
+        "id": f"I_{number}",
+        "number": number,
+        "body": f"### System information\n\nWindows 11 - {gpu}\n\n### Issue description\n\nBroken.",
+        "createdAt": f"2024-01-{number:02d}T00:00:00Z",
+        "updatedAt": updated_at,
+        "author": {"login": f"user{number}"},
+    }
+
+
+@pytest.mark.parametrize(
+    "signature,status",
+    [
+        (None, 401),
+        (b"sha256=" + b"0" * 64, 401),
+        (b"sha1=0123456789abcdef", 400),
+        # Non-ASCII values are rejected instead of raising `TypeError` in `hmac.compare_digest()`.
+        ("sha256=\u00e9".encode() + b"0" * 62, 400),
+        (None, 200),
+    ],
+)
+def test_webhook_signatures(tmp_path: Path, signature: Optional[bytes], status: int) -> None:
+    leaves: List[Any] = statistic_leaves(create_statistics())
+    state_path = os.path.join(tmp_path, "window.json")
+    sliding_window = SlidingWindow(leaves, 3)
+    save_window(sliding_window, {}, state_path)
+    detector = Detector(DETECTION_BLOCKS)
+    ingester = IssueEventIngester(
+        sliding_window, {}, detector, SystemInfoLineMatcher(detector), state_path, os.path.join(tmp_path, "out.json")
+    )
+    server = WebhookServer(("127.0.0.1", 0), ingester, "secret")
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        body = json.dumps(opened_event(1, "user1")).encode()
+        headers: Dict[str, Any] = {"X-GitHub-Event": "issues"}
+        if status == 200:
+            headers["X-Hub-Signature-256"] = webhook_signature("secret", body)
+        elif signature is not None:
+            headers["X-Hub-Signature-256"] = signature
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        connection.request("POST", "/webhook", body, headers)
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+        assert response.status == status
+        assert list(sliding_window.issues) == ([1] if status == 200 else [])
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+
+class StopWatching(Exception):
+    pass
+
+
+class FakeIssuesSession:
+    # Answers the queries sent by `watch_issues()` from a list of issues. Listing updated issues fails `failures` times.
+
+    def __init__(self, issues: List[Dict[str, Any]], failures: int) -> None:
+        self.issues = issues
+        self.failures = failures
+
+    async def __aenter__(self) -> "FakeIssuesSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def execute(self, request: Any) -> Dict[str, Any]:
+        page_size: int = request.variable_values.get("pageSize", 100)
+        cursor: Optional[str] = request.variable_values.get("cursor")
+        if request.document is ISSUES_QUERY.document:
+            end = int(cursor) if cursor is not None else len(self.issues)
+            start = max(0, end - page_size)
+            edges = [{"cursor": str(index), "node": self.issues[index]} for index in range(start, end)]
+            return {"repository": {"issues": {"edges": edges}}}
+        if request.document is UPDATED_ISSUES_QUERY.document:
+            if self.failures > 0:
+                self.failures -= 1
+                raise aiohttp.ClientConnectionError("Connection reset by peer")
+            updated = sorted(self.issues, key=lambda issue: issue["updatedAt"], reverse=True)
+            start = int(cursor) + 1 if cursor is not None else 0
+            edges = [
+                {"cursor": str(index), "node": updated[index]}
+                for index in range(start, min(start + page_size, len(updated)))
+            ]
+            return {"repository": {"issues": {"edges": edges}}}
+        return {"nodes": [issue for issue in self.issues if issue["id"] in request.variable_values["ids"]]}
+
+
+def test_watch_retries_failed_polls(tmp_path: Any, monkeypatch: Any) -> None:
+    leaves: List[Any] = statistic_leaves(create_statistics())
+    output_path = os.path.join(tmp_path, "statistics.json")
+    sliding_window = SlidingWindow(leaves, 3)
+    issue_dates: Dict[int, str] = {}
+    issue_versions: Dict[int, Tuple[str, str]] = {}
+    detector = Detector(DETECTION_BLOCKS)
+    system_info_line_matcher = SystemInfoLineMatcher(detector)
+    for number in (1, 2, 3):
+        issue = issue_node(number, "NVIDIA GeForce GTX 1060", "2024-01-05T00:00:00Z")
+        add_issue_to_window(issue, sliding_window, issue_dates, detector, system_info_line_matcher)
+        issue_versions[number] = (issue["id"], issue["updatedAt"])
+
+    # Issue 2 was edited and issue 4 was reported, but the first poll fails after new issues were fetched.
+    session = FakeIssuesSession(
+        [
+            issue_node(1, "NVIDIA GeForce GTX 1060", "2024-01-05T00:00:00Z"),
+            issue_node(2, "NVIDIA GeForce RTX 4070", "2024-01-06T00:00:00Z"),
+            issue_node(3, "NVIDIA GeForce GTX 1060", "2024-01-05T00:00:00Z"),
+            issue_node(4, "NVIDIA GeForce GTX 1060", "2024-01-06T00:00:00Z"),
+        ],
+        failures=1,
+    )
+    delays: List[float] = []
+
+    async def sleep(delay: float) -> None:
+        if len(delays) == 3:
+            raise StopWatching
+        delays.append(delay)
+
+    monkeypatch.setattr(build, "create_transport", lambda token: None)
+    monkeypatch.setattr(build, "Client", lambda **kwargs: session)
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    with pytest.raises(StopWatching):
+        asyncio.run(
+            watch_issues(
+                None,
+                60,
+                sliding_window,
+                issue_dates,
+                issue_versions,
+                3,
+                detector,
+                system_info_line_matcher,
+                output_path,
+            )
+        )
+
+    # The failed poll is retried later, then both issues are added once.
+    assert delays == [60, 120, 60]
+    assert list(sliding_window.issues) == [2, 3, 4]
+    assert sliding_window.num_reports == 3
+    assert issue_versions == {
+        2: ("I_2", "2024-01-06T00:00:00Z"),
+        3: ("I_3", "2024-01-05T00:00:00Z"),
+        4: ("I_4", "2024-01-06T00:00:00Z"),
+    }
+    with open(output_path) as output_file:
+        statistics = json.load(output_file)
+    assert statistics["num_reports"] == 3
+    assert statistics["gpu"]["nvidia"]["dedicated_ada_lovelace"] == 1
+    assert statistics["gpu"]["nvidia"]["dedicated_pascal"] == 2
+
+
+def entry_key(pattern: str) -> Tuple[int, int]:
+    # Returns the (table index, entry index) of the detection table entry whose first pattern is `pattern`.
+    return next(
+        (index, entry_index)
+        for index, block in enumerate(DETECTION_BLOCKS)
+        for entry_index, entry in enumerate(block.entries)
+        if entry.patterns[0] == pattern
+    )
+
+
+def test_passmark_variants_are_not_joined_to_base_models() -> None:
+    joined = join_passmark_scores(
+        DETECTION_BLOCKS,
+        [
+            # Neither the "5600X" nor the "12700K" is in the table, only variants of them.
+            ("passmark_multi_thread", "AMD Ryzen 5 5600X3D", 26_000),
+            ("passmark_multi_thread", "Intel Core i7-12700KF", 34_800),
+            ("passmark_multi_thread", "Intel(R) Core(TM) i7-13700HX @ 2.10GHz", 33_000),
+            ("passmark_score", "GeForce RTX 4090 Laptop GPU", 27_000),
+        ],
+    )
+    assert joined == {
+        entry_key("i713700hx") + ("passmark_multi_thread",): 33_000,
+        entry_key("4090laptop") + ("passmark_score",): 27_000,
+    }
+
+
+@pytest.fixture(scope="module")
+def detector() -> Detector:
+    return Detector(DETECTION_BLOCKS)
+
+
+@pytest.mark.parametrize(
+    "system_information,expected",
+    [
+        # Typos of model numbers are only resolved with the exact family, in a table found by a gate keyword.
+        ("NVIDIA GeForce GTX 1605", [("gpu", "nvidia", "dedicated_turing")]),
+        ("AMD Ryzen 5 3550H", [("cpu", "amd", "unknown")]),
+        ("AMD Ryzen 3 3250U", [("cpu", "amd", "unknown")]),
+        ("AMD Ryzen 5 3450U", [("cpu", "amd", "unknown")]),
+        ("AMD Ryzen 7 7735HS", [("cpu", "amd", "unknown")]),
+        ("AMD Ryzen 5 5560U", [("cpu", "amd", "unknown")]),
+        # Real models missing from the tables aren't typos of a neighbouring model number.
+        ("Intel Core i7-11800H", [("cpu", "intel", "unknown")]),
+        ("Intel Core i7-1270P", [("cpu", "intel", "unknown")]),
+        ("NVIDIA GeForce GT 730", [("gpu", "nvidia", "unknown")]),
+        ("NVIDIA GeForce GTX 470", [("gpu", "nvidia", "unknown")]),
+        # Laptop CPUs with a suffix that starts with the suffix of another one.
+        ("Intel Core i7-13700HX", [("cpu", "intel", "raptor_lake"), ("cpu_core_count", "16_cores")]),
+        ("Intel Core i7-12700HX", [("cpu", "intel", "alder_lake"), ("cpu_core_count", "16_cores")]),
+        ("Intel Core i7-13700H", [("cpu", "intel", "raptor_lake"), ("cpu_core_count", "14_cores")]),
+    ],
+)
+def test_detection_examples(detector: Detector, system_information: str, expected: List[StatisticPath]) -> None:
+    # Only the entries of the os, cpu and gpu tables are compared exactly, other statistics must be incremented.
+    detected = detector.detect(system_information)
+    assert [path for path in detected if path[0] in ("os", "cpu", "gpu")] == [
+        path for path in expected if path[0] in ("os", "cpu", "gpu")
+    ]
+    assert set(expected) <= set(detected)
+
+
+def block_index(prefix: StatisticPath) -> int:
+    return next(index for index, block in enumerate(DETECTION_BLOCKS) if block.prefix == prefix)
+
+
+def test_scan_keywords_selects_possible_tables(detector: Detector) -> None:
+    system_information = "Windows 10 - AMD Ryzen 7 5800X3D - Radeon RX 6700 XT"
+    active, found = detector.scan_keywords(
+        trim_system_information(system_information), system_information_words(system_information)
+    )
+    assert active == {block_index(("os", "windows")), block_index(("cpu", "amd")), block_index(("gpu", "amd"))}
+    assert {"windows", "ryzen", "rx", "radeon", "amd"} <= found
+
+
+def test_tables_without_keywords_are_skipped() -> None:
+    detector = Detector(DETECTION_BLOCKS)
+    assert detector.detect("macOS 14 - Apple M2") == [("os", "macos", "macos_14")]
+    assert detector.evaluated_count == [int(block.prefix == ("os", "macos")) for block in DETECTION_BLOCKS]
+    assert sum(detector.skipped_count) == len(DETECTION_BLOCKS) - 1
+
+
+def test_tokens_resolve_to_patterns_by_suffix(detector: Detector) -> None:
+    # The family is the end of the token's letters, and the suffix is whatever follows the model number.
+    candidates = detector.resolve_token("geforcertx", "4070")
+    assert {(suffix, detector.rules[index][rank][0]) for suffix, index, rank in candidates} == {
+        ("", "tx4070"),
+        ("ti", "tx4070ti"),
+        ("laptop", "4070laptop"),
+        ("mobile", "4070mobile"),
+    }
+    assert detector.resolve_token("geforcertx", "4070") is candidates
+
+
+@pytest.mark.parametrize(
+    "system_information,expected",
+    [
+        ("Intel Core i7-12700K", ("cpu_passmark_score", "single_thread", "4,000-4,500")),
+        ("Intel Core i7-12700", ("cpu_passmark_score", "single_thread", "3,500-4,000")),
+        ("AMD Radeon RX 6700 XT", ("gpu_vram", "12_gb")),
+        ("AMD Radeon RX 6700", ("gpu_vram", "10_gb")),
+        ("Intel HD Graphics 4600", ("gpu", "intel", "integrated_gen7.5")),
+    ],
+)
+def test_model_number_suffixes(detector: Detector, system_information: str, expected: StatisticPath) -> None:
+    assert expected in detector.detect(system_information)
+
+
+def test_digit_deletions() -> None:
+    assert digit_deletions("1650") == {"1650", "650", "150", "160", "165"}
+
+
+@pytest.mark.parametrize(
+    "digits,model_number,expected",
+    [
+        ("1605", "1650", True),
+        ("16550", "1650", True),
+        ("1650", "1650", False),
+        ("1660", "1650", False),
+        ("5610", "1650", False),
+        ("165", "1650", False),
+        ("16505", "1650", False),
+    ],
+)
+def test_is_model_number_typo(digits: str, model_number: str, expected: bool) -> None:
+    assert is_model_number_typo(digits, model_number) == expected
+
+
+def test_misspelled_model_numbers(detector: Detector) -> None:
+    assert ("gpu", "nvidia", "dedicated_turing") in detector.detect("Windows 11 - GeForce GTX 16550")
+    # "1066" could be a typo of either the GTX 1060 or the GTX 1660.
+    assert ("gpu", "nvidia", "unknown") in detector.detect("NVIDIA GeForce GTX 1066")
+    # Model numbers of 3 digits or less (such as the GTX 750) are too short to tell typos from other models.
+    assert ("gpu", "nvidia", "unknown") in detector.detect("NVIDIA GeForce GTX 7550")
+    assert detector.misspelled_tokens >= {("geforcegtx", "16550")}
+
+
+def test_separators_in_model_numbers_are_ignored(detector: Detector) -> None:
+    assert detector.detect("Intel HD Graphics 5,000")[0] == ("gpu", "intel", "integrated_gen7.5")
+    assert detector.detect("Intel(R) Core(TM) i7-12700K")[0] == ("cpu", "intel", "alder_lake")
+
+
+@pytest.mark.parametrize("num_users", [0, 1, 1_000, 20_000])
+def test_hyperloglog_estimates_within_error(num_users: int) -> None:
+    sketch = HyperLogLog(12)
+    for user in range(num_users):
+        # Users with several reports are only counted once.
+        sketch.add(stable_hash(f"user{user}"))
+        sketch.add(stable_hash(f"user{user}"))
+    estimate, error = sketch.estimate()
+    assert abs(estimate - num_users) <= error
+    assert error <= max(1, 0.04 * num_users)
+
+
+def test_hyperloglog_merge_is_union() -> None:
+    first, second, union = HyperLogLog(10), HyperLogLog(10), HyperLogLog(10)
+    for user in range(3_000):
+        item_hash = stable_hash(f"user{user}")
+        (first if user < 2_000 else second).add(item_hash)
+        if 1_000 <= user < 2_000:
+            # Users counted in both sketches.
+            second.add(item_hash)
+        union.add(item_hash)
+    first.merge(second)
+    assert first.registers == union.registers
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLog(11))
+
+
+def test_sketch_estimates_replace_statistics() -> None:
+    statistics = create_statistics()
+    sketch = HyperLogLog(12)
+    for user in range(50):
+        sketch.add(stable_hash(f"user{user}"))
+    add_sketch_estimates(statistics, {("os", "windows", "windows_11"): sketch})
+    estimate, error = sketch.estimate()
+    assert statistics["os"]["windows"]["windows_11"] == estimate
+    assert statistics["count_errors"]["os"]["windows"]["windows_11"] == error
+    assert statistics["os"]["linux"]["arch"] == 0
+    assert statistics["count_errors"]["os"]["linux"]["arch"] == 0
+
+
+def test_merge_user_partials(tmp_path: Any) -> None:
+    leaves = statistic_leaves(create_statistics())
+    windows_11: StatisticPath = ("os", "windows", "windows_11")
+    linux: StatisticPath = ("os", "linux", "arch")
+    paths = [os.path.join(tmp_path, "2024-h1.json"), os.path.join(tmp_path, "2024-h2.json")]
+    # `alice` reported issues in both date ranges, and must only be counted once.
+    write_partial(
+        create_user_partial([("2024-01-01", "alice", [windows_11]), ("2024-02-01", "bob", [windows_11, linux])]),
+        "2024-01-01",
+        "2024-02-01",
+        paths[0],
+    )
+    write_partial(create_user_partial([("2024-08-01", "alice", [windows_11])]), "2024-08-01", "2024-08-01", paths[1])
+    with open(paths[0]) as partial_file:
+        contents = partial_file.read()
+    assert "alice" not in contents and "bob" not in contents
+
+    statistics = merge_partials(leaves, paths)
+    assert len(statistics["os"]["windows"]["windows_11"]) == 2
+    assert len(statistics["os"]["linux"]["arch"]) == 1
+    assert statistics["num_reports"] == 3
+    assert statistics["first_report_date"] == "2024-01-01"
+    assert statistics["last_report_date"] == "2024-08-01"
+
+
+def test_merge_sketch_partials(tmp_path: Any) -> None:
+    leaves = statistic_leaves(create_statistics())
+    windows_11: StatisticPath = ("os", "windows", "windows_11")
+    paths = [os.path.join(tmp_path, f"{half}.json") for half in ("2024-h1", "2024-h2", "other")]
+    first, second, union = HyperLogLog(10), HyperLogLog(10), HyperLogLog(10)
+    for user in range(300):
+        item_hash = stable_hash(f"user{user}")
+        (first if user < 200 else second).add(item_hash)
+        if user >= 100:
+            second.add(item_hash)
+        union.add(item_hash)
+    write_partial(create_sketch_partial({windows_11: first}, 10, 200), "2024-01-01", "2024-06-30", paths[0])
+    write_partial(create_sketch_partial({windows_11: second}, 10, 200), "2024-07-01", "2024-12-31", paths[1])
+    statistics = merge_partials(leaves, paths[:2])
+    assert statistics["os"]["windows"]["windows_11"] == union.estimate()[0]
+    assert statistics["num_reports"] == 400
+
+    # Sketches of different precisions (or sets of users) can't be merged with these sketches.
+    write_partial(create_sketch_partial({windows_11: HyperLogLog(11)}, 11, 0), None, None, paths[2])
+    with pytest.raises(ValueError):
+        merge_partials(leaves, [paths[0], paths[2]])
+    write_partial(create_user_partial([]), None, None, paths[2])
+    with pytest.raises(ValueError):
+        merge_partials(leaves, [paths[0], paths[2]])
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="requires NumPy")
+def test_bootstrap_share_intervals(detector: Detector) -> None:
+    feature_matrix = FeatureMatrix(detector, statistic_leaves(create_statistics()))
+    for user in range(100):
+        feature_matrix.add(f"user{user}", detector.match("Windows 11" if user < 30 else "Windows 10"))
+    share_intervals = feature_matrix.bootstrap_shares(500, 0)
+    low, high = share_intervals["os/windows/windows_11"]
+    assert 20 < low < 30 < high < 40
+    # Percentages of groups are of the sum of their siblings.
+    assert share_intervals["os/windows"] == (100.0, 100.0)
+    assert share_intervals["os/linux"] == (0.0, 0.0)
+    # The same seed always gives the same intervals.
+    assert feature_matrix.bootstrap_shares(500, 0) == share_intervals
+
+
+def test_read_passmark_scores_from_csv(tmp_path: Any) -> None:
+    path = os.path.join(tmp_path, "cpu_mega_list.csv")
+    with open(path, "w") as file:
+        file.write(
+            "CPU Name,Price,CPU Mark,Thread Mark\n"
+            '"AMD Ryzen 5 5600X","$150","21,912","3,356"\n'
+            '"Intel Core i7-12700K @ 3.60GHz",NA,"34,512",NA\n'
+        )
+    assert read_passmark_scores(path) == [
+        ("passmark_multi_thread", "AMD Ryzen 5 5600X", 21_912),
+        ("passmark_single_thread", "AMD Ryzen 5 5600X", 3_356),
+        ("passmark_multi_thread", "Intel Core i7-12700K @ 3.60GHz", 34_512),
+    ]
+
+
+def test_read_passmark_scores_from_html(tmp_path: Any) -> None:
+    path = os.path.join(tmp_path, "gpu_list.html")
+    with open(path, "w") as file:
+        file.write(
+            "<html><body><table>"
+            "<tr><th>Videocard Name</th><th>Passmark G3D Mark (higher is better)</th></tr>"
+            "<tr><td><a href='#'>GeForce RTX 4070</a></td><td>26,862</td></tr>"
+            "<tr><th>Videocard Name</th><th>Passmark G3D Mark (higher is better)</th></tr>"
+            "<tr><td>Radeon RX 6700 XT</td><td> 19,412 </td></tr>"
+            "</table></body></html>"
+        )
+    assert read_passmark_scores(path) == [
+        ("passmark_score", "GeForce RTX 4070", 26_862),
+        ("passmark_score", "Radeon RX 6700 XT", 19_412),
+    ]
+
+
+def test_rewrite_passmark_scores() -> None:
+    with open(build.__file__, "rb") as script_file:
+        source = script_file.read()
+    table_names = [
+        next(name for name, value in vars(build).items() if value is block.entries) for block in DETECTION_BLOCKS
+    ]
+    rewritten = rewrite_passmark_scores(
+        source,
+        DETECTION_BLOCKS,
+        table_names,
+        {
+            entry_key("ryzen55600x") + ("passmark_multi_thread",): 21_912,
+            entry_key("tx4070") + ("passmark_score",): 26_862,
+        },
+    )
+    changed = [
+        (line, rewritten_line)
+        for line, rewritten_line in zip(source.splitlines(), rewritten.splitlines())
+        if line != rewritten_line
+    ]
+    assert [rewritten_line.split(b", ")[-2:] for _, rewritten_line in changed] == [
+        [b"21_912", b"3_250),"],
+        [b"True", b"26_862),"],
+    ]
+
+
+def test_batch_searches() -> None:
+    # Searches are grouped in order, within the node and rate limit point budgets.
+    assert batch_searches([100, 100, 50, 100, 1], 250, 1) == [[0, 1, 2], [3, 4]]
+    assert batch_searches([1] * 250, 1_000, 1) == [list(range(100)), list(range(100, 200)), list(range(200, 250))]
+    assert batch_searches([1] * 250, 1_000, 2) == [list(range(200)), list(range(200, 250))]
+    assert batch_searches([], 1_000, 1) == []
+
+
+def test_creation_range_split() -> None:
+    start = datetime(2024, 1, 10, tzinfo=timezone.utc)
+    creation_range = CreationRange(start, start + timedelta(days=1) - timedelta(seconds=1))
+    assert creation_range.search_query().endswith("created:2024-01-10T00:00:00Z..2024-01-10T23:59:59Z")
+    first, second = creation_range.split()
+    assert first == CreationRange(start, start + timedelta(hours=12) - timedelta(seconds=1))
+    assert second == CreationRange(start + timedelta(hours=12), creation_range.end)
+    # Ranges are split down to a single second.
+    assert CreationRange(start, start + timedelta(seconds=1)).can_split()
+    assert not CreationRange(start, start).can_split()
+
+
+class FakeSearchSession:
+    # Answers aliased `search` queries sent by `search_issue_pages()` from a list of issues.
+
+    def __init__(self, issues: List[Dict[str, Any]]) -> None:
+        self.issues = issues
+
+    async def __aenter__(self) -> "FakeSearchSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def execute(self, request: Any) -> Dict[str, Any]:
+        results = {}
+        for selection in request.document.definitions[0].selection_set.selections:
+            arguments = {argument.name.value: argument.value.value for argument in selection.arguments}
+            created = arguments["query"].split("created:")[1].split("..")
+            found = [issue for issue in self.issues if created[0] <= issue["createdAt"] <= created[1]]
+            start = int(arguments.get("after", 0))
+            end = start + int(arguments["first"])
+            results[selection.alias.value] = {
+                "issueCount": len(found),
+                "edges": [{"node": issue} for issue in found[start:end]],
+                "pageInfo": {"endCursor": str(end), "hasNextPage": end < len(found)},
+            }
+        return results
+
+
+def test_search_issues_created_within_the_same_second(monkeypatch: Any) -> None:
+    # A script created 250 issues within the same second, which can only be fetched by following cursors.
+    issues = [issue_node(10, "NVIDIA GeForce GTX 1060", "2024-01-10T12:00:00Z") for _ in range(250)]
+    issues += [issue_node(day, "NVIDIA GeForce GTX 1060", f"2024-01-{day:02d}T00:00:00Z") for day in (5, 20)]
+    for number, issue in enumerate(issues):
+        issue["number"] = number
+    monkeypatch.setattr(build, "create_transport", lambda token: None)
+    monkeypatch.setattr(build, "Client", lambda **kwargs: FakeSearchSession(issues))
+    pages = asyncio.run(
+        search_issue_pages(
+            None,
+            None,
+            1_000,
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 2, 1, tzinfo=timezone.utc),
+        )
+    )
+    numbers = [edge["node"]["number"] for page in pages for edge in page["repository"]["issues"]["edges"]]
+    assert sorted(numbers) == list(range(252))
+
+
+@pytest.mark.parametrize(
+    "system_information,expected",
+    [
+        ("Arch Linux", [("os", "linux", "arch")]),
+        ("ArchLinux", [("os", "linux", "arch")]),
+        ("Linux (searching for a fix)", [("os", "linux", "unknown")]),
+        ("Linux - research build", [("os", "linux", "unknown")]),
+        ("Opera GX", [("os", "web", "opera")]),
+        ("OperaGX", [("os", "web", "opera")]),
+        ("Windows 10 (operating system)", [("os", "windows", "windows_10")]),
+        ("Microsoft Edge", [("os", "web", "edge")]),
+        ("iOS 17", [("os", "ios", "ios_17")]),
+        ("iPhone 15 - iOS17", [("os", "ios", "ios_17")]),
+        ("Intel Core i5-4670K - iOS 13", [("os", "ios", "ios_13"), ("cpu", "intel", "haswell")]),
+        # Words ending with a whole-word pattern don't match it, even when followed by a model number.
+        ("Windows 11 - BIOS 15", [("os", "windows", "windows_11")]),
+        ("BIOS 12 - iOS 17", [("os", "ios", "ios_17")]),
+        ("AMD FX-8350", [("cpu", "amd", "unknown")]),
+        ("AMD Radeon gfx1030", [("gpu", "amd", "unknown")]),
+    ],
+)
+def test_whole_word_patterns(detector: Detector, system_information: str, expected: List[StatisticPath]) -> None:
+    detected = detector.detect(system_information)
+    assert [path for path in detected if path[0] in ("os", "cpu", "gpu")] == expected